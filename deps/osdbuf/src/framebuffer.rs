@@ -729,25 +729,51 @@ impl FrameBuffer {
 
     // FOR TESTING ONLY
     pub fn draw_checkerboard(&mut self, size: i32) {
-        let w = self.w as usize;
-        let h = self.h as usize;
-        let size = size as usize;
+        self.draw_checkerboard_rect(size, 0, 0, self.w, self.h);
+    }
+
+    /// Checkerboard restricted to the (x, y, w, h) pixel rect, clamped to the
+    /// buffer. Tiles stay aligned to the buffer origin, so a partial redraw
+    /// matches the full one.
+    pub fn draw_checkerboard_rect(&mut self, size: i32, x: i32, y: i32, w: i32, h: i32) {
+        let fw = self.w as usize;
+        let fh = self.h as usize;
+        let size = size.max(1) as usize;
 
         // Make sure the length is a multiple of 4
-        assert_eq!(self.pixels.len(), w * h * 4);
+        assert_eq!(self.pixels.len(), fw * fh * 4);
+
+        let x0 = x.clamp(0, self.w) as usize;
+        let y0 = y.clamp(0, self.h) as usize;
+        let x1 = x.saturating_add(w).clamp(0, self.w) as usize;
+        let y1 = y.saturating_add(h).clamp(0, self.h) as usize;
 
         // reinterpret as u32 slice
-        let pixels: &mut [u32] =
-            unsafe { std::slice::from_raw_parts_mut(self.pixels.as_mut_ptr() as *mut u32, w * h) };
+        let pixels: &mut [u32] = unsafe {
+            std::slice::from_raw_parts_mut(self.pixels.as_mut_ptr() as *mut u32, fw * fh)
+        };
 
         let light: u32 = 0xFFCCCCCC; // RGBA little endian
         let dark: u32 = 0xFF999999;
 
-        for y in 0..h {
-            for x in 0..w {
-                let tile = ((y / size) + (x / size)) & 1;
-                pixels[y * w + x] = if tile == 0 { light } else { dark };
-            }
+        if x0 >= x1 || y0 >= y1 {
+            return;
+        }
+
+        // Every row of a tile band is identical, so build the two band rows
+        // once and copy them down instead of choosing a colour per pixel.
+        let span = x1 - x0;
+        let mut bands = vec![0u32; span * 2];
+        for (i, x) in (x0..x1).enumerate() {
+            let even = (x / size) & 1 == 0;
+            bands[i] = if even { light } else { dark };
+            bands[span + i] = if even { dark } else { light };
+        }
+
+        for y in y0..y1 {
+            let band = ((y / size) & 1) * span;
+            let row = y * fw;
+            pixels[row + x0..row + x1].copy_from_slice(&bands[band..band + span]);
         }
     }
 }
@@ -774,6 +800,34 @@ pub(crate) unsafe fn create_framebuffer(data: *mut c_uchar, width: c_int, height
     id
 }
 
+/// Rebind an existing framebuffer to a new external pixel store and size.
+/// The handle and antialias setting survive; clip and gstate are reset.
+/// Returns 0 on success, -1 if the handle is unknown.
+pub(crate) unsafe fn resize_framebuffer(
+    handle: i32,
+    data: *mut c_uchar,
+    width: c_int,
+    height: c_int,
+) -> i32 {
+    let size = (width * height * 4) as usize;
+    let pixels = slice::from_raw_parts_mut(data, size);
+    let found = with_fb(handle, |fb| {
+        fb.pixels = pixels;
+        fb._owned_pixels = None;
+        fb.w = width;
+        fb.h = height;
+        fb.ctm = Transform::identity();
+        fb.clip_mask = None;
+        fb.gstate_stack.clear();
+        true
+    });
+    if found {
+        0
+    } else {
+        -1
+    }
+}
+
 pub(crate) fn destroy_framebuffer(handle: i32) {
     FB_MAP.write().remove(&handle);
 }
@@ -54,11 +54,46 @@ pub unsafe extern "C" fn CreateFrameBuffer(
     framebuffer::create_framebuffer(data, width, height)
 }
 
+/// Point a framebuffer at a new pixel store of `width` x `height`,
+/// keeping its handle. Returns 0 on success, -1 for an unknown handle.
+#[no_mangle]
+pub unsafe extern "C" fn ResizeFrameBuffer(
+    handle: c_int,
+    data: *mut c_uchar,
+    width: c_int,
+    height: c_int,
+) -> c_int {
+    framebuffer::resize_framebuffer(handle, data, width, height)
+}
+
 #[no_mangle]
 pub extern "C" fn DestroyFrameBuffer(handle: c_int) {
     framebuffer::destroy_framebuffer(handle)
 }
 
+/// Expose the raw premultiplied RGBA pixel store of a framebuffer.
+/// The pointer stays valid until the framebuffer is destroyed.
+#[no_mangle]
+pub unsafe extern "C" fn GetPixelBuffer(
+    handle: c_int,
+    out_ptr: *mut *mut u8,
+    out_stride: *mut c_int,
+) -> c_int {
+    if out_ptr.is_null() || out_stride.is_null() {
+        return -1;
+    }
+    let found = with_fb(handle, |fb| {
+        *out_ptr = fb.pixels.as_mut_ptr();
+        *out_stride = fb.w * 4;
+        true
+    });
+    if found {
+        0
+    } else {
+        -1
+    }
+}
+
 // --- Drawing exports ---
 
 #[no_mangle]
@@ -78,6 +113,24 @@ pub extern "C" fn SetPixel(handle: i32, x: i32, y: i32, color: u32) {
     with_fb(handle, |fb| fb.set_pixel(x, y, r, g, b, a));
 }
 
+/// Set `count` pixels in one call.
+/// `xy` holds `count * 2` ints (x, y); `colors` holds `count` colors.
+#[no_mangle]
+pub unsafe extern "C" fn SetPixelsRGBA(handle: i32, xy: *const i32, colors: *const u32, count: i32) {
+    if xy.is_null() || colors.is_null() || count <= 0 {
+        return;
+    }
+    let n = count as usize;
+    let xy = std::slice::from_raw_parts(xy, n * 2);
+    let colors = std::slice::from_raw_parts(colors, n);
+    with_fb(handle, |fb| {
+        for (p, &color) in xy.chunks_exact(2).zip(colors) {
+            let (r, g, b, a) = hex_to_rgba(color);
+            fb.set_pixel(p[0], p[1], r, g, b, a);
+        }
+    });
+}
+
 #[no_mangle]
 pub extern "C" fn GetPixel(handle: i32, x: i32, y: i32) -> u32 {
     with_fb(handle, |fb| fb.get_pixel_raw(x, y))
@@ -90,6 +143,43 @@ pub extern "C" fn Line(handle: i32, x0: i32, y0: i32, x1: i32, y1: i32, color: u
     with_fb(handle, |fb| fb.draw_line(x0, y0, x1, y1, r, g, b, a, bm));
 }
 
+/// One packed record of the Lines batch (12 bytes, native byte order).
+#[repr(C)]
+#[derive(Clone, Copy)]
+pub struct LineRecord {
+    pub x0: i16,
+    pub y0: i16,
+    pub x1: i16,
+    pub y1: i16,
+    pub color: u32,
+}
+
+/// Draw `count` 1px lines from packed LineRecords in one call.
+#[no_mangle]
+pub unsafe extern "C" fn Lines(handle: i32, records: *const LineRecord, count: i32, blend: u8) {
+    if records.is_null() || count <= 0 {
+        return;
+    }
+    let bm = map_blend_mode(blend);
+    with_fb(handle, |fb| {
+        for i in 0..count as usize {
+            let rec = std::ptr::read_unaligned(records.add(i));
+            let (r, g, b, a) = hex_to_rgba(rec.color);
+            fb.draw_line(
+                rec.x0 as i32,
+                rec.y0 as i32,
+                rec.x1 as i32,
+                rec.y1 as i32,
+                r,
+                g,
+                b,
+                a,
+                bm,
+            );
+        }
+    });
+}
+
 #[no_mangle]
 pub extern "C" fn LineStroke(
     handle: i32,
@@ -203,6 +293,31 @@ pub extern "C" fn FillRect(handle: i32, x: f32, y: f32, w: f32, h: f32, color: u
     with_fb(handle, |fb| fb.fill_rect(x, y, w, h, r, g, b, a, bm));
 }
 
+/// Fill `count` rects in one call.
+/// `rects` holds `count * 4` floats (x, y, w, h); `colors` holds `count` colors.
+#[no_mangle]
+pub unsafe extern "C" fn FillRects(
+    handle: i32,
+    rects: *const f32,
+    colors: *const u32,
+    count: i32,
+    blend: u8,
+) {
+    if rects.is_null() || colors.is_null() || count <= 0 {
+        return;
+    }
+    let n = count as usize;
+    let rects = std::slice::from_raw_parts(rects, n * 4);
+    let colors = std::slice::from_raw_parts(colors, n);
+    let bm = map_blend_mode(blend);
+    with_fb(handle, |fb| {
+        for (rect, &color) in rects.chunks_exact(4).zip(colors) {
+            let (r, g, b, a) = hex_to_rgba(color);
+            fb.fill_rect(rect[0], rect[1], rect[2], rect[3], r, g, b, a, bm);
+        }
+    });
+}
+
 #[no_mangle]
 pub extern "C" fn RoundedRect(
     handle: i32,
@@ -387,6 +502,18 @@ pub unsafe extern "C" fn DrawText(
     )
 }
 
+/// Draw a batch of strings; see `text::TextCmd` for the record layout.
+#[no_mangle]
+pub unsafe extern "C" fn DrawTextBatch(
+    handle: i32,
+    cmds: *const text::TextCmd,
+    count: i32,
+    strs: *const u8,
+    strs_len: u32,
+) -> i32 {
+    text::draw_text_batch_c(handle, cmds, count, strs, strs_len)
+}
+
 #[no_mangle]
 pub unsafe extern "C" fn MeasureText(
     font_handle: i32,
@@ -585,6 +712,11 @@ pub extern "C" fn PathAppend(dst: i32, src: i32) {
     path::path_append(dst, src)
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn PathAppendCommands(handle: i32, data: *const u8, len: i32) -> i32 {
+    path::path_append_commands(handle, data, len)
+}
+
 #[no_mangle]
 pub unsafe extern "C" fn PathRect(x: f32, y: f32, w: f32, h: f32) -> i32 {
     path::path_rect(x, y, w, h)
@@ -666,6 +798,18 @@ pub extern "C" fn DrawCheckerBoard(fb_handle: i32, size: i32) {
     with_fb(fb_handle, |fb| fb.draw_checkerboard(size));
 }
 
+#[no_mangle]
+pub extern "C" fn DrawCheckerBoardRect(
+    fb_handle: i32,
+    size: i32,
+    x: i32,
+    y: i32,
+    w: i32,
+    h: i32,
+) {
+    with_fb(fb_handle, |fb| fb.draw_checkerboard_rect(size, x, y, w, h));
+}
+
 #[no_mangle]
 pub unsafe extern "C" fn DrawStringCoreGraphics(
     fb_handle: i32,
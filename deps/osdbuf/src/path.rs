@@ -129,6 +129,93 @@ pub(crate) fn path_append(dst: i32, src: i32) {
     with_path(dst, |p| p.cmds.extend(src_cmds));
 }
 
+// Opcodes of the packed command stream accepted by PathAppendCommands.
+// Each record is one opcode byte followed by little-endian f32 operands.
+const OP_MOVE_TO: u8 = 0; // x, y
+const OP_LINE_TO: u8 = 1; // x, y
+const OP_CUBIC_TO: u8 = 2; // cp1x, cp1y, cp2x, cp2y, x, y
+const OP_QUAD_TO: u8 = 3; // cpx, cpy, x, y
+const OP_ARC: u8 = 4; // cx, cy, r, start, end, then one clockwise byte
+const OP_CLOSE: u8 = 5; // no operands
+
+fn read_f32s<const N: usize>(bytes: &mut &[u8]) -> Option<[f32; N]> {
+    let b = *bytes;
+    if b.len() < N * 4 {
+        return None;
+    }
+    let mut out = [0.0f32; N];
+    for (v, chunk) in out.iter_mut().zip(b[..N * 4].chunks_exact(4)) {
+        *v = f32::from_le_bytes([chunk[0], chunk[1], chunk[2], chunk[3]]);
+    }
+    *bytes = &b[N * 4..];
+    Some(out)
+}
+
+fn decode_path_cmds(mut bytes: &[u8]) -> Option<Vec<PathCmd>> {
+    let mut cmds = Vec::new();
+    while let Some((&op, rest)) = bytes.split_first() {
+        bytes = rest;
+        let cmd = match op {
+            OP_MOVE_TO => {
+                let [x, y] = read_f32s::<2>(&mut bytes)?;
+                PathCmd::MoveTo(x, y)
+            }
+            OP_LINE_TO => {
+                let [x, y] = read_f32s::<2>(&mut bytes)?;
+                PathCmd::LineTo(x, y)
+            }
+            OP_CUBIC_TO => {
+                let [cp1x, cp1y, cp2x, cp2y, x, y] = read_f32s::<6>(&mut bytes)?;
+                PathCmd::CubicTo(cp1x, cp1y, cp2x, cp2y, x, y)
+            }
+            OP_QUAD_TO => {
+                let [cpx, cpy, x, y] = read_f32s::<4>(&mut bytes)?;
+                PathCmd::QuadTo(cpx, cpy, x, y)
+            }
+            OP_ARC => {
+                let [cx, cy, r, start, end] = read_f32s::<5>(&mut bytes)?;
+                let (&cw, rest) = bytes.split_first()?;
+                bytes = rest;
+                PathCmd::Arc {
+                    cx,
+                    cy,
+                    r,
+                    start,
+                    end,
+                    clockwise: cw != 0,
+                }
+            }
+            OP_CLOSE => PathCmd::Close,
+            _ => return None,
+        };
+        cmds.push(cmd);
+    }
+    Some(cmds)
+}
+
+/// Decode a packed command stream and append it to a path.
+/// Returns the number of commands appended, or -1 on a bad handle or stream.
+pub(crate) unsafe fn path_append_commands(handle: i32, data: *const u8, len: i32) -> i32 {
+    if data.is_null() || len < 0 {
+        return -1;
+    }
+    let bytes = slice::from_raw_parts(data, len as usize);
+    let cmds = match decode_path_cmds(bytes) {
+        Some(cmds) => cmds,
+        None => return -1,
+    };
+    let n = cmds.len() as i32;
+    let found = with_path(handle, |p| {
+        p.cmds.extend(cmds);
+        true
+    });
+    if found {
+        n
+    } else {
+        -1
+    }
+}
+
 pub(crate) unsafe fn path_rect(x: f32, y: f32, w: f32, h: f32) -> i32 {
     let id = create_path();
     with_path(id, |p| {
@@ -1,4 +1,4 @@
-use crate::font::{get_default_font, with_font};
+use crate::font::{get_default_font, with_font, FONT_MAP};
 use crate::framebuffer::{with_fb, FrameBuffer};
 use crate::helpers::{hex_to_rgba, parse_c_str};
 use std::os::raw::c_char;
@@ -569,6 +569,80 @@ pub(crate) unsafe fn draw_text_c(
     })
 }
 
+/// One packed record of the DrawTextBatch call (32 bytes, native byte order).
+/// `str_off`/`str_len` index into the shared UTF-8 string buffer.
+#[repr(C)]
+#[derive(Clone, Copy)]
+pub struct TextCmd {
+    pub str_off: u32,
+    pub str_len: u32,
+    pub x: f32,
+    pub y: f32,
+    pub color: u32,
+    pub size: f32,
+    pub spacing: f32,
+    pub font_id: u16,
+    pub anchor: u16,
+}
+
+/// Draw `count` anchored strings under one font-map lock and one framebuffer
+/// lookup. Records with an out-of-range slice, invalid UTF-8 or an unknown
+/// font are skipped. Returns the number of strings drawn.
+pub(crate) unsafe fn draw_text_batch_c(
+    fb_handle: i32,
+    cmds: *const TextCmd,
+    count: i32,
+    strs: *const u8,
+    strs_len: u32,
+) -> i32 {
+    if cmds.is_null() || count <= 0 || (strs.is_null() && strs_len > 0) {
+        return 0;
+    }
+    let strs: &[u8] = if strs_len == 0 {
+        &[]
+    } else {
+        std::slice::from_raw_parts(strs, strs_len as usize)
+    };
+    // Resolve before taking the read lock below; get_default_font locks too.
+    let default_font = get_default_font();
+    let fonts = FONT_MAP.read();
+    with_fb(fb_handle, |fb| {
+        let mut drawn = 0;
+        for i in 0..count as usize {
+            let cmd = std::ptr::read_unaligned(cmds.add(i));
+            let start = cmd.str_off as usize;
+            let text = match strs
+                .get(start..start + cmd.str_len as usize)
+                .and_then(|b| std::str::from_utf8(b).ok())
+            {
+                Some(t) => t,
+                None => continue,
+            };
+            let font_handle = if cmd.font_id == 0 {
+                default_font
+            } else {
+                cmd.font_id as i32
+            };
+            let font = match fonts.get(&font_handle) {
+                Some(f) => f,
+                None => continue,
+            };
+            fb.draw_text_anchored(
+                font,
+                text,
+                cmd.size,
+                cmd.x,
+                cmd.y,
+                cmd.anchor as u32,
+                hex_to_rgba(cmd.color),
+                cmd.spacing,
+            );
+            drawn += 1;
+        }
+        drawn
+    })
+}
+
 pub(crate) unsafe fn measure_text_c(
     font_handle: i32,
     size: f32,
@@ -12,6 +12,7 @@ use std::num::NonZeroU32;
 use std::os::raw::c_char;
 use std::sync::{Arc, Mutex, OnceLock};
 use std::sync::mpsc;
+use std::time::{Duration, Instant};
 
 use softbuffer::{Context, Surface};
 use winit::{
@@ -23,9 +24,27 @@ use winit::{
 };
 
 // ── Callback types ─────────────────────────────────────────────────────────────
-// render_callback returns 0 = continue, != 0 = close window (view.close())
+// render_callback returns
+//   RENDER_DREW      = new pixels, present them
+//   RENDER_UNCHANGED = nothing redrawn, skip the copy + present
+//   anything else    = close window (view.close())
 type RenderCb = extern "C" fn() -> i32;
+const RENDER_DREW: i32 = 0;
+const RENDER_UNCHANGED: i32 = 2;
 type EventCb  = extern "C" fn(i32, f64, f64, i64);
+// resize_callback(physical_width, physical_height, scale_factor): fired once the
+// window exists and again on every Resized / ScaleFactorChanged, never per frame.
+type ResizeCb = extern "C" fn(u32, u32, f64);
+
+// ── Shared window geometry ────────────────────────────────────────────────────
+/// Allocated and owned by Python (ctypes `_FrameState`), written here and read
+/// by render_callback once per frame. width/height are physical pixels.
+#[repr(C)]
+pub struct FrameState {
+    pub width:        u32,
+    pub height:       u32,
+    pub scale_factor: f64,
+}
 
 // ── UserEvent: request to add a new window ────────────────────────────────────
 struct AddWindowReq {
@@ -33,11 +52,11 @@ struct AddWindowReq {
     height:           u32,
     title:            String,
     pixel_ptr:        *mut u32,
-    width_ptr:        *mut u32,
-    height_ptr:       *mut u32,
-    scale_factor_ptr: *mut f64,
+    state:            *mut FrameState,
     render_cb:        RenderCb,
     event_cb:         EventCb,
+    resize_cb:        ResizeCb,
+    frame_interval:   Duration,
     decorations:      bool,
     /// Python thread blocks on done_rx; we send () when the window closes
     done_tx:          mpsc::SyncSender<()>,
@@ -56,12 +75,13 @@ struct WinState {
     window:           Arc<Window>,
     surface:          Surface<Arc<Window>, Arc<Window>>,
     pixel_ptr:        *mut u32,
-    width_ptr:        *mut u32,
-    height_ptr:       *mut u32,
-    scale_factor_ptr: *mut f64,
+    state:            *mut FrameState,
     scale_factor:     f64,
     render_cb:        RenderCb,
     event_cb:         EventCb,
+    resize_cb:        ResizeCb,
+    frame_interval:   Duration,
+    next_frame:       Instant,     // when the paced render_cb is next due
     done_tx:          mpsc::SyncSender<()>,
     cursor_pos:       (f64, f64),  // logical coords (physical / scale_factor)
     modifiers:        Modifiers,   // current modifier state
@@ -201,6 +221,45 @@ fn close_window(windows: &mut HashMap<WindowId, WinState>, window_id: WindowId)
     }
 }
 
+/// Sleep until the earliest paced frame is due; input wakes the loop sooner.
+/// No windows → sleep until the next UserEvent.
+fn set_pacing(elwt: &EventLoopWindowTarget<AppEvent>, windows: &HashMap<WindowId, WinState>) {
+    elwt.set_control_flow(match windows.values().map(|st| st.next_frame).min() {
+        Some(due) => ControlFlow::WaitUntil(due),
+        None      => ControlFlow::Wait,
+    });
+}
+
+/// Call render_cb and present the pixel buffer if it drew (or if `force`,
+/// for OS-requested redraws where the surface needs the last frame again).
+/// Returns true if the window asked to close.
+fn render_window(st: &mut WinState, force: bool) -> bool {
+    let (w, h) = unsafe { ((*st.state).width, (*st.state).height) };
+    if w == 0 || h == 0 {
+        return false;
+    }
+    let signal = (st.render_cb)();
+    if signal != RENDER_DREW && signal != RENDER_UNCHANGED {
+        return true;
+    }
+    if signal == RENDER_DREW || force {
+        if let Ok(mut buf) = st.surface.buffer_mut() {
+            let n = (w * h) as usize;
+            // osdbuf: [R,G,B,A] LE (0xAABBGGRR)
+            // softbuffer: 0x00RRGGBB → swap R↔B
+            for i in 0..n {
+                let px = unsafe { *st.pixel_ptr.add(i) };
+                let r = (px >>  0) & 0xFF;
+                let g = (px >>  8) & 0xFF;
+                let b = (px >> 16) & 0xFF;
+                buf[i] = (r << 16) | (g << 8) | b;
+            }
+            buf.present().ok();
+        }
+    }
+    false
+}
+
 // ── Event loop thread body ─────────────────────────────────────────────────────
 fn event_loop_thread(proxy_tx: mpsc::SyncSender<Proxy>) {
     // Allow EventLoop on any thread (non-main-thread).
@@ -229,11 +288,7 @@ fn event_loop_thread(proxy_tx: mpsc::SyncSender<Proxy>) {
     let mut windows: HashMap<WindowId, WinState> = HashMap::new();
 
     let _ = event_loop.run(move |event, elwt: &EventLoopWindowTarget<AppEvent>| {
-        elwt.set_control_flow(if windows.is_empty() {
-            ControlFlow::Wait   // no windows → sleep until next UserEvent
-        } else {
-            ControlFlow::Poll
-        });
+        set_pacing(elwt, &windows);
 
         match event {
             // ── Screen size request from Python ───────────────────────────────
@@ -262,24 +317,26 @@ fn event_loop_thread(proxy_tx: mpsc::SyncSender<Proxy>) {
                 let pw = phys.width.max(1);
                 let ph = phys.height.max(1);
                 unsafe {
-                    *req.width_ptr        = pw;
-                    *req.height_ptr       = ph;
-                    *req.scale_factor_ptr = scale;
+                    *req.state = FrameState { width: pw, height: ph, scale_factor: scale };
                 }
                 let ctx = Context::new(Arc::clone(&window)).unwrap();
                 let mut surface = Surface::new(&ctx, Arc::clone(&window)).unwrap();
                 surface.resize(NonZeroU32::new(pw).unwrap(), NonZeroU32::new(ph).unwrap()).unwrap();
+                // The physical size may differ from the requested logical one
+                // (HiDPI); let Python size its framebuffer before the first frame.
+                (req.resize_cb)(pw, ph, scale);
 
                 windows.insert(window.id(), WinState {
                     window,
                     surface,
                     pixel_ptr:        req.pixel_ptr,
-                    width_ptr:        req.width_ptr,
-                    height_ptr:       req.height_ptr,
-                    scale_factor_ptr: req.scale_factor_ptr,
+                    state:            req.state,
                     scale_factor:     scale,
                     render_cb:        req.render_cb,
                     event_cb:         req.event_cb,
+                    resize_cb:        req.resize_cb,
+                    frame_interval:   req.frame_interval,
+                    next_frame:       Instant::now(),
                     done_tx:          req.done_tx,
                     cursor_pos:       (0.0, 0.0),
                     modifiers:        Modifiers::default(),
@@ -316,33 +373,12 @@ fn event_loop_thread(proxy_tx: mpsc::SyncSender<Proxy>) {
                         }
                     }
 
+                    // Resize / expose: the surface must be repainted even if
+                    // Python has nothing new to draw.
                     WindowEvent::RedrawRequested => {
-                        let should_close = if let Some(st) = windows.get_mut(&window_id) {
-                            let w = unsafe { *st.width_ptr };
-                            let h = unsafe { *st.height_ptr };
-                            if w > 0 && h > 0 {
-                                let signal = (st.render_cb)();
-                                if signal == 0 {
-                                    if let Ok(mut buf) = st.surface.buffer_mut() {
-                                        let n = (w * h) as usize;
-                                        // osdbuf: [R,G,B,A] LE (0xAABBGGRR)
-                                        // softbuffer: 0x00RRGGBB → swap R↔B
-                                        for i in 0..n {
-                                            let px = unsafe { *st.pixel_ptr.add(i) };
-                                            let r = (px >>  0) & 0xFF;
-                                            let g = (px >>  8) & 0xFF;
-                                            let b = (px >> 16) & 0xFF;
-                                            buf[i] = (r << 16) | (g << 8) | b;
-                                        }
-                                        buf.present().ok();
-                                    }
-                                }
-                                signal != 0
-                            } else {
-                                false
-                            }
-                        } else {
-                            false
+                        let should_close = match windows.get_mut(&window_id) {
+                            Some(st) => render_window(st, true),
+                            None => false,
                         };
                         if should_close {
                             close_window(&mut windows, window_id);
@@ -354,13 +390,14 @@ fn event_loop_thread(proxy_tx: mpsc::SyncSender<Proxy>) {
                             let nw = size.width.max(1);
                             let nh = size.height.max(1);
                             unsafe {
-                                *st.width_ptr  = nw;
-                                *st.height_ptr = nh;
+                                (*st.state).width  = nw;
+                                (*st.state).height = nh;
                             }
                             st.surface.resize(
                                 NonZeroU32::new(nw).unwrap(),
                                 NonZeroU32::new(nh).unwrap(),
                             ).ok();
+                            (st.resize_cb)(nw, nh, st.scale_factor);
                             st.window.request_redraw();
                         }
                     }
@@ -368,8 +405,13 @@ fn event_loop_thread(proxy_tx: mpsc::SyncSender<Proxy>) {
                     WindowEvent::ScaleFactorChanged { scale_factor, .. } => {
                         if let Some(st) = windows.get_mut(&window_id) {
                             st.scale_factor = scale_factor;
-                            unsafe { *st.scale_factor_ptr = scale_factor; }
-                            // Resized event follows with new physical size
+                            let (w, h) = unsafe {
+                                (*st.state).scale_factor = scale_factor;
+                                ((*st.state).width, (*st.state).height)
+                            };
+                            // The logical size changes even if the physical one
+                            // does not; Resized follows if it does.
+                            (st.resize_cb)(w, h, scale_factor);
                         }
                     }
 
@@ -441,11 +483,27 @@ fn event_loop_thread(proxy_tx: mpsc::SyncSender<Proxy>) {
                 }
             }
 
-            // ── Request redraw every frame (for animations) ───────────────────
+            // ── Paced frames (animations, timers) ─────────────────────────────
+            // render_cb runs at most once per frame_interval; frames where
+            // nothing is dirty skip the pixel copy and present entirely.
             Event::AboutToWait => {
-                for (_, st) in &windows {
-                    st.window.request_redraw();
+                let now = Instant::now();
+                let mut to_close = Vec::new();
+                for (id, st) in windows.iter_mut() {
+                    if now < st.next_frame {
+                        continue;
+                    }
+                    // Never schedule in the past: a late frame resets the
+                    // deadline instead of letting frames run back to back.
+                    st.next_frame = st.next_frame.max(now) + st.frame_interval;
+                    if render_window(st, false) {
+                        to_close.push(*id);
+                    }
+                }
+                for id in to_close {
+                    close_window(&mut windows, id);
                 }
+                set_pacing(elwt, &windows);
             }
 
             _ => {}
@@ -474,21 +532,27 @@ fn proxy() -> Proxy {
 /// Can be called from multiple threads simultaneously — each will get its own window.
 /// title can be NULL (empty string will be used).
 ///
-/// scale_factor_ptr is written with the initial display scale factor after the window
-/// is created, and updated whenever ScaleFactorChanged fires.
+/// state is written with the initial physical size and display scale factor after
+/// the window is created, and updated on every Resized / ScaleFactorChanged.
 /// All event coordinates reported via event_callback are in logical pixels
-/// (physical / scale_factor).  width_ptr / height_ptr report physical pixels
+/// (physical / scale_factor).  state.width / state.height are physical pixels
 /// (used for the pixel framebuffer).
+///
+/// resize_callback runs on the event-loop thread before the first frame and on
+/// every Resized / ScaleFactorChanged, with the new physical size and scale.
+///
+/// render_callback is paced to one call per frame_interval_ms (plus OS redraw
+/// requests); the loop sleeps in between instead of polling.
 #[no_mangle]
 pub extern "C" fn winit_run(
     initial_width:    u32,
     initial_height:   u32,
     pixel_ptr:        *mut u32,
-    width_ptr:        *mut u32,
-    height_ptr:       *mut u32,
-    scale_factor_ptr: *mut f64,
+    state:            *mut FrameState,
     render_callback:  RenderCb,
     event_callback:   EventCb,
+    resize_callback:  ResizeCb,
+    frame_interval_ms: u32,
     decorations:      u8,
     title:            *const c_char,
 ) {
@@ -504,11 +568,11 @@ pub extern "C" fn winit_run(
         height:           initial_height,
         title:            title_str,
         pixel_ptr,
-        width_ptr,
-        height_ptr,
-        scale_factor_ptr,
+        state,
         render_cb:        render_callback,
         event_cb:         event_callback,
+        resize_cb:        resize_callback,
+        frame_interval:   Duration::from_millis(frame_interval_ms.max(1) as u64),
         decorations:      decorations != 0,
         done_tx,
     })).ok();
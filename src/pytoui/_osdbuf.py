@@ -1,8 +1,13 @@
 # osdbuf.py
 import ctypes
+import logging
+import struct
 import sys
-from collections.abc import Sequence
-from enum import IntEnum, IntFlag
+import weakref
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import chain, repeat
 from pathlib import Path
 from typing import Any
 
@@ -20,20 +25,37 @@ def _lib_filename(name: str) -> str:
 
 _LIB_PATH = str(Path(__file__).parent / _lib_filename("osdbuf"))
 
-
-class LineCapStyle(IntEnum):
+logger = logging.getLogger(__name__)
+
+# Per-primitive entry points re-bound through dedicated CFUNCTYPE prototypes
+# once their argtypes are known; everything else stays on the CDLL path.
+_PROTOTYPED_FUNCTIONS = (
+    "SetPixel",
+    "Line",
+    "HLine",
+    "VLine",
+    "FillRect",
+    "FillRoundedRect",
+    "FillCircle",
+    "DrawText",
+    "SetCTM",
+    "CompositeFB",
+)
+
+
+class LineCapStyle:
     BUTT = 0
     ROUND = 1
     SQUARE = 2
 
 
-class LineJoinStyle(IntEnum):
+class LineJoinStyle:
     MITER = 0
     ROUND = 1
     BEVEL = 2
 
 
-class BlendMode(IntEnum):
+class BlendMode:
     NORMAL = 0  # SourceOver (default)
     MULTIPLY = 1
     SCREEN = 2
@@ -64,7 +86,7 @@ class BlendMode(IntEnum):
     PLUS_LIGHTER = 27  # Plus
 
 
-class TextAnchor(IntFlag):
+class TextAnchor:
     CENTER = 0
     TOP = 1 << 0  # 1
     BOTTOM = 1 << 1  # 2
@@ -74,133 +96,99 @@ class TextAnchor(IntFlag):
     @classmethod
     def normalize(cls, value: int) -> int:
         """Excludes conflicting flags: TOP+BOTTOM or LEFT+RIGHT."""
-        if (value & cls.TOP) and (value & cls.BOTTOM):
-            value &= ~(cls.TOP | cls.BOTTOM)
-        if (value & cls.LEFT) and (value & cls.RIGHT):
-            value &= ~(cls.LEFT | cls.RIGHT)
-        return value
-
-
-class FrameBuffer:
-    """Pythonic wrapper for osdbuf framebuffer with TTF support"""
-
-    _lib: Any = None
-
-    @classmethod
-    def _ensure_lib_loaded(cls, path: str | None = None):
-        if cls._lib is None:
-            target_path = str(path) if path else _LIB_PATH
-            print(f"DEBUG: Loading CDLL into class from {target_path}...", flush=True)
-            handle = ctypes.CDLL(target_path)
-            cls._setup_argtypes_static(handle)
-            cls._lib = handle
-        return cls._lib
-
-    @staticmethod
-    def _setup_argtypes_static(lib) -> None:
-        """Set up argtypes once"""
-        L = lib
-
-        # Lifecycle
-        L.CreateFrameBuffer.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
-        L.CreateFrameBuffer.restype = ctypes.c_int
-
-        L.DestroyFrameBuffer.argtypes = [ctypes.c_int]
-        L.DestroyFrameBuffer.restype = None
-
-        # Font management (global, not per-FB)
-        L.LoadFont.argtypes = [ctypes.c_char_p]
-        L.LoadFont.restype = ctypes.c_int
-
-        L.UnloadFont.argtypes = [ctypes.c_int]
-        L.UnloadFont.restype = ctypes.c_int
-
-        L.GetDefaultFont.argtypes = []
-        L.GetDefaultFont.restype = ctypes.c_int
-
-        L.GetFontCount.argtypes = []
-        L.GetFontCount.restype = ctypes.c_int
-
-        L.GetFontIDs.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int]
-        L.GetFontIDs.restype = ctypes.c_int
-
-        # Basic fill operations (no blend param — Fill/FillOver use internal logic)
-        L.Fill.argtypes = [ctypes.c_int, ctypes.c_uint32]
-        L.Fill.restype = None
-
-        L.FillOver.argtypes = [ctypes.c_int, ctypes.c_uint32]
-        L.FillOver.restype = None
-
-        # Pixel operations (handle, x, y, color)
-        L.SetPixel.argtypes = [
+        return (value & ~0xF) | _ANCHOR_LUT[value & 0xF]
+
+
+def _normalize_anchor_bits(value: int) -> int:
+    if (value & 0b0011) == 0b0011:  # TOP + BOTTOM
+        value &= ~0b0011
+    if (value & 0b1100) == 0b1100:  # LEFT + RIGHT
+        value &= ~0b1100
+    return value
+
+
+# All 16 combinations of the 4 anchor bits, pre-normalized.
+_ANCHOR_LUT = tuple(_normalize_anchor_bits(i) for i in range(16))
+
+
+# Eagerly applied (name, argtypes, restype) for per-frame entry points.
+_SIGNATURES: tuple[tuple[str, Any, Any], ...] = (
+    # Lifecycle
+    ("CreateFrameBuffer", [ctypes.c_void_p, ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    ("DestroyFrameBuffer", [ctypes.c_int], None),
+    (
+        "ResizeFrameBuffer",
+        [ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_int],
+        ctypes.c_int,
+    ),
+    # Basic fill operations (no blend param — Fill/FillOver use internal logic)
+    ("Fill", [ctypes.c_int, ctypes.c_uint32], None),
+    ("FillOver", [ctypes.c_int, ctypes.c_uint32], None),
+    # Pixel operations (handle, x, y, color)
+    (
+        "SetPixel",
+        [
             ctypes.c_int,
             ctypes.c_int,
             ctypes.c_int,
             ctypes.c_uint32,
-        ]
-        L.SetPixel.restype = None
-
-        L.GetPixel.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
-        L.GetPixel.restype = ctypes.c_uint32
-
-        L.BlitRGBA.argtypes = [
-            ctypes.c_int,
-            ctypes.POINTER(ctypes.c_ubyte),
-            ctypes.c_int,
+        ],
+        None,
+    ),
+    # SetPixelsRGBA (handle, xy [i32 * 2n], colors [u32 * n], n)
+    (
+        "SetPixelsRGBA",
+        [
             ctypes.c_int,
+            ctypes.POINTER(ctypes.c_int32),
+            ctypes.POINTER(ctypes.c_uint32),
             ctypes.c_int,
+        ],
+        None,
+    ),
+    ("GetPixel", [ctypes.c_int, ctypes.c_int, ctypes.c_int], ctypes.c_uint32),
+    # BlitRGBA (handle, src [RGBA bytes], src_w, src_h, dst_x, dst_y, blend)
+    (
+        "BlitRGBA",
+        [
             ctypes.c_int,
-            ctypes.c_int,
-        ]
-        L.BlitRGBA.restype = None
-
-        L.BlitRGBAScaled.argtypes = [
-            ctypes.c_int,
-            ctypes.POINTER(ctypes.c_ubyte),
-            ctypes.c_int,
-            ctypes.c_int,
+            ctypes.c_void_p,
             ctypes.c_int,
             ctypes.c_int,
             ctypes.c_int,
             ctypes.c_int,
             ctypes.c_int,
-        ]
-        L.BlitRGBAScaled.restype = None
-
-        L.Scroll.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
-        L.Scroll.restype = None
-
-        # Antialiasing
-        L.SetAntiAlias.argtypes = [ctypes.c_int, ctypes.c_int]
-        L.SetAntiAlias.restype = None
-
-        L.GetAntiAlias.argtypes = [ctypes.c_int]
-        L.GetAntiAlias.restype = ctypes.c_int
-
-        # Lines (handle, x0, y0, x1, y1, color, blend)
-        L.Line.argtypes = (
-            [ctypes.c_int] + [ctypes.c_int] * 4 + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.Line.restype = None
-
-        L.HLine.argtypes = (
-            [ctypes.c_int] + [ctypes.c_int] * 3 + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.HLine.restype = None
-
-        L.VLine.argtypes = (
-            [ctypes.c_int] + [ctypes.c_int] * 3 + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.VLine.restype = None
-
-        # Rect outline (handle, x, y, w, h, color, blend)
-        L.Rect.argtypes = (
-            [ctypes.c_int] + [ctypes.c_int] * 4 + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.Rect.restype = None
-
-        # FillRect (handle, x, y, w, h [f32], color, blend)
-        L.FillRect.argtypes = [
+        ],
+        None,
+    ),
+    # Lines (handle, x0, y0, x1, y1, color, blend)
+    (
+        "Line",
+        [ctypes.c_int] + [ctypes.c_int] * 4 + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    # Lines (handle, records [LineRecord * n], n, blend)
+    ("Lines", [ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_uint8], None),
+    (
+        "HLine",
+        [ctypes.c_int] + [ctypes.c_int] * 3 + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    (
+        "VLine",
+        [ctypes.c_int] + [ctypes.c_int] * 3 + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    # Rect outline (handle, x, y, w, h, color, blend)
+    (
+        "Rect",
+        [ctypes.c_int] + [ctypes.c_int] * 4 + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    # FillRect (handle, x, y, w, h [f32], color, blend)
+    (
+        "FillRect",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -208,17 +196,31 @@ class FrameBuffer:
             ctypes.c_float,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.FillRect.restype = None
-
-        # RoundedRect outline (handle, x, y, w, h, radius [i32], color, blend)
-        L.RoundedRect.argtypes = (
-            [ctypes.c_int] + [ctypes.c_int] * 5 + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.RoundedRect.restype = None
-
-        # FillRoundedRect (handle, x, y, w, h, radius [f32], color, blend)
-        _frr_args = [
+        ],
+        None,
+    ),
+    # FillRects (handle, rects [f32 * 4n], colors [u32 * n], n, blend)
+    (
+        "FillRects",
+        [
+            ctypes.c_int,
+            ctypes.POINTER(ctypes.c_float),
+            ctypes.POINTER(ctypes.c_uint32),
+            ctypes.c_int,
+            ctypes.c_uint8,
+        ],
+        None,
+    ),
+    # RoundedRect outline (handle, x, y, w, h, radius [i32], color, blend)
+    (
+        "RoundedRect",
+        [ctypes.c_int] + [ctypes.c_int] * 5 + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    # FillRoundedRect (handle, x, y, w, h, radius [f32], color, blend)
+    (
+        "FillRoundedRect",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -227,35 +229,38 @@ class FrameBuffer:
             ctypes.c_float,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.FillRoundedRect.argtypes = _frr_args
-        L.FillRoundedRect.restype = None
-
-        # Circle outline (handle, cx, cy, r [i32], color, blend)
-        L.Circle.argtypes = (
-            [ctypes.c_int] + [ctypes.c_int] * 3 + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.Circle.restype = None
-
-        # FillCircle (handle, cx, cy, r [f32], color, blend)
-        L.FillCircle.argtypes = [
+        ],
+        None,
+    ),
+    # Circle outline (handle, cx, cy, r [i32], color, blend)
+    (
+        "Circle",
+        [ctypes.c_int] + [ctypes.c_int] * 3 + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    # FillCircle (handle, cx, cy, r [f32], color, blend)
+    (
+        "FillCircle",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
             ctypes.c_float,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.FillCircle.restype = None
-
-        # Ellipse outline (handle, cx, cy, rx, ry [i32], color, blend)
-        L.Ellipse.argtypes = (
-            [ctypes.c_int] + [ctypes.c_int] * 4 + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.Ellipse.restype = None
-
-        # FillEllipse (handle, cx, cy, rx, ry [f32], color, blend)
-        L.FillEllipse.argtypes = [
+        ],
+        None,
+    ),
+    # Ellipse outline (handle, cx, cy, rx, ry [i32], color, blend)
+    (
+        "Ellipse",
+        [ctypes.c_int] + [ctypes.c_int] * 4 + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    # FillEllipse (handle, cx, cy, rx, ry [f32], color, blend)
+    (
+        "FillEllipse",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -263,20 +268,22 @@ class FrameBuffer:
             ctypes.c_float,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.FillEllipse.restype = None
-
-        # EllipseArc (handle, cx, cy, rx, ry [i32], start, end [f64], color, blend)
-        L.EllipseArc.argtypes = (
-            [ctypes.c_int]
-            + [ctypes.c_int] * 4
-            + [ctypes.c_double, ctypes.c_double]
-            + [ctypes.c_uint32, ctypes.c_uint8]
-        )
-        L.EllipseArc.restype = None
-
-        # Text (DrawText: fb_handle + font_id + fontSize; others: font_id + fontSize)
-        L.DrawText.argtypes = [
+        ],
+        None,
+    ),
+    # EllipseArc (handle, cx, cy, rx, ry [i32], start, end [f64], color, blend)
+    (
+        "EllipseArc",
+        [ctypes.c_int]
+        + [ctypes.c_int] * 4
+        + [ctypes.c_double, ctypes.c_double]
+        + [ctypes.c_uint32, ctypes.c_uint8],
+        None,
+    ),
+    # Text (fb_handle + font_id + fontSize)
+    (
+        "DrawText",
+        [
             ctypes.c_int,  # fb_handle
             ctypes.c_int,  # font_handle
             ctypes.c_float,  # size
@@ -286,37 +293,26 @@ class FrameBuffer:
             ctypes.c_uint32,  # anchor
             ctypes.c_uint32,  # color
             ctypes.c_float,  # spacing
-        ]
-        L.DrawText.restype = ctypes.c_int
-
-        L.MeasureText.argtypes = [
+        ],
+        ctypes.c_int,
+    ),
+    # DrawTextBatch (handle, cmds [TextCmd*], count, strs [u8*], strs_len)
+    (
+        "DrawTextBatch",
+        [
             ctypes.c_int,
-            ctypes.c_float,
-            ctypes.c_char_p,
-            ctypes.c_float,
-        ]
-        L.MeasureText.restype = ctypes.c_int
-
-        L.GetTextHeight.argtypes = [ctypes.c_int, ctypes.c_float]
-        L.GetTextHeight.restype = ctypes.c_int
-
-        L.GetTextMetrics.argtypes = [
+            ctypes.c_void_p,
             ctypes.c_int,
-            ctypes.c_float,
-            ctypes.POINTER(ctypes.c_int),
-            ctypes.POINTER(ctypes.c_int),
-            ctypes.POINTER(ctypes.c_int),
-        ]
-        L.GetTextMetrics.restype = ctypes.c_int
-
-        # YUV Compensation
-        L.ApplyYUV422Compensation.argtypes = [ctypes.c_int] + [ctypes.c_int] * 4
-        L.ApplyYUV422Compensation.restype = None
-
-        # Stroke primitives
-
-        # LineStroke (handle, x0, y0, x1, y1, width [f32], cap, join [u8], color, blend)
-        L.LineStroke.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_uint32,
+        ],
+        ctypes.c_int,
+    ),
+    # Stroke primitives
+    # LineStroke (handle, x0, y0, x1, y1, width [f32], cap, join [u8], color, blend)
+    (
+        "LineStroke",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -327,11 +323,13 @@ class FrameBuffer:
             ctypes.c_uint8,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.LineStroke.restype = None
-
-        # RectStroke (handle, x, y, w, h, width [f32], join [u8], color, blend)
-        L.RectStroke.argtypes = [
+        ],
+        None,
+    ),
+    # RectStroke (handle, x, y, w, h, width [f32], join [u8], color, blend)
+    (
+        "RectStroke",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -341,12 +339,14 @@ class FrameBuffer:
             ctypes.c_uint8,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.RectStroke.restype = None
-
-        # StrokeRoundedRect
-        # (handle, x, y, w, h, radius, bw [f32], join [u8], color, blend)
-        L.StrokeRoundedRect.argtypes = [
+        ],
+        None,
+    ),
+    # StrokeRoundedRect
+    # (handle, x, y, w, h, radius, bw [f32], join [u8], color, blend)
+    (
+        "StrokeRoundedRect",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -357,11 +357,13 @@ class FrameBuffer:
             ctypes.c_uint8,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.StrokeRoundedRect.restype = None
-
-        # EllipseStroke (handle, cx, cy, rx, ry, width [f32], color, blend)
-        L.EllipseStroke.argtypes = [
+        ],
+        None,
+    ),
+    # EllipseStroke (handle, cx, cy, rx, ry, width [f32], color, blend)
+    (
+        "EllipseStroke",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -370,11 +372,13 @@ class FrameBuffer:
             ctypes.c_float,
             ctypes.c_uint32,
             ctypes.c_uint8,
-        ]
-        L.EllipseStroke.restype = None
-
-        # SetCTM (handle, a, b, c, d, tx, ty [f32]) — sets current transform matrix
-        L.SetCTM.argtypes = [
+        ],
+        None,
+    ),
+    # SetCTM (handle, a, b, c, d, tx, ty [f32]) — sets current transform matrix
+    (
+        "SetCTM",
+        [
             ctypes.c_int,
             ctypes.c_float,
             ctypes.c_float,
@@ -382,57 +386,129 @@ class FrameBuffer:
             ctypes.c_float,
             ctypes.c_float,
             ctypes.c_float,
-        ]
-        L.SetCTM.restype = None
-
-        # GState
-        L.GStatePush.argtypes = [ctypes.c_int]
-        L.GStatePush.restype = None
-        L.GStatePop.argtypes = [ctypes.c_int]
-        L.GStatePop.restype = None
-
-        L.CreateOwnedFB.argtypes = [ctypes.c_int, ctypes.c_int]
-        L.CreateOwnedFB.restype = ctypes.c_int
-
-        L.ClearFB.argtypes = [ctypes.c_int]
-        L.ClearFB.restype = None
-
-        L.CompositeFB.argtypes = [
+        ],
+        None,
+    ),
+    # GState
+    ("GStatePush", [ctypes.c_int], None),
+    ("GStatePop", [ctypes.c_int], None),
+    # Owned layers and compositing
+    ("CreateOwnedFB", [ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    ("ClearFB", [ctypes.c_int], None),
+    (
+        "CompositeFB",
+        [
             ctypes.c_int,  # dst_handle
             ctypes.c_int,  # src_handle
             ctypes.c_int,  # x
             ctypes.c_int,  # y
             ctypes.c_float,  # alpha
-        ]
-        L.CompositeFB.restype = None
-
-        L.CompositeFBRounded.argtypes = [
+        ],
+        None,
+    ),
+    (
+        "CompositeFBRounded",
+        [
             ctypes.c_int,  # dst_handle
             ctypes.c_int,  # src_handle
             ctypes.c_int,  # x
             ctypes.c_int,  # y
             ctypes.c_float,  # alpha
             ctypes.c_float,  # radius (pixels)
-        ]
-        L.CompositeFBRounded.restype = None
-
-        # Transform
-        _tf6 = [ctypes.c_float] * 6
-        L.CreateTransform.argtypes = _tf6
-        L.CreateTransform.restype = ctypes.c_int
-        L.DestroyTransform.argtypes = [ctypes.c_int]
-        L.DestroyTransform.restype = ctypes.c_int
-        L.TransformRotation.argtypes = [ctypes.c_float]
-        L.TransformRotation.restype = ctypes.c_int
-        L.TransformScale.argtypes = [ctypes.c_float, ctypes.c_float]
-        L.TransformScale.restype = ctypes.c_int
-        L.TransformTranslation.argtypes = [ctypes.c_float, ctypes.c_float]
-        L.TransformTranslation.restype = ctypes.c_int
-        L.TransformConcat.argtypes = [ctypes.c_int, ctypes.c_int]
-        L.TransformConcat.restype = ctypes.c_int
-        L.TransformInvert.argtypes = [ctypes.c_int]
-        L.TransformInvert.restype = ctypes.c_int
-        L.TransformGet.argtypes = [
+        ],
+        None,
+    ),
+    # Path fill/stroke (fb_handle, path_handle, color, blend)
+    (
+        "PathFill",
+        [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_uint32,
+            ctypes.c_uint8,
+        ],
+        None,
+    ),
+    (
+        "PathStroke",
+        [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_uint32,
+            ctypes.c_uint8,
+        ],
+        None,
+    ),
+)
+
+# Cold entry points: argtypes/restype are applied by _OsdBufLib on first
+# attribute access instead of eagerly when the library is loaded.
+_LAZY_SIGNATURES: dict[str, tuple[Any, Any]] = {
+    # Font management (global, not per-FB)
+    "LoadFont": ([ctypes.c_char_p], ctypes.c_int),
+    "UnloadFont": ([ctypes.c_int], ctypes.c_int),
+    "GetDefaultFont": ([], ctypes.c_int),
+    "GetFontCount": ([], ctypes.c_int),
+    "GetFontIDs": ([ctypes.POINTER(ctypes.c_int), ctypes.c_int], ctypes.c_int),
+    # Raw pixel access, scaled blit, scroll, antialiasing
+    "GetPixelBuffer": (
+        [
+            ctypes.c_int,
+            ctypes.POINTER(ctypes.c_void_p),
+            ctypes.POINTER(ctypes.c_int),
+        ],
+        ctypes.c_int,
+    ),
+    "BlitRGBAScaled": (
+        [
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+        ],
+        None,
+    ),
+    "Scroll": ([ctypes.c_int, ctypes.c_int, ctypes.c_int], None),
+    "SetAntiAlias": ([ctypes.c_int, ctypes.c_int], None),
+    "GetAntiAlias": ([ctypes.c_int], ctypes.c_int),
+    # Text metrics (font_id + fontSize)
+    "MeasureText": (
+        [
+            ctypes.c_int,
+            ctypes.c_float,
+            ctypes.c_char_p,
+            ctypes.c_float,
+        ],
+        ctypes.c_int,
+    ),
+    "GetTextHeight": ([ctypes.c_int, ctypes.c_float], ctypes.c_int),
+    "GetTextMetrics": (
+        [
+            ctypes.c_int,
+            ctypes.c_float,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+        ],
+        ctypes.c_int,
+    ),
+    # YUV Compensation
+    "ApplyYUV422Compensation": ([ctypes.c_int] + [ctypes.c_int] * 4, None),
+    # Transform
+    "CreateTransform": ([ctypes.c_float] * 6, ctypes.c_int),
+    "DestroyTransform": ([ctypes.c_int], ctypes.c_int),
+    "TransformRotation": ([ctypes.c_float], ctypes.c_int),
+    "TransformScale": ([ctypes.c_float, ctypes.c_float], ctypes.c_int),
+    "TransformTranslation": ([ctypes.c_float, ctypes.c_float], ctypes.c_int),
+    "TransformConcat": ([ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    "TransformInvert": ([ctypes.c_int], ctypes.c_int),
+    "TransformGet": (
+        [
             ctypes.c_int,
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float),
@@ -440,84 +516,70 @@ class FrameBuffer:
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float),
-        ]
-        L.TransformGet.restype = ctypes.c_int
-
-        # Path
-        L.CreatePath.argtypes = []
-        L.CreatePath.restype = ctypes.c_int
-        L.DestroyPath.argtypes = [ctypes.c_int]
-        L.DestroyPath.restype = ctypes.c_int
-        L.PathMoveTo.argtypes = [ctypes.c_int, ctypes.c_float, ctypes.c_float]
-        L.PathMoveTo.restype = None
-        L.PathLineTo.argtypes = [ctypes.c_int, ctypes.c_float, ctypes.c_float]
-        L.PathLineTo.restype = None
-        L.PathAddCurve.argtypes = [ctypes.c_int] + [ctypes.c_float] * 6
-        L.PathAddCurve.restype = None
-        L.PathAddQuadCurve.argtypes = [ctypes.c_int] + [ctypes.c_float] * 4
-        L.PathAddQuadCurve.restype = None
-        L.PathAddArc.argtypes = [ctypes.c_int] + [ctypes.c_float] * 5 + [ctypes.c_int]
-        L.PathAddArc.restype = None
-        L.PathClose.argtypes = [ctypes.c_int]
-        L.PathClose.restype = None
-        L.PathAppend.argtypes = [ctypes.c_int, ctypes.c_int]
-        L.PathAppend.restype = None
-        L.PathRect.argtypes = [ctypes.c_float] * 4
-        L.PathRect.restype = ctypes.c_int
-        L.PathOval.argtypes = [ctypes.c_float] * 4
-        L.PathOval.restype = ctypes.c_int
-        L.PathRoundedRect.argtypes = [ctypes.c_float] * 5
-        L.PathRoundedRect.restype = ctypes.c_int
-        L.PathSetLineWidth.argtypes = [ctypes.c_int, ctypes.c_float]
-        L.PathSetLineWidth.restype = None
-        L.PathSetLineCap.argtypes = [ctypes.c_int, ctypes.c_uint8]
-        L.PathSetLineCap.restype = None
-        L.PathSetLineJoin.argtypes = [ctypes.c_int, ctypes.c_uint8]
-        L.PathSetLineJoin.restype = None
-        L.PathSetLineDash.argtypes = [
+        ],
+        ctypes.c_int,
+    ),
+    # Path
+    "CreatePath": ([], ctypes.c_int),
+    "DestroyPath": ([ctypes.c_int], ctypes.c_int),
+    "PathMoveTo": ([ctypes.c_int, ctypes.c_float, ctypes.c_float], None),
+    "PathLineTo": ([ctypes.c_int, ctypes.c_float, ctypes.c_float], None),
+    "PathAddCurve": ([ctypes.c_int] + [ctypes.c_float] * 6, None),
+    "PathAddQuadCurve": ([ctypes.c_int] + [ctypes.c_float] * 4, None),
+    "PathAddArc": ([ctypes.c_int] + [ctypes.c_float] * 5 + [ctypes.c_int], None),
+    "PathClose": ([ctypes.c_int], None),
+    "PathAppend": ([ctypes.c_int, ctypes.c_int], None),
+    "PathAppendCommands": ([ctypes.c_int, ctypes.c_void_p, ctypes.c_int], ctypes.c_int),
+    "PathRect": ([ctypes.c_float] * 4, ctypes.c_int),
+    "PathOval": ([ctypes.c_float] * 4, ctypes.c_int),
+    "PathRoundedRect": ([ctypes.c_float] * 5, ctypes.c_int),
+    "PathSetLineWidth": ([ctypes.c_int, ctypes.c_float], None),
+    "PathSetLineCap": ([ctypes.c_int, ctypes.c_uint8], None),
+    "PathSetLineJoin": ([ctypes.c_int, ctypes.c_uint8], None),
+    "PathSetLineDash": (
+        [
             ctypes.c_int,
             ctypes.POINTER(ctypes.c_float),
             ctypes.c_int,
             ctypes.c_float,
-        ]
-        L.PathSetLineDash.restype = None
-        L.PathFill.argtypes = [
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_uint32,
-            ctypes.c_uint8,
-        ]
-        L.PathFill.restype = None
-        L.PathStroke.argtypes = [
-            ctypes.c_int,
-            ctypes.c_int,
-            ctypes.c_uint32,
-            ctypes.c_uint8,
-        ]
-        L.PathStroke.restype = None
-        L.PathHitTest.argtypes = [ctypes.c_int, ctypes.c_float, ctypes.c_float]
-        L.PathHitTest.restype = ctypes.c_int
-        L.PathSetEoFillRule.argtypes = [ctypes.c_int, ctypes.c_int]
-        L.PathSetEoFillRule.restype = None
-        L.PathGetBounds.argtypes = [
+        ],
+        None,
+    ),
+    "PathHitTest": ([ctypes.c_int, ctypes.c_float, ctypes.c_float], ctypes.c_int),
+    "PathSetEoFillRule": ([ctypes.c_int, ctypes.c_int], None),
+    "PathGetBounds": (
+        [
             ctypes.c_int,
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float),
             ctypes.POINTER(ctypes.c_float),
-        ]
-        L.PathGetBounds.restype = ctypes.c_int
-        L.PathAddClip.argtypes = [ctypes.c_int, ctypes.c_int]
-        L.PathAddClip.restype = None
-
-        L.DrawCheckerBoard.argtypes = (
+        ],
+        ctypes.c_int,
+    ),
+    "PathAddClip": ([ctypes.c_int, ctypes.c_int], None),
+    # Debug
+    "DrawCheckerBoard": (
+        (
             ctypes.c_int,
             ctypes.c_int,  # size
-        )
-        L.DrawCheckerBoard.restype = None
-
-        # Core Graphics text methods
-        L.DrawStringCoreGraphics.argtypes = [
+        ),
+        None,
+    ),
+    "DrawCheckerBoardRect": (
+        (
+            ctypes.c_int,
+            ctypes.c_int,  # size
+            ctypes.c_int,  # x
+            ctypes.c_int,  # y
+            ctypes.c_int,  # w
+            ctypes.c_int,  # h
+        ),
+        None,
+    ),
+    # Core Graphics text methods
+    "DrawStringCoreGraphics": (
+        [
             ctypes.c_int,  # fb_handle
             ctypes.c_int,  # font_handle
             ctypes.c_char_p,  # text
@@ -529,10 +591,11 @@ class FrameBuffer:
             ctypes.c_uint32,  # color
             ctypes.c_uint32,  # alignment
             ctypes.c_uint32,  # line_break_mode
-        ]
-        L.DrawStringCoreGraphics.restype = ctypes.c_int
-
-        L.MeasureStringCoreGraphics.argtypes = [
+        ],
+        ctypes.c_int,
+    ),
+    "MeasureStringCoreGraphics": (
+        [
             ctypes.c_int,  # font_handle
             ctypes.c_char_p,  # text
             ctypes.c_float,  # max_width
@@ -540,26 +603,145 @@ class FrameBuffer:
             ctypes.c_uint32,  # line_break_mode
             ctypes.POINTER(ctypes.c_float),  # out_width
             ctypes.POINTER(ctypes.c_float),  # out_height
-        ]
-        L.MeasureStringCoreGraphics.restype = ctypes.c_int
+        ],
+        ctypes.c_int,
+    ),
+}
+
+
+def _color_array(c: int | Sequence[int], n: int) -> ctypes.Array:
+    """Pack one broadcast color or ``n`` per-item colors into a u32 array."""
+    if isinstance(c, int):
+        return (ctypes.c_uint32 * n)(*repeat(c, n))
+    if len(c) != n:
+        raise ValueError(f"Expected {n} colors, got {len(c)}")
+    return (ctypes.c_uint32 * n)(*c)
+
+
+def _src_pointer(src: Any) -> Any:
+    """Turn a pixel source into something the c_void_p argtype accepts as-is.
+
+    bytes and ctypes arrays/pointers pass straight through; objects exposing
+    ``__array_interface__`` yield their data address; writable buffers are
+    wrapped in place. None of these copy the pixels.
+    """
+    iface = getattr(src, "__array_interface__", None)
+    if iface is not None:
+        return iface["data"][0]
+    if isinstance(src, (bytearray, memoryview)):
+        return (ctypes.c_ubyte * memoryview(src).nbytes).from_buffer(src)
+    return src
+
+
+@lru_cache(maxsize=512)
+def _utf8(s: str) -> bytes:
+    """UTF-8 encode ``s``; labels redrawn every frame hit the cache."""
+    return s.encode("utf-8")
+
+
+class _OsdBufLib(ctypes.CDLL):
+    """CDLL that resolves cold function signatures lazily."""
+
+    def __getattr__(self, name: str):
+        fn = super().__getattr__(name)
+        sig = _LAZY_SIGNATURES.get(name)
+        if sig is not None:
+            fn.argtypes, fn.restype = sig
+        return fn
+
+
+@lru_cache(maxsize=8)
+def _load_lib(path: str) -> _OsdBufLib:
+    """Load osdbuf once per path; the first library loaded becomes FrameBuffer._lib."""
+    logger.debug("Loading CDLL from %s", path)
+    lib = _OsdBufLib(path)
+    FrameBuffer._setup_argtypes_static(lib)
+    if FrameBuffer._lib is None:
+        FrameBuffer._lib = lib
+    return lib
+
+
+class FrameBuffer:
+    """Pythonic wrapper for osdbuf framebuffer with TTF support"""
+
+    _lib: Any = None
+    # Scratch buffer for ``list_fonts``; grown on demand and reused.
+    _font_id_buf: Any = None
+
+    # Per-draw entry points bound onto each instance as ``_fn_<Name>`` with the
+    # framebuffer handle pre-applied, so the hot path skips the ``self._lib`` +
+    # CDLL attribute chain and the ``self._handle`` read on every call.
+    _HOT_FUNCTIONS = (
+        "Fill",
+        "FillOver",
+        "SetPixel",
+        "SetPixelsRGBA",
+        "GetPixel",
+        "Line",
+        "Lines",
+        "HLine",
+        "VLine",
+        "Rect",
+        "FillRect",
+        "FillRects",
+        "RoundedRect",
+        "FillRoundedRect",
+        "Circle",
+        "FillCircle",
+        "Ellipse",
+        "FillEllipse",
+        "EllipseArc",
+        "DrawText",
+        "DrawTextBatch",
+        "LineStroke",
+        "RectStroke",
+        "StrokeRoundedRect",
+        "EllipseStroke",
+        "SetCTM",
+        "GStatePush",
+        "GStatePop",
+        "PathFill",
+        "PathStroke",
+        "ClearFB",
+        "BlitRGBA",
+        "BlitRGBAScaled",
+    )
+    # Hot entry points that don't take this framebuffer's handle first.
+    _HOT_UNBOUND_FUNCTIONS = (
+        "CompositeFB",
+        "CompositeFBRounded",
+    )
+
+    @classmethod
+    def _ensure_lib_loaded(cls, path: str | None = None):
+        return cls._lib or _load_lib(str(path) if path else _LIB_PATH)
+
+    @staticmethod
+    def _setup_argtypes_static(lib) -> None:
+        """Set up argtypes once"""
+        for name, argtypes, restype in _SIGNATURES:
+            fn = getattr(lib, name)
+            fn.argtypes = argtypes
+            fn.restype = restype
+
+        for name in _PROTOTYPED_FUNCTIONS:
+            fn = getattr(lib, name)
+            proto = ctypes.CFUNCTYPE(fn.restype, *fn.argtypes)
+            setattr(lib, name, proto((name, lib)))
 
     def __init__(self, osd_ptr, width, height, lib_path=_LIB_PATH):
         if not osd_ptr:
             raise ValueError("osd_ptr is NULL! Cannot create FrameBuffer.")
 
         self._handle = 0
-        print("DEBUG: Load lib...", flush=True)
-
         self._lib = self._ensure_lib_loaded(lib_path)
-        print("DEBUG: Lib loaded...", flush=True)
-
-        print("DEBUG: Calling CreateFrameBuffer handle...", flush=True)
 
         addr = ctypes.cast(osd_ptr, ctypes.c_void_p)
         self._handle = self._lib.CreateFrameBuffer(addr, width, height)
         if self._handle <= 0:
             raise RuntimeError("Failed to create framebuffer")
-        print(f"DEBUG: Handle received: {self._handle}", flush=True)
+        logger.debug("Framebuffer handle received: %d", self._handle)
+        self._bind_handle()
 
         self._width = width
         self._height = height
@@ -573,12 +755,17 @@ class FrameBuffer:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.destroy()
 
-    def __del__(self):
-        if self._handle > 0:
-            try:
-                self._lib.DestroyFrameBuffer(self._handle)
-            except Exception:
-                pass
+    def _bind_handle(self) -> None:
+        lib = self._lib
+        # Runs DestroyFrameBuffer exactly once: on release()/destroy(), when the
+        # instance is collected, or at interpreter exit, whichever comes first.
+        self._finalizer = weakref.finalize(self, lib.DestroyFrameBuffer, self._handle)
+        # Pre-boxed handle: ctypes passes a matching c_int through unconverted.
+        self._h = handle = ctypes.c_int(self._handle)
+        for name in self._HOT_FUNCTIONS:
+            setattr(self, "_fn_" + name, partial(getattr(lib, name), handle))
+        for name in self._HOT_UNBOUND_FUNCTIONS:
+            setattr(self, "_fn_" + name, getattr(lib, name))
 
     @property
     def width(self) -> int:
@@ -588,11 +775,47 @@ class FrameBuffer:
     def height(self) -> int:
         return self._height
 
+    @property
+    def pixels(self) -> memoryview:
+        """Zero-copy view of the premultiplied RGBA pixel store.
+
+        Rows are ``width * 4`` bytes. Writes go straight into the framebuffer;
+        the view must not be used after ``destroy()``.
+        """
+        ptr = ctypes.c_void_p()
+        stride = ctypes.c_int()
+        ret = self._lib.GetPixelBuffer(self._h, ctypes.byref(ptr), ctypes.byref(stride))
+        if ret != 0 or not ptr.value:
+            raise RuntimeError("Invalid framebuffer handle")
+        buf = (ctypes.c_ubyte * (stride.value * self._height)).from_address(ptr.value)
+        return memoryview(buf).cast("B")
+
+    def resize(self, osd_ptr, width, height) -> None:
+        """Rebind to a new pixel store of ``width`` x ``height`` in place.
+
+        The native handle, bound hot functions and antialias setting are kept;
+        the clip and graphics-state stack are reset as on a fresh buffer.
+        """
+        if not osd_ptr:
+            raise ValueError("osd_ptr is NULL! Cannot resize FrameBuffer.")
+        addr = ctypes.cast(osd_ptr, ctypes.c_void_p)
+        if self._lib.ResizeFrameBuffer(self._h, addr, width, height) != 0:
+            raise RuntimeError("Invalid framebuffer handle")
+        self._width = width
+        self._height = height
+        self._cx = width // 2
+        self._cy = height // 2
+
+    def release(self) -> None:
+        """Free the native framebuffer without touching its pixels."""
+        if self._handle > 0:
+            self._finalizer()
+            self._handle = 0
+
     def destroy(self):
         if self._handle > 0:
             self.fill(0)
-            self._lib.DestroyFrameBuffer(self._handle)
-            self._handle = 0
+            self.release()
 
     @classmethod
     def create_owned(cls, width: int, height: int) -> "FrameBuffer":
@@ -606,6 +829,7 @@ class FrameBuffer:
         fb = object.__new__(cls)
         fb._handle = handle
         fb._lib = lib
+        fb._bind_handle()
         fb._width = width
         fb._height = height
         fb._cx = width // 2
@@ -615,13 +839,13 @@ class FrameBuffer:
 
     def clear(self) -> None:
         """Clear to transparent and reset clip/gstate/ctm."""
-        self._lib.ClearFB(self._handle)
+        self._fn_ClearFB()
 
     def composite_into(
         self, dst: "FrameBuffer", x: int, y: int, alpha: float = 1.0
     ) -> None:
         """Composite self (src) into dst at pixel position (x, y) with given alpha."""
-        self._lib.CompositeFB(dst._handle, self._handle, x, y, ctypes.c_float(alpha))
+        self._fn_CompositeFB(dst._h, self._h, x, y, alpha)
 
     def composite_into_rounded(
         self,
@@ -632,13 +856,13 @@ class FrameBuffer:
         radius: float = 0.0,
     ) -> None:
         """Composite self (src) into dst with a rounded-rect mask (radius in pixels)."""
-        self._lib.CompositeFBRounded(
-            dst._handle,
-            self._handle,
+        self._fn_CompositeFBRounded(
+            dst._h,
+            self._h,
             x,
             y,
-            ctypes.c_float(alpha),
-            ctypes.c_float(radius),
+            alpha,
+            radius,
         )
 
     # ============= Font API (global, class-level) =============
@@ -687,25 +911,44 @@ class FrameBuffer:
         count = lib.GetFontCount()
         if count <= 0:
             return []
-        buf = (ctypes.c_int * count)()
+        buf = cls._font_id_buf
+        if buf is None or len(buf) < count:
+            buf = cls._font_id_buf = (ctypes.c_int * count)()
         n = lib.GetFontIDs(buf, count)
-        return list(buf[:n])
+        return [buf[i] for i in range(n)]
 
     # ============= Drawing methods =============
 
     def fill(self, c: int = 0) -> None:
-        self._lib.Fill(self._handle, c)
+        self._fn_Fill(c)
 
     def fill_over(self, c: int = 0) -> None:
-        self._lib.FillOver(self._handle, c)
+        if not c & 0xFF:  # fully transparent source-over is a no-op
+            return
+        self._fn_FillOver(c)
 
     def pixel(self, x: int, y: int, c: int | None = 0) -> int | None:
         """Absolute coordinates. c=None -> get, else set."""
         if c is None:
-            return self._lib.GetPixel(self._handle, x, y)
-        self._lib.SetPixel(self._handle, x, y, c)
+            return self._fn_GetPixel(x, y)
+        self._fn_SetPixel(x, y, c)
         return None
 
+    def set_pixels(
+        self,
+        points: Sequence[tuple[int, int]],
+        c: int | Sequence[int] = 0,
+    ) -> None:
+        """Set many (x, y) pixels with a single native call.
+
+        ``c`` is either one color for all pixels or a color per pixel.
+        """
+        n = len(points)
+        if n == 0:
+            return
+        xy = (ctypes.c_int32 * (n * 2))(*chain.from_iterable(points))
+        self._fn_SetPixelsRGBA(xy, _color_array(c, n), n)
+
     def line(
         self,
         x0: int,
@@ -713,9 +956,9 @@ class FrameBuffer:
         x1: int,
         y1: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.Line(self._handle, x0, y0, x1, y1, c, int(blend))
+        self._fn_Line(x0, y0, x1, y1, c, blend)
 
     def hline(
         self,
@@ -723,9 +966,9 @@ class FrameBuffer:
         y: int,
         w: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.HLine(self._handle, x, y, w, c, int(blend))
+        self._fn_HLine(x, y, w, c, blend)
 
     def vline(
         self,
@@ -733,9 +976,9 @@ class FrameBuffer:
         y: int,
         h: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.VLine(self._handle, x, y, h, c, int(blend))
+        self._fn_VLine(x, y, h, c, blend)
 
     def rect(
         self,
@@ -744,9 +987,9 @@ class FrameBuffer:
         w: int,
         h: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.Rect(self._handle, x, y, w, h, c, int(blend))
+        self._fn_Rect(x, y, w, h, c, blend)
 
     def fill_rect(
         self,
@@ -755,17 +998,27 @@ class FrameBuffer:
         w: float,
         h: float,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.FillRect(
-            self._handle,
-            float(x),
-            float(y),
-            float(w),
-            float(h),
-            int(c),
-            int(blend),
-        )
+        if not c & 0xFF and blend == BlendMode.NORMAL:
+            return
+        self._fn_FillRect(x, y, w, h, c, blend)
+
+    def fill_rects(
+        self,
+        rects: Sequence[tuple[float, float, float, float]],
+        c: int | Sequence[int] = 0,
+        blend: int = BlendMode.NORMAL,
+    ) -> None:
+        """Fill many (x, y, w, h) rects with a single native call.
+
+        ``c`` is either one color for all rects or a color per rect.
+        """
+        n = len(rects)
+        if n == 0:
+            return
+        coords = (ctypes.c_float * (n * 4))(*chain.from_iterable(rects))
+        self._fn_FillRects(coords, _color_array(c, n), n, blend)
 
     def rounded_rect(
         self,
@@ -775,9 +1028,9 @@ class FrameBuffer:
         h: int,
         r: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.RoundedRect(self._handle, x, y, w, h, r, c, int(blend))
+        self._fn_RoundedRect(x, y, w, h, r, c, blend)
 
     def fill_rounded_rect(
         self,
@@ -787,18 +1040,11 @@ class FrameBuffer:
         h: float,
         r: float,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.FillRoundedRect(
-            self._handle,
-            float(x),
-            float(y),
-            float(w),
-            float(h),
-            float(r),
-            int(c),
-            int(blend),
-        )
+        if not c & 0xFF and blend == BlendMode.NORMAL:
+            return
+        self._fn_FillRoundedRect(x, y, w, h, r, c, blend)
 
     def circle(
         self,
@@ -806,9 +1052,9 @@ class FrameBuffer:
         cy: int,
         r: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.Circle(self._handle, cx, cy, r, c, int(blend))
+        self._fn_Circle(cx, cy, r, c, blend)
 
     def fill_circle(
         self,
@@ -816,16 +1062,11 @@ class FrameBuffer:
         cy: float,
         r: float,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.FillCircle(
-            self._handle,
-            float(cx),
-            float(cy),
-            float(r),
-            int(c),
-            int(blend),
-        )
+        if not c & 0xFF and blend == BlendMode.NORMAL:
+            return
+        self._fn_FillCircle(cx, cy, r, c, blend)
 
     def ellipse(
         self,
@@ -834,9 +1075,9 @@ class FrameBuffer:
         rx: int,
         ry: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.Ellipse(self._handle, cx, cy, rx, ry, c, int(blend))
+        self._fn_Ellipse(cx, cy, rx, ry, c, blend)
 
     def fill_ellipse(
         self,
@@ -845,17 +1086,11 @@ class FrameBuffer:
         rx: float,
         ry: float,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.FillEllipse(
-            self._handle,
-            float(cx),
-            float(cy),
-            float(rx),
-            float(ry),
-            int(c),
-            int(blend),
-        )
+        if not c & 0xFF and blend == BlendMode.NORMAL:
+            return
+        self._fn_FillEllipse(cx, cy, rx, ry, c, blend)
 
     def ellipse_arc(
         self,
@@ -866,19 +1101,9 @@ class FrameBuffer:
         startAngle: float,
         endAngle: float,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.EllipseArc(
-            self._handle,
-            cx,
-            cy,
-            rx,
-            ry,
-            startAngle,
-            endAngle,
-            c,
-            int(blend),
-        )
+        self._fn_EllipseArc(cx, cy, rx, ry, startAngle, endAngle, c, blend)
 
     # ============= Text =============
 
@@ -890,25 +1115,36 @@ class FrameBuffer:
         c: int = 0,
         size: float = 0.0,
         font_id: int = 0,
-        anchor: TextAnchor = TextAnchor.LEFT | TextAnchor.TOP,
+        anchor: int = TextAnchor.LEFT | TextAnchor.TOP,
         spacing: float = 0.0,
     ) -> None:
-        ret = self._lib.DrawText(
-            self._handle,
+        ret = self._fn_DrawText(
             font_id,
-            ctypes.c_float(size),
-            s.encode("utf-8"),
+            size,
+            _utf8(s),
             x,
             y,
             anchor,
             c,
-            ctypes.c_float(spacing),
+            spacing,
         )
         if ret == -1:
             raise ValueError("Invalid framebuffer handle")
         if ret == -2:
             raise ValueError(f"Invalid font handle: {font_id}")
 
+    def text_batch(self, items: Iterable[tuple]) -> int:
+        """Draw many strings with one DrawTextBatch call.
+
+        Each item holds ``text()`` positional arguments:
+        ``(s, x, y[, c, size, font_id, anchor, spacing])``.
+        Returns the number of strings drawn.
+        """
+        batch = TextBatch(self)
+        for item in items:
+            batch.add(*item)
+        return batch.submit()
+
     @classmethod
     def measure_text(
         cls,
@@ -920,9 +1156,9 @@ class FrameBuffer:
         lib = cls._ensure_lib_loaded()
         ret = lib.MeasureText(
             font_id,
-            ctypes.c_float(size),
-            s.encode("utf-8"),
-            ctypes.c_float(spacing),
+            size,
+            _utf8(s),
+            spacing,
         )
         if ret == -1:
             raise ValueError(f"Invalid font handle: {font_id}")
@@ -931,7 +1167,7 @@ class FrameBuffer:
     @classmethod
     def get_text_height(cls, size: float = 0.0, font_id: int = 0) -> int:
         lib = cls._ensure_lib_loaded()
-        ret = lib.GetTextHeight(font_id, ctypes.c_float(size))
+        ret = lib.GetTextHeight(font_id, size)
         if ret == -1:
             raise ValueError(f"Invalid font handle: {font_id}")
         return ret
@@ -948,7 +1184,7 @@ class FrameBuffer:
         height = ctypes.c_int()
         ret = lib.GetTextMetrics(
             font_id,
-            ctypes.c_float(size),
+            size,
             ctypes.byref(ascent),
             ctypes.byref(descent),
             ctypes.byref(height),
@@ -960,28 +1196,27 @@ class FrameBuffer:
     # ============= Misc =============
 
     def scroll(self, dx: int, dy: int) -> None:
-        self._lib.Scroll(self._handle, dx, dy)
+        self._lib.Scroll(self._h, dx, dy)
 
     @property
     def antialias(self) -> bool:
-        return self._lib.GetAntiAlias(self._handle) != 0
+        return self._lib.GetAntiAlias(self._h) != 0
 
     @antialias.setter
     def antialias(self, enabled: bool) -> None:
-        self._lib.SetAntiAlias(self._handle, int(enabled))
+        self._lib.SetAntiAlias(self._h, int(enabled))
 
     def blit(
         self,
-        src_data,  # ctypes.POINTER(ctypes.c_ubyte)
+        src_data,  # bytes, bytearray, ctypes buffer or __array_interface__
         src_width: int,
         src_height: int,
         dst_x: int,
         dst_y: int,
         blend: bool = True,
     ) -> None:
-        self._lib.BlitRGBA(
-            self._handle,
-            src_data,
+        self._fn_BlitRGBA(
+            _src_pointer(src_data),
             src_width,
             src_height,
             dst_x,
@@ -991,7 +1226,7 @@ class FrameBuffer:
 
     def blit_scaled(
         self,
-        src_data,  # ctypes.POINTER(ctypes.c_ubyte)
+        src_data,  # bytes, bytearray, ctypes buffer or __array_interface__
         src_width: int,
         src_height: int,
         dst_x: int,
@@ -1000,9 +1235,8 @@ class FrameBuffer:
         dst_height: int,
         blend: bool = True,
     ) -> None:
-        self._lib.BlitRGBAScaled(
-            self._handle,
-            src_data,
+        self._fn_BlitRGBAScaled(
+            _src_pointer(src_data),
             src_width,
             src_height,
             dst_x,
@@ -1014,11 +1248,11 @@ class FrameBuffer:
 
     def apply_yuv_compensation(self, x: int, y: int, w: int, h: int) -> None:
         """Aligns chroma of neighboring pixels for correct display on YUV422."""
-        self._lib.ApplyYUV422Compensation(self._handle, x, y, w, h)
+        self._lib.ApplyYUV422Compensation(self._h, x, y, w, h)
 
     def apply_yuv_compensation_full(self) -> None:
         """Apply compensation to the entire buffer."""
-        self._lib.ApplyYUV422Compensation(self._handle, 0, 0, self._width, self._height)
+        self._lib.ApplyYUV422Compensation(self._h, 0, 0, self._width, self._height)
 
     # ============= Stroke primitives =============
 
@@ -1029,23 +1263,12 @@ class FrameBuffer:
         x1: float,
         y1: float,
         width: float,
-        cap: LineCapStyle = LineCapStyle.BUTT,
-        join: LineJoinStyle = LineJoinStyle.MITER,
+        cap: int = LineCapStyle.BUTT,
+        join: int = LineJoinStyle.MITER,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.LineStroke(
-            self._handle,
-            float(x0),
-            float(y0),
-            float(x1),
-            float(y1),
-            float(width),
-            int(cap),
-            int(join),
-            int(c),
-            int(blend),
-        )
+        self._fn_LineStroke(x0, y0, x1, y1, width, cap, join, c, blend)
 
     def ellipse_stroke(
         self,
@@ -1055,18 +1278,9 @@ class FrameBuffer:
         ry: float,
         width: float,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.EllipseStroke(
-            self._handle,
-            float(cx),
-            float(cy),
-            float(rx),
-            float(ry),
-            float(width),
-            int(c),
-            int(blend),
-        )
+        self._fn_EllipseStroke(cx, cy, rx, ry, width, c, blend)
 
     def rect_stroke(
         self,
@@ -1075,21 +1289,11 @@ class FrameBuffer:
         w: float,
         h: float,
         width: float,
-        join: LineJoinStyle = LineJoinStyle.MITER,
+        join: int = LineJoinStyle.MITER,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.RectStroke(
-            self._handle,
-            float(x),
-            float(y),
-            float(w),
-            float(h),
-            float(width),
-            int(join),
-            int(c),
-            int(blend),
-        )
+        self._fn_RectStroke(x, y, w, h, width, join, c, blend)
 
     def stroke_rounded_rect(
         self,
@@ -1099,22 +1303,11 @@ class FrameBuffer:
         h: float,
         radius: float,
         bw: float,
-        join: LineJoinStyle = LineJoinStyle.ROUND,
+        join: int = LineJoinStyle.ROUND,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.StrokeRoundedRect(
-            self._handle,
-            float(x),
-            float(y),
-            float(w),
-            float(h),
-            float(radius),
-            float(bw),
-            int(join),
-            int(c),
-            int(blend),
-        )
+        self._fn_StrokeRoundedRect(x, y, w, h, radius, bw, join, c, blend)
 
     def set_ctm(
         self,
@@ -1131,23 +1324,32 @@ class FrameBuffer:
         matching the CoreGraphics / Pythonista Transform convention.
         Call after concat_ctm or set_origin to sync Python state to Rust.
         """
-        self._lib.SetCTM(
-            self._handle,
-            ctypes.c_float(a),
-            ctypes.c_float(b),
-            ctypes.c_float(c),
-            ctypes.c_float(d),
-            ctypes.c_float(tx),
-            ctypes.c_float(ty),
-        )
+        self._fn_SetCTM(a, b, c, d, tx, ty)
 
     # ============= GState =============
 
     def gstate_push(self) -> None:
-        self._lib.GStatePush(self._handle)
+        self._fn_GStatePush()
 
     def gstate_pop(self) -> None:
-        self._lib.GStatePop(self._handle)
+        self._fn_GStatePop()
+
+    @contextmanager
+    def center_origin(self) -> Iterator[None]:
+        """Move the origin to the buffer center for the duration of the block.
+
+        Pushes a gstate and sets the CTM to a translation by (width // 2,
+        height // 2), so CTM-aware primitives (fill_*, *_stroke and paths) can
+        be issued in center-relative coordinates without per-call offsets.
+        The previous CTM and clip are restored on exit.
+        Integer outline primitives (line, rect, circle, ...) ignore the CTM.
+        """
+        self._fn_GStatePush()
+        try:
+            self._fn_SetCTM(1.0, 0.0, 0.0, 1.0, self._cx, self._cy)
+            yield
+        finally:
+            self._fn_GStatePop()
 
     # ============= Path (handle-based) =============
 
@@ -1155,20 +1357,35 @@ class FrameBuffer:
         self,
         pid: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.PathFill(self._handle, int(pid), int(c), int(blend))
+        if not c & 0xFF and blend == BlendMode.NORMAL:
+            return
+        self._fn_PathFill(pid, c, blend)
 
     def path_stroke(
         self,
         pid: int,
         c: int = 0,
-        blend: BlendMode = BlendMode.NORMAL,
+        blend: int = BlendMode.NORMAL,
     ) -> None:
-        self._lib.PathStroke(self._handle, int(pid), int(c), int(blend))
+        self._fn_PathStroke(pid, c, blend)
 
     def path_add_clip(self, pid: int) -> None:
-        self._lib.PathAddClip(self._handle, int(pid))
+        self._lib.PathAddClip(self._h, pid)
+
+    def clip_to_rect(self, x: int, y: int, w: int, h: int) -> None:
+        """Intersect the clip with a rect in device pixels.
+
+        Resets the CTM to identity first, so the rect is unaffected by
+        scale_factor or any transform left over from the last render.
+        """
+        self.set_ctm(1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+        pid = self.path_rect(x, y, w, h)
+        try:
+            self.path_add_clip(pid)
+        finally:
+            self.destroy_path(pid)
 
     @classmethod
     def create_path(cls) -> int:
@@ -1213,7 +1430,7 @@ class FrameBuffer:
     def path_set_line_width(cls, pid: int, value: float) -> None:
         if pid > 0:
             if lib := cls._ensure_lib_loaded():
-                lib.PathSetLineWidth(pid, ctypes.c_float(value))
+                lib.PathSetLineWidth(pid, value)
 
     @classmethod
     def path_set_line_join_style(cls, pid: int, value: int) -> None:
@@ -1237,13 +1454,13 @@ class FrameBuffer:
     def path_move_to(cls, pid: int, x: float, y: float) -> None:
         if pid > 0:
             if lib := cls._ensure_lib_loaded():
-                lib.PathMoveTo(pid, ctypes.c_float(x), ctypes.c_float(y))
+                lib.PathMoveTo(pid, x, y)
 
     @classmethod
     def path_line_to(cls, pid: int, x: float, y: float) -> None:
         if pid > 0:
             if lib := cls._ensure_lib_loaded():
-                lib.PathLineTo(pid, ctypes.c_float(x), ctypes.c_float(y))
+                lib.PathLineTo(pid, x, y)
 
     @classmethod
     def path_add_arc(
@@ -1260,12 +1477,12 @@ class FrameBuffer:
             if lib := cls._ensure_lib_loaded():
                 lib.PathAddArc(
                     pid,
-                    ctypes.c_float(cx),
-                    ctypes.c_float(cy),
-                    ctypes.c_float(r),
-                    ctypes.c_float(start),
-                    ctypes.c_float(end),
-                    ctypes.c_int(1 if clockwise else 0),
+                    cx,
+                    cy,
+                    r,
+                    start,
+                    end,
+                    1 if clockwise else 0,
                 )
 
     @classmethod
@@ -1283,12 +1500,12 @@ class FrameBuffer:
             if lib := cls._ensure_lib_loaded():
                 lib.PathAddCurve(
                     pid,
-                    ctypes.c_float(cp1_x),
-                    ctypes.c_float(cp1_y),
-                    ctypes.c_float(cp2_x),
-                    ctypes.c_float(cp2_y),
-                    ctypes.c_float(end_x),
-                    ctypes.c_float(end_y),
+                    cp1_x,
+                    cp1_y,
+                    cp2_x,
+                    cp2_y,
+                    end_x,
+                    end_y,
                 )
 
     @classmethod
@@ -1304,10 +1521,10 @@ class FrameBuffer:
             if lib := cls._ensure_lib_loaded():
                 lib.PathAddQuadCurve(
                     pid,
-                    ctypes.c_float(cp_x),
-                    ctypes.c_float(cp_y),
-                    ctypes.c_float(end_x),
-                    ctypes.c_float(end_y),
+                    cp_x,
+                    cp_y,
+                    end_x,
+                    end_y,
                 )
 
     @classmethod
@@ -1322,6 +1539,17 @@ class FrameBuffer:
             if lib := cls._ensure_lib_loaded():
                 lib.PathAppend(pid, other_pid)
 
+    @classmethod
+    def path_append_commands(cls, pid: int, data: bytes | bytearray) -> int:
+        """Append a packed command stream (see PathBuilder) in one native call.
+
+        Returns the number of commands appended, or -1 if the stream is malformed.
+        """
+        if pid > 0 and data:
+            if lib := cls._ensure_lib_loaded():
+                return lib.PathAppendCommands(pid, _src_pointer(data), len(data))
+        return 0
+
     @classmethod
     def path_set_line_dash(
         cls,
@@ -1332,16 +1560,16 @@ class FrameBuffer:
         if pid > 0:
             if lib := cls._ensure_lib_loaded():
                 if not sequence:
-                    lib.PathSetLineDash(pid, None, 0, ctypes.c_float(0.0))
+                    lib.PathSetLineDash(pid, None, 0, 0.0)
                 else:
                     arr = (ctypes.c_float * len(sequence))(*sequence)
-                    lib.PathSetLineDash(pid, arr, len(sequence), ctypes.c_float(phase))
+                    lib.PathSetLineDash(pid, arr, len(sequence), phase)
 
     @classmethod
     def path_hit_test(cls, pid: int, x: float, y: float) -> bool:
         if pid > 0:
             if lib := cls._ensure_lib_loaded():
-                return lib.PathHitTest(pid, ctypes.c_float(x), ctypes.c_float(y)) != 0
+                return lib.PathHitTest(pid, x, y) != 0
         return False
 
     @classmethod
@@ -1366,7 +1594,11 @@ class FrameBuffer:
 
     # ============= DEBUG ONLY =============
     def draw_checkerboard(self, size: int = 8):
-        self._lib.DrawCheckerBoard(self._handle, size)
+        self._lib.DrawCheckerBoard(self._h, size)
+
+    def draw_checkerboard_rect(self, size: int, x: int, y: int, w: int, h: int):
+        """Checkerboard limited to a pixel rect; tiles align with the full one."""
+        self._lib.DrawCheckerBoardRect(self._h, size, x, y, w, h)
 
     # ============= CORE GRAPHICS =============
     def draw_string_core_graphics(
@@ -1399,15 +1631,15 @@ class FrameBuffer:
         """
         if hasattr(self._lib, "DrawStringCoreGraphics"):
             self._lib.DrawStringCoreGraphics(
-                self._handle,
+                self._h,
                 font_id,
-                s.encode("utf-8"),
-                ctypes.c_float(x),
-                ctypes.c_float(y),
-                ctypes.c_float(w),
-                ctypes.c_float(h),
-                ctypes.c_float(size),
-                int(c),
+                _utf8(s),
+                x,
+                y,
+                w,
+                h,
+                size,
+                c,
                 alignment,
                 line_break_mode,
             )
@@ -1442,9 +1674,9 @@ class FrameBuffer:
 
         ret = lib.MeasureStringCoreGraphics(
             font_id,
-            s.encode("utf-8"),
-            ctypes.c_float(max_width),
-            ctypes.c_float(size),
+            _utf8(s),
+            max_width,
+            size,
             line_break_mode,
             ctypes.byref(width),
             ctypes.byref(height),
@@ -1469,12 +1701,12 @@ class FrameBuffer:
     ) -> int:
         if lib := cls._ensure_lib_loaded():
             tid = lib.CreateTransform(
-                ctypes.c_float(a),
-                ctypes.c_float(b),
-                ctypes.c_float(c),
-                ctypes.c_float(d),
-                ctypes.c_float(tx),
-                ctypes.c_float(ty),
+                a,
+                b,
+                c,
+                d,
+                tx,
+                ty,
             )
             if tid > 0:
                 return tid
@@ -1514,19 +1746,19 @@ class FrameBuffer:
     @classmethod
     def transform_rotation(cls, rad: float) -> int:
         if lib := cls._ensure_lib_loaded():
-            return lib.TransformRotation(ctypes.c_float(rad))
+            return lib.TransformRotation(rad)
         return 0
 
     @classmethod
     def transform_scale(cls, sx: float, sy: float) -> int:
         if lib := cls._ensure_lib_loaded():
-            return lib.TransformScale(ctypes.c_float(sx), ctypes.c_float(sy))
+            return lib.TransformScale(sx, sy)
         return 0
 
     @classmethod
     def transform_translation(cls, tx: float, ty: float) -> int:
         if lib := cls._ensure_lib_loaded():
-            return lib.TransformTranslation(ctypes.c_float(tx), ctypes.c_float(ty))
+            return lib.TransformTranslation(tx, ty)
         return 0
 
     @classmethod
@@ -1541,3 +1773,249 @@ class FrameBuffer:
         if lib := cls._ensure_lib_loaded():
             return lib.TransformInvert(tid)
         return 0
+
+
+# Packed Lines record (native byte order): x0, y0, x1, y1 as i16, color as u32.
+_LINE_RECORD = struct.Struct("=hhhhI")
+
+
+class LineBatch:
+    """Collects 1px lines and draws them with one Lines call per flush.
+
+    Records are packed into a preallocated buffer of ``capacity`` entries and
+    submitted automatically when it fills up, on ``submit()``, or when used as
+    a context manager, on exit. Coordinates must fit in int16.
+    """
+
+    __slots__ = ("_fb", "_blend", "_buf", "_capacity", "_count")
+
+    def __init__(
+        self,
+        fb: FrameBuffer,
+        capacity: int = 1024,
+        blend: int = BlendMode.NORMAL,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._fb = fb
+        self._blend = blend
+        self._buf = bytearray(capacity * _LINE_RECORD.size)
+        self._capacity = capacity
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "LineBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.submit()
+
+    def add(self, x0: int, y0: int, x1: int, y1: int, c: int = 0) -> None:
+        _LINE_RECORD.pack_into(
+            self._buf, self._count * _LINE_RECORD.size, x0, y0, x1, y1, c
+        )
+        self._count += 1
+        if self._count == self._capacity:
+            self.submit()
+
+    def submit(self) -> None:
+        if self._count:
+            self._fb._fn_Lines(_src_pointer(self._buf), self._count, self._blend)
+            self._count = 0
+
+
+# One TextCmd record of DrawTextBatch: str_off, str_len, x, y, color, size,
+# spacing, font_id, anchor (32 bytes, native byte order).
+_TEXT_CMD = struct.Struct("=IIffIffHH")
+
+
+class TextBatch:
+    """Collects strings and draws them with one DrawTextBatch call per flush.
+
+    Strings are UTF-8 encoded into one shared buffer and each draw is packed
+    as a fixed-size record; the batch is submitted automatically when the
+    record buffer fills up, on ``submit()``, or on context-manager exit.
+    Draw order within a batch is preserved.
+    """
+
+    __slots__ = ("_fb", "_cmds", "_strs", "_capacity", "_count")
+
+    def __init__(self, fb: FrameBuffer, capacity: int = 256) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._fb = fb
+        self._cmds = bytearray(capacity * _TEXT_CMD.size)
+        self._strs = bytearray()
+        self._capacity = capacity
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "TextBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.submit()
+
+    def add(
+        self,
+        s: str,
+        x: float,
+        y: float,
+        c: int = 0,
+        size: float = 0.0,
+        font_id: int = 0,
+        anchor: int = TextAnchor.LEFT | TextAnchor.TOP,
+        spacing: float = 0.0,
+    ) -> None:
+        data = _utf8(s)
+        strs = self._strs
+        _TEXT_CMD.pack_into(
+            self._cmds,
+            self._count * _TEXT_CMD.size,
+            len(strs),
+            len(data),
+            x,
+            y,
+            c,
+            size,
+            spacing,
+            font_id,
+            anchor,
+        )
+        strs += data
+        self._count += 1
+        if self._count == self._capacity:
+            self.submit()
+
+    def submit(self) -> int:
+        """Draw the pending strings; returns how many were drawn."""
+        if not self._count:
+            return 0
+        strs = self._strs
+        drawn = self._fb._fn_DrawTextBatch(
+            _src_pointer(self._cmds),
+            self._count,
+            _src_pointer(strs),
+            len(strs),
+        )
+        self._count = 0
+        del strs[:]
+        return drawn
+
+
+# Packed path command records for PathAppendCommands: one opcode byte followed
+# by little-endian f32 operands (the arc record ends with a clockwise byte).
+_PATH_OP_MOVE_TO = 0
+_PATH_OP_LINE_TO = 1
+_PATH_OP_CUBIC_TO = 2
+_PATH_OP_QUAD_TO = 3
+_PATH_OP_ARC = 4
+_PATH_OP_CLOSE = 5
+
+_PATH_XY = struct.Struct("<Bff")
+_PATH_CUBIC = struct.Struct("<Bffffff")
+_PATH_QUAD = struct.Struct("<Bffff")
+_PATH_ARC = struct.Struct("<BfffffB")
+_PATH_CLOSE = bytes((_PATH_OP_CLOSE,))
+
+
+class PathBuilder:
+    """Records path commands into one packed buffer.
+
+    The whole path crosses into Rust with a single PathAppendCommands call
+    instead of one ctypes call per segment. Argument order matches the
+    FrameBuffer.path_* classmethods (end point first for curves).
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    @property
+    def data(self) -> bytearray:
+        return self._buf
+
+    def clear(self) -> None:
+        self._buf.clear()
+
+    def move_to(self, x: float, y: float) -> None:
+        self._buf += _PATH_XY.pack(_PATH_OP_MOVE_TO, x, y)
+
+    def line_to(self, x: float, y: float) -> None:
+        self._buf += _PATH_XY.pack(_PATH_OP_LINE_TO, x, y)
+
+    def add_curve(
+        self,
+        end_x: float,
+        end_y: float,
+        cp1_x: float,
+        cp1_y: float,
+        cp2_x: float,
+        cp2_y: float,
+    ) -> None:
+        self._buf += _PATH_CUBIC.pack(
+            _PATH_OP_CUBIC_TO, cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y
+        )
+
+    def add_quad_curve(
+        self, end_x: float, end_y: float, cp_x: float, cp_y: float
+    ) -> None:
+        self._buf += _PATH_QUAD.pack(_PATH_OP_QUAD_TO, cp_x, cp_y, end_x, end_y)
+
+    def add_arc(
+        self,
+        cx: float,
+        cy: float,
+        r: float,
+        start: float,
+        end: float,
+        clockwise: bool = True,
+    ) -> None:
+        self._buf += _PATH_ARC.pack(
+            _PATH_OP_ARC, cx, cy, r, start, end, 1 if clockwise else 0
+        )
+
+    def close(self) -> None:
+        self._buf += _PATH_CLOSE
+
+    def build(self, pid: int = 0) -> int:
+        """Append the recorded commands to path ``pid`` (a new path if 0)."""
+        if pid <= 0:
+            pid = FrameBuffer.create_path()
+        if FrameBuffer.path_append_commands(pid, self._buf) < 0:
+            raise RuntimeError("Failed to append path commands")
+        return pid
+
+    def fill(
+        self,
+        fb: FrameBuffer,
+        c: int = 0,
+        blend: int = BlendMode.NORMAL,
+    ) -> None:
+        pid = self.build()
+        try:
+            fb.path_fill(pid, c, blend)
+        finally:
+            FrameBuffer.destroy_path(pid)
+
+    def stroke(
+        self,
+        fb: FrameBuffer,
+        c: int = 0,
+        blend: int = BlendMode.NORMAL,
+        line_width: float = 1.0,
+    ) -> None:
+        pid = self.build()
+        try:
+            FrameBuffer.path_set_line_width(pid, line_width)
+            fb.path_stroke(pid, c, blend)
+        finally:
+            FrameBuffer.destroy_path(pid)
@@ -49,28 +49,28 @@ __all__ = (
 
 
 def pytoui_desktop_only(func):
+    # The platform is fixed at import time, so desktop builds get the function
+    # back unwrapped and hot helpers pay no per-call guard.
+    if not IS_PYTHONISTA:
+        return func
+
     def wrapper(*args, **kwargs):
-        if IS_PYTHONISTA:
-            raise RuntimeError(
-                f"{func.__name__} can be used only on non-Pythonista runtime",
-            )
-        return func(*args, **kwargs)
+        raise RuntimeError(
+            f"{func.__name__} can be used only on non-Pythonista runtime",
+        )
 
     return wrapper
 
 
+_TRUE_VALUES = frozenset(("true", "1", "yes", "y"))
+
+
 def _get_env_var(name: str, default: str):
-    return os.environ.get(name, default).strip().strip().lower()
+    return os.environ.get(name, default).strip().lower()
 
 
 def _get_env_bool(name: str, default: str) -> bool:
-    value: str = _get_env_var(name, default)
-    return value in (
-        "true",
-        "1",
-        "yes",
-        "y",
-    )
+    return _get_env_var(name, default) in _TRUE_VALUES
 
 
 _UI_DISABLE_ANIMATIONS = _get_env_bool("UI_DISABLE_ANIMATIONS", "0")
@@ -6,16 +6,19 @@ SDL's event queue is global. Calling SDL_PollEvent from multiple threads
 causes events to be randomly consumed by the wrong window. The fix: a single
 background pump thread owns all SDL_PollEvent calls and routes events to
 per-window queues via _window_map. Each SDLRuntime drains its own queue.
+Between bursts the pump blocks in SDL_WaitEventTimeout rather than polling.
+While only one window is open there is nobody to route between, so that
+runtime pumps SDL inline from run() and the pump thread is not started.
 """
 
 from __future__ import annotations
 
 import ctypes
-import queue
 import signal
 import threading
 import time
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, Callable
 
 from pytoui._osdbuf import FrameBuffer
 from pytoui._platform import (
@@ -23,10 +26,21 @@ from pytoui._platform import (
     _UI_RT_FPS,
     _UI_RT_SDL_MAX_DELAY,
 )
-from pytoui.base_runtime import _CHECKER_SIZE, _SCROLL_LINE_PX, BaseRuntime, any_dirty
-from pytoui.hid import MOUSE_LEFT_ID, MOUSE_MIDDLE_ID, MOUSE_RIGHT_ID
+from pytoui.base_runtime import (
+    _CHECKER_SIZE,
+    _SCROLL_LINE_PX,
+    BaseRuntime,
+    _DamageTracker,
+    any_dirty,
+)
+from pytoui.hid import (
+    MOUSE_LEFT_ID,
+    MOUSE_MIDDLE_ID,
+    MOUSE_RIGHT_ID,
+    _build_sdl_map,
+    _sdl_mods_to_set,
+)
 from pytoui.ui._draw import _tick, _tick_delays
-from pytoui.ui._types import Rect
 
 if TYPE_CHECKING:
     from pytoui.ui._view import _ViewInternals
@@ -42,9 +56,18 @@ __all__ = ("SDLRuntime",)
 # window_id → SDLRuntime; all access protected by _wmap_lock
 _window_map: dict[int, SDLRuntime] = {}
 _wmap_lock = threading.Lock()
+# Read-only copy of _window_map, rebound under _wmap_lock on every
+# (un)register.  The pump reads it without the lock: rebinding a module
+# global is atomic and the dict itself is never mutated after publishing.
+_window_snapshot: dict[int, SDLRuntime] = {}
 _pump_thread: threading.Thread | None = None
 # Set to request the pump to exit; cleared before starting a new pump.
 _pump_stop_event = threading.Event()
+# Events pulled from SDL's queue per SDL_PeepEvents call.
+_PEEP_BATCH = 32
+# Held by a lone runtime while it pumps SDL from its own run() loop, so a
+# second window can take pumping away without two threads in SDL at once.
+_inline_lock = threading.Lock()
 
 
 def _stop_pump() -> None:
@@ -62,16 +85,33 @@ def _stop_pump() -> None:
     _pump_stop_event.clear()
 
 
+def _suspend_inline_pump() -> None:
+    """Take SDL pumping away from a lone runtime's run() loop.
+
+    Called alongside _stop_pump() before creating another window; once the
+    lock is ours no inline pump is mid-call, and the flag keeps it from
+    starting again.  _register_runtime() then starts the pump thread.
+    """
+    with _inline_lock:
+        for rt in _window_snapshot.values():
+            rt._inline_pump = False
+
+
 def _register_runtime(rt: SDLRuntime) -> None:
-    global _pump_thread
+    global _pump_thread, _window_snapshot
     with _wmap_lock:
-        if not _window_map:
+        first = not _window_map
+        if first:
             # Flush any stale SDL_QUIT events left over from the previous window's
             # destruction (SDL_DestroyWindow can push SDL_QUIT when the last window
             # closes, which would immediately dismiss a newly-presented window).
             rt._sdl2.SDL_FlushEvent(rt._sdl2.SDL_QUIT)
         _window_map[rt.window_id] = rt
-        if _pump_thread is None or not _pump_thread.is_alive():
+        _window_snapshot = dict(_window_map)
+        pump_alive = _pump_thread is not None and _pump_thread.is_alive()
+        if first and not pump_alive:
+            rt._inline_pump = True
+        elif not pump_alive:
             _pump_thread = threading.Thread(
                 target=_pump_loop,
                 args=(rt._sdl2,),
@@ -82,123 +122,181 @@ def _register_runtime(rt: SDLRuntime) -> None:
 
 
 def _unregister_sdl_runtime(rt: SDLRuntime) -> None:
+    global _window_snapshot
     with _wmap_lock:
         _window_map.pop(rt.window_id, None)
+        _window_snapshot = dict(_window_map)
+
+
+class _EventSource:
+    """Reusable SDL_Event buffers plus the routing table for one pumping thread."""
+
+    __slots__ = ("_sdl2", "_event", "_event_ref", "_batch", "_routes")
+
+    def __init__(self, sdl2):
+        self._sdl2 = sdl2
+        self._event = sdl2.SDL_Event()
+        self._event_ref = ctypes.byref(self._event)
+        self._batch = (sdl2.SDL_Event * _PEEP_BATCH)()
+        self._routes = _build_routes(sdl2)
+
+    def wait(self, timeout_ms: int) -> None:
+        """Block until an event arrives or *timeout_ms* passes, then drain."""
+        sdl2 = self._sdl2
+        if sdl2.SDL_WaitEventTimeout(self._event_ref, timeout_ms):
+            event = self._event
+            route = self._routes.get(event.type)
+            if route is not None:
+                route(sdl2, event)
+            self.drain()
+
+    def drain(self) -> None:
+        """Route everything SDL has queued without blocking.
+
+        Pumps once, then pulls the backlog in batches rather than paying a
+        pump + single-event peep per SDL_PollEvent call.
+        """
+        sdl2 = self._sdl2
+        routes = self._routes
+        batch = self._batch
+        peep = sdl2.SDL_PeepEvents
+        get_event = sdl2.SDL_GETEVENT
+        first, last = sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT
+        sdl2.SDL_PumpEvents()
+        while True:
+            n = peep(batch, _PEEP_BATCH, get_event, first, last)
+            for i in range(n):
+                ev = batch[i]
+                route = routes.get(ev.type)
+                if route is not None:
+                    route(sdl2, ev)
+            if n < _PEEP_BATCH:
+                break
 
 
 def _pump_loop(sdl2) -> None:
     """Single thread that polls SDL events and routes them to per-window queues."""
-    event = sdl2.SDL_Event()
+    source = _EventSource(sdl2)
     while True:
         if _pump_stop_event.is_set():
             return
-        with _wmap_lock:
-            if not _window_map:
-                break
-        while sdl2.SDL_PollEvent(ctypes.byref(event)):
-            _route_event(sdl2, event)
-        time.sleep(0.001)
-
-
-def _route_event(sdl2, event) -> None:
+        if not _window_snapshot:
+            break
+        # Block inside SDL until input arrives; the timeout only bounds how
+        # long a stop request or an empty window map can go unnoticed.
+        source.wait(_UI_RT_SDL_MAX_DELAY)
+
+
+def _build_routes(sdl2) -> dict[int, Callable]:
+    """Map SDL event types to their router; one dict lookup per event
+    replaces a chain of sdl2 attribute loads and comparisons."""
+    return {
+        sdl2.SDL_QUIT: _route_quit,
+        sdl2.SDL_WINDOWEVENT: _route_window,
+        sdl2.SDL_MOUSEBUTTONDOWN: _route_mouse_button,
+        sdl2.SDL_MOUSEBUTTONUP: _route_mouse_button,
+        sdl2.SDL_MOUSEMOTION: _route_mouse_motion,
+        sdl2.SDL_FINGERDOWN: _route_finger,
+        sdl2.SDL_FINGERUP: _route_finger,
+        sdl2.SDL_FINGERMOTION: _route_finger,
+        sdl2.SDL_MOUSEWHEEL: _route_mouse_wheel,
+        sdl2.SDL_KEYDOWN: _route_key_down,
+    }
+
+
+# Quit and window-close only stop the run() loop, so flip the flag here
+# rather than round-tripping through the queue; the wake makes an idle
+# loop notice it immediately.
+def _route_quit(sdl2, event) -> None:
+    for rt in _window_snapshot.values():
+        rt.running = False
+        rt._wake.set()
+
+
+def _route_window(sdl2, event) -> None:
+    wid = event.window.windowID
+    if event.window.event == sdl2.SDL_WINDOWEVENT_CLOSE:
+        rt = _window_snapshot.get(wid)
+        if rt is not None:
+            rt.running = False
+            rt._wake.set()
+    elif event.window.event == sdl2.SDL_WINDOWEVENT_SIZE_CHANGED:
+        _send(wid, ("window_resize", event.window.data1, event.window.data2))
+    elif event.window.event == sdl2.SDL_WINDOWEVENT_FOCUS_GAINED:
+        # On Wayland the compositor may swallow the click that focuses the
+        # window, so SDL_MOUSEBUTTONDOWN never arrives.  Read the current
+        # mouse state right now (user is still holding the button) and
+        # pass it along so the dispatch side can synthesize the event.
+        x, y = ctypes.c_int(0), ctypes.c_int(0)
+        state = sdl2.SDL_GetMouseState(ctypes.byref(x), ctypes.byref(y))
+        _send(wid, ("focus_gained", int(state), int(x.value), int(y.value)))
+    else:
+        _send(wid, ("windowevent", event.window.event))
+
+
+def _route_mouse_button(sdl2, event) -> None:
+    b = event.button
+    kind = "mousedown" if event.type == sdl2.SDL_MOUSEBUTTONDOWN else "mouseup"
+    _send(b.windowID, (kind, b.button, b.x, b.y))
+
+
+def _route_mouse_motion(sdl2, event) -> None:
+    m = event.motion
+    _send(m.windowID, ("mousemove", m.state, m.x, m.y))
+
+
+def _route_finger(sdl2, event) -> None:
+    f = event.tfinger
     t = event.type
-
-    if t == sdl2.SDL_QUIT:
-        with _wmap_lock:
-            targets = list(_window_map.values())
-        for rt in targets:
-            rt._event_queue.put(("quit",))
-        return
-
-    if t == sdl2.SDL_WINDOWEVENT:
-        wid = event.window.windowID
-        if event.window.event == sdl2.SDL_WINDOWEVENT_CLOSE:
-            _send(wid, ("window_close",))
-        elif event.window.event == sdl2.SDL_WINDOWEVENT_SIZE_CHANGED:
-            _send(wid, ("window_resize", event.window.data1, event.window.data2))
-        elif event.window.event == sdl2.SDL_WINDOWEVENT_FOCUS_GAINED:
-            # On Wayland the compositor may swallow the click that focuses the
-            # window, so SDL_MOUSEBUTTONDOWN never arrives.  Read the current
-            # mouse state right now (user is still holding the button) and
-            # pass it along so the dispatch side can synthesize the event.
-            x, y = ctypes.c_int(0), ctypes.c_int(0)
-            state = sdl2.SDL_GetMouseState(ctypes.byref(x), ctypes.byref(y))
-            _send(wid, ("focus_gained", int(state), int(x.value), int(y.value)))
-        else:
-            _send(wid, ("windowevent", event.window.event))
-    elif t == sdl2.SDL_MOUSEBUTTONDOWN:
-        wid = event.button.windowID
-        _send(wid, ("mousedown", event.button.button, event.button.x, event.button.y))
-    elif t == sdl2.SDL_MOUSEBUTTONUP:
-        wid = event.button.windowID
-        _send(wid, ("mouseup", event.button.button, event.button.x, event.button.y))
-    elif t == sdl2.SDL_MOUSEMOTION:
-        wid = event.motion.windowID
-        _send(wid, ("mousemove", event.motion.state, event.motion.x, event.motion.y))
+    if t == sdl2.SDL_FINGERMOTION:
+        kind = "fingermotion"
     elif t == sdl2.SDL_FINGERDOWN:
-        wid = event.tfinger.windowID
-        _send(
-            wid,
-            (
-                "fingerdown",
-                int(event.tfinger.fingerId),
-                float(event.tfinger.x),
-                float(event.tfinger.y),
-            ),
-        )
-    elif t == sdl2.SDL_FINGERUP:
-        wid = event.tfinger.windowID
-        _send(
-            wid,
-            (
-                "fingerup",
-                int(event.tfinger.fingerId),
-                float(event.tfinger.x),
-                float(event.tfinger.y),
-            ),
-        )
-    elif t == sdl2.SDL_FINGERMOTION:
-        wid = event.tfinger.windowID
-        _send(
-            wid,
-            (
-                "fingermotion",
-                int(event.tfinger.fingerId),
-                float(event.tfinger.x),
-                float(event.tfinger.y),
-            ),
-        )
-    elif t == sdl2.SDL_MOUSEWHEEL:
-        wid = event.wheel.windowID
-        # SDL 2.0.18+ exposes preciseX/Y (float, already in "lines" with sub-line
-        # precision — suitable for smooth trackpad scroll).  Older SDL has only
-        # the integer x/y fields.  We pass an is_precise flag so the dispatch
-        # side knows whether to multiply by _SCROLL_LINE_PX.
-        try:
-            dx = float(event.wheel.preciseX)
-            dy = float(event.wheel.preciseY)
-        except AttributeError:
-            dx = float(event.wheel.x)
-            dy = float(event.wheel.y)
-        if event.wheel.direction == sdl2.SDL_MOUSEWHEEL_FLIPPED:
-            dx, dy = -dx, -dy
-        _send(wid, ("mousewheel", dx, dy))
-    elif t == sdl2.SDL_KEYDOWN:
-        wid = event.key.windowID
-        _send(wid, ("keydown", event.key.keysym.sym, int(event.key.keysym.mod)))
+        kind = "fingerdown"
+    else:
+        kind = "fingerup"
+    _send(f.windowID, (kind, int(f.fingerId), float(f.x), float(f.y)))
+
+
+def _route_mouse_wheel(sdl2, event) -> None:
+    wheel = event.wheel
+    # SDL 2.0.18+ exposes preciseX/Y (float, already in "lines" with sub-line
+    # precision — suitable for smooth trackpad scroll).  Older SDL has only
+    # the integer x/y fields.  We pass an is_precise flag so the dispatch
+    # side knows whether to multiply by _SCROLL_LINE_PX.
+    try:
+        dx = float(wheel.preciseX)
+        dy = float(wheel.preciseY)
+    except AttributeError:
+        dx = float(wheel.x)
+        dy = float(wheel.y)
+    if wheel.direction == sdl2.SDL_MOUSEWHEEL_FLIPPED:
+        dx, dy = -dx, -dy
+    _send(wheel.windowID, ("mousewheel", dx, dy))
+
+
+def _route_key_down(sdl2, event) -> None:
+    key = event.key
+    _send(key.windowID, ("keydown", key.keysym.sym, int(key.keysym.mod)))
 
 
 def _send(wid: int, msg: tuple) -> None:
-    with _wmap_lock:
-        rt = _window_map.get(wid)
+    rt = _window_snapshot.get(wid)
     if rt is not None:
-        rt._event_queue.put(msg)
+        rt._event_queue.append(msg)
+        rt._wake.set()
 
 
 # ---------------------------------------------------------------------------
 # SDLRuntime
 # ---------------------------------------------------------------------------
 
+# The texture is created STATIC while redraws are rare and STREAMING while
+# they are frequent.  The redraw rate is an EMA of per-frame redraw flags;
+# the gap between the two thresholds keeps it from flapping.
+_REDRAW_EMA = 0.05
+_STATIC_BELOW = 0.1
+_STREAMING_ABOVE = 0.5
+
 
 class SDLRuntime(BaseRuntime):
     _sdl_ref_count = 0
@@ -213,13 +311,40 @@ class SDLRuntime(BaseRuntime):
         import sdl2  # type: ignore[import-untyped]
 
         self._sdl2 = sdl2
-        self.running = False
+        # Cleared by the pump thread on quit/close, possibly before run()
+        # starts, so run() must not reset it.
+        self.running = True
 
         self._current_w = width
         self._current_h = height
-
-        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Set by the window_resize handler; run() rebuilds the framebuffer
+        # and texture once per burst instead of comparing sizes every frame.
+        self._resized = False
+
+        # Filled by the pump thread, drained by run(); deque append/popleft are
+        # atomic under the GIL, so no lock is taken per event.
+        self._event_queue: deque[tuple] = deque()
+        # Set by the pump after queueing an event so an idle run() loop
+        # wakes immediately instead of sleeping out its frame delay.
+        self._wake = threading.Event()
+        # True while this is the only window and run() pumps SDL itself;
+        # set by _register_runtime(), cleared by _suspend_inline_pump().
+        self._inline_pump = False
         self._cursor_pos: tuple[float, float] = (0.0, 0.0)
+        # SDL constants used per event, resolved once instead of through
+        # sdl2 module attribute loads on every dispatch.
+        self._button_ids = {
+            sdl2.SDL_BUTTON_LEFT: MOUSE_LEFT_ID,
+            sdl2.SDL_BUTTON_RIGHT: MOUSE_RIGHT_ID,
+            sdl2.SDL_BUTTON_MIDDLE: MOUSE_MIDDLE_ID,
+        }
+        self._button_masks = (
+            (sdl2.SDL_BUTTON_LMASK, MOUSE_LEFT_ID),
+            (sdl2.SDL_BUTTON_RMASK, MOUSE_RIGHT_ID),
+            (sdl2.SDL_BUTTON_MMASK, MOUSE_MIDDLE_ID),
+        )
+        self._window_leave = sdl2.SDL_WINDOWEVENT_LEAVE
+        self._sdlk_escape = sdl2.SDLK_ESCAPE
 
         with SDLRuntime._sdl_lock:
             if SDLRuntime._sdl_ref_count == 0:
@@ -240,6 +365,7 @@ class SDLRuntime(BaseRuntime):
         # calling them concurrently from different threads causes a hang.
         # _register_runtime() below restarts the pump after the window is ready.
         _stop_pump()
+        _suspend_inline_pump()
 
         self.window = sdl2.SDL_CreateWindow(
             root_view._name.encode(),
@@ -255,23 +381,39 @@ class SDLRuntime(BaseRuntime):
             -1,
             sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_PRESENTVSYNC,
         )
-        self.texture = sdl2.SDL_CreateTexture(
-            self.renderer,
-            sdl2.SDL_PIXELFORMAT_ABGR8888,
+        self.texture = None
+        # The texture is sized once to cover the display (or the window, if
+        # larger) and only the top-left w x h region is uploaded and copied,
+        # so ordinary resizes never recreate it.
+        bounds = sdl2.SDL_Rect()
+        sdl2.SDL_GetDisplayBounds(0, ctypes.byref(bounds))
+        self._create_texture(
+            max(width, bounds.w),
+            max(height, bounds.h),
             sdl2.SDL_TEXTUREACCESS_STREAMING,
-            width,
-            height,
         )
-        sdl2.SDL_SetTextureBlendMode(self.texture, sdl2.SDL_BLENDMODE_BLEND)
-        self._texture_w = width
-        self._texture_h = height
-        # Pre-allocate pixel buffer at 4K max to avoid reallocation on resize.
-        # The GPU texture is recreated at actual window size on resize.
-        _max_pixels = 3840 * 2160
-        self.pixel_data = (ctypes.c_ubyte * (_max_pixels * 4))()
+        # The pixel buffer starts at the window size and only grows when a
+        # resize needs more room; shrinking keeps the larger buffer.
+        self._pixel_cap = width * height * 4
+        self.pixel_data = (ctypes.c_ubyte * self._pixel_cap)()
 
         _register_runtime(self)
 
+    def _create_texture(self, w: int, h: int, access: int) -> None:
+        """(Re)create the window texture; its contents start undefined."""
+        sdl2 = self._sdl2
+        if self.texture is not None:
+            sdl2.SDL_DestroyTexture(self.texture)
+        self.texture = sdl2.SDL_CreateTexture(
+            self.renderer, sdl2.SDL_PIXELFORMAT_ABGR8888, access, w, h
+        )
+        # Every frame is opaque (checkerboard or an opaque root underneath),
+        # so the copy replaces the backbuffer outright: no blending and no
+        # RenderClear beforehand.
+        sdl2.SDL_SetTextureBlendMode(self.texture, sdl2.SDL_BLENDMODE_NONE)
+        self._texture_w, self._texture_h = w, h
+        self._texture_access = access
+
     @property
     def current_size(self) -> tuple[int, int]:
         return (self._current_w, self._current_h)
@@ -289,29 +431,60 @@ class SDLRuntime(BaseRuntime):
     # Event dispatch (from per-window queue)
     # ------------------------------------------------------------------
 
+    def _pump_inline(self, source: _EventSource, timeout_ms: int) -> bool:
+        """Pump SDL from run() while this is the only window.
+
+        Events are routed into this runtime's own queue exactly as the pump
+        thread would, so dispatch has a single code path.  With *timeout_ms*
+        the call blocks in SDL until input arrives.  Returns False once
+        another window has taken pumping over.
+        """
+        with _inline_lock:
+            if not self._inline_pump:
+                return False
+            if timeout_ms:
+                source.wait(timeout_ms)
+            else:
+                source.drain()
+        return True
+
     def _dispatch_queued_events(self):
         sdl2 = self._sdl2
-        while True:
-            try:
-                msg = self._event_queue.get_nowait()
-            except queue.Empty:
-                break
-            match msg[0]:
-                case "quit" | "window_close":
-                    self.running = False
+        # Motion is coalesced per source (None = mouse, else finger id) so a
+        # burst of moves costs one dispatch; any other event flushes first to
+        # keep down/move/up ordering intact.
+        motion: dict[int | None, tuple] = {}
+        # Drain only what was queued when the frame started; events the pump
+        # adds meanwhile wait for the next frame instead of extending this one.
+        pending = len(self._event_queue)
+        if not pending:
+            return
+        popleft = self._event_queue.popleft
+        for _ in range(pending):
+            msg = popleft()
+            kind = msg[0]
+            if kind == "mousemove":
+                motion[None] = msg
+                continue
+            if kind == "fingermotion":
+                motion[msg[1]] = msg
+                continue
+            if motion:
+                self._dispatch_motion(motion)
+                motion.clear()
+            match kind:
                 case "keydown":
                     sym, mod = msg[1], msg[2]
-                    from pytoui.hid import _build_sdl_map, _sdl_mods_to_set
-
                     key_str = _build_sdl_map(sdl2).get(sym, "")
                     handled = False
                     if key_str:
                         mods = _sdl_mods_to_set(sdl2, mod)
                         handled = self._key_down(key_str, mods)
-                    if sym == sdl2.SDLK_ESCAPE and not handled:
+                    if sym == self._sdlk_escape and not handled:
                         self.running = False
                 case "window_resize":
                     self._current_w, self._current_h = msg[1], msg[2]
+                    self._resized = True
                 case "focus_gained":
                     # Synthesize mousedown(s) for any buttons pressed during
                     # focus gain.  On Wayland the compositor often swallows
@@ -319,52 +492,21 @@ class SDLRuntime(BaseRuntime):
                     # _mouse_down ignores duplicates (button already held),
                     # so this is safe on compositors that DO deliver the event.
                     state, mx, my = msg[1], float(msg[2]), float(msg[3])
-                    if (
-                        state & sdl2.SDL_BUTTON_LMASK
-                    ) and MOUSE_LEFT_ID not in self._held_mouse_buttons:
-                        self._mouse_down(mx, my, MOUSE_LEFT_ID)
-                    if (
-                        state & sdl2.SDL_BUTTON_RMASK
-                    ) and MOUSE_RIGHT_ID not in self._held_mouse_buttons:
-                        self._mouse_down(mx, my, MOUSE_RIGHT_ID)
-                    if (
-                        state & sdl2.SDL_BUTTON_MMASK
-                    ) and MOUSE_MIDDLE_ID not in self._held_mouse_buttons:
-                        self._mouse_down(mx, my, MOUSE_MIDDLE_ID)
+                    for mask, bid in self._button_masks:
+                        if state & mask and bid not in self._held_mouse_buttons:
+                            self._mouse_down(mx, my, bid)
                 case "windowevent":
-                    if msg[1] == sdl2.SDL_WINDOWEVENT_LEAVE:
+                    if msg[1] == self._window_leave:
                         for bid in (MOUSE_LEFT_ID, MOUSE_RIGHT_ID, MOUSE_MIDDLE_ID):
                             self._mouse_cancel(bid)
                 case "mousedown":
-                    match msg[1]:
-                        case sdl2.SDL_BUTTON_LEFT:
-                            self._mouse_down(msg[2], msg[3], MOUSE_LEFT_ID)
-                        case sdl2.SDL_BUTTON_RIGHT:
-                            self._mouse_down(msg[2], msg[3], MOUSE_RIGHT_ID)
-                        case sdl2.SDL_BUTTON_MIDDLE:
-                            self._mouse_down(msg[2], msg[3], MOUSE_MIDDLE_ID)
+                    bid = self._button_ids.get(msg[1])
+                    if bid is not None:
+                        self._mouse_down(msg[2], msg[3], bid)
                 case "mouseup":
-                    match msg[1]:
-                        case sdl2.SDL_BUTTON_LEFT:
-                            self._mouse_up(msg[2], msg[3], MOUSE_LEFT_ID)
-                        case sdl2.SDL_BUTTON_RIGHT:
-                            self._mouse_up(msg[2], msg[3], MOUSE_RIGHT_ID)
-                        case sdl2.SDL_BUTTON_MIDDLE:
-                            self._mouse_up(msg[2], msg[3], MOUSE_MIDDLE_ID)
-                case "mousemove":
-                    self._cursor_pos = (float(msg[2]), float(msg[3]))
-                    any_drag = False
-                    if msg[1] & sdl2.SDL_BUTTON_LMASK:
-                        self._mouse_dragged(msg[2], msg[3], MOUSE_LEFT_ID)
-                        any_drag = True
-                    if msg[1] & sdl2.SDL_BUTTON_RMASK:
-                        self._mouse_dragged(msg[2], msg[3], MOUSE_RIGHT_ID)
-                        any_drag = True
-                    if msg[1] & sdl2.SDL_BUTTON_MMASK:
-                        self._mouse_dragged(msg[2], msg[3], MOUSE_MIDDLE_ID)
-                        any_drag = True
-                    if not any_drag:
-                        self._mouse_moved(msg[2], msg[3])
+                    bid = self._button_ids.get(msg[1])
+                    if bid is not None:
+                        self._mouse_up(msg[2], msg[3], bid)
                 case "mousewheel":
                     dx, dy = msg[1] * _SCROLL_LINE_PX, msg[2] * _SCROLL_LINE_PX
                     cx, cy = self._cursor_pos
@@ -375,22 +517,71 @@ class SDLRuntime(BaseRuntime):
                 case "fingerup":
                     fid, nx, ny = msg[1], msg[2], msg[3]
                     self._touch_up(nx * self._current_w, ny * self._current_h, fid)
-                case "fingermotion":
-                    fid, nx, ny = msg[1], msg[2], msg[3]
-                    self._touch_move(nx * self._current_w, ny * self._current_h, fid)
+        if motion:
+            self._dispatch_motion(motion)
+
+    def _dispatch_motion(self, motion: dict[int | None, tuple]) -> None:
+        """Deliver the latest coalesced mousemove/fingermotion per source."""
+        for msg in motion.values():
+            if msg[0] == "fingermotion":
+                fid = msg[1]
+                x, y = msg[2] * self._current_w, msg[3] * self._current_h
+                # A move back onto the last delivered point carries no motion.
+                if self._last_pos.get(fid) != (x, y):
+                    self._touch_move(x, y, fid)
+                continue
+            state, mx, my = msg[1], msg[2], msg[3]
+            self._cursor_pos = (float(mx), float(my))
+            any_drag = False
+            for mask, bid in self._button_masks:
+                if state & mask:
+                    self._mouse_dragged(mx, my, bid)
+                    any_drag = True
+            if not any_drag:
+                self._mouse_moved(mx, my)
 
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
 
     def run(self):
-        self.running = True
         sdl2 = self._sdl2
+        # PySDL2 already declares argtypes/restype for these; binding them once
+        # keeps the frame loop off the sdl2 module attribute lookups.
+        update_texture = sdl2.SDL_UpdateTexture
+        render_copy = sdl2.SDL_RenderCopy
+        render_present = sdl2.SDL_RenderPresent
+        wake_wait = self._wake.wait
+        wake_clear = self._wake.clear
+        idle_timeout = _UI_RT_SDL_MAX_DELAY / 1000
+        # Used only while this runtime pumps SDL inline (lone window).
+        source = _EventSource(sdl2)
         _fps_frame_count = 0
-        _fps_last_t = time.time()
+        _fps_last_t = time.monotonic()
+        # Frame time is monotonic (animations, delays, update_interval);
+        # touch timestamps stay wall-clock ms, derived from it via a fixed
+        # offset instead of a second clock read per frame.
+        wall_offset = time.time() - _fps_last_t
+        # Redraw frames are paced against a monotonic deadline: a frame that
+        # ran long sleeps nothing, and one that finished early (no vsync)
+        # sleeps only the remainder of the period.
+        frame_period = _UI_RT_SDL_MAX_DELAY / 1000
+        monotonic = time.monotonic
+        next_frame = monotonic() + frame_period
 
         fb = FrameBuffer(self.pixel_data, self.width, self.height)
         fb.antialias = _UI_ANTIALIAS
+        # Only the part of the frame the root's children changed is uploaded.
+        damage = _DamageTracker()
+        upload_rect = sdl2.SDL_Rect()
+        upload_rect_ref = ctypes.byref(upload_rect)
+        # Visible region of the (display-sized) texture.
+        src_rect = sdl2.SDL_Rect(0, 0, self.width, self.height)
+        src_rect_ref = ctypes.byref(src_rect)
+        pixel_addr = ctypes.addressof(self.pixel_data)
+        static_access = sdl2.SDL_TEXTUREACCESS_STATIC
+        streaming_access = sdl2.SDL_TEXTUREACCESS_STREAMING
+        redraw_rate = 1.0
         old_sigint = None
         try:
             old_sigint = signal.signal(
@@ -401,7 +592,8 @@ class SDLRuntime(BaseRuntime):
             pass
         try:
             while self.running and self.root.pytoui_presented:
-                now = time.time()
+                now = monotonic()
+                self._frame_time_ms = int((now + wall_offset) * 1000)
 
                 if _UI_RT_FPS:
                     _fps_frame_count += 1
@@ -411,67 +603,103 @@ class SDLRuntime(BaseRuntime):
                         _fps_frame_count = 0
                         _fps_last_t = now
 
+                if self._inline_pump:
+                    self._pump_inline(source, 0)
                 self._dispatch_queued_events()
                 self._update_hierarchy(self.root, now)
                 _tick(now)
                 _tick_delays(now)
 
                 w, h = self._current_w, self._current_h
-                if fb._width != w or fb._height != h:
-                    FrameBuffer._lib.DestroyFrameBuffer(fb._handle)
-                    fb._handle = 0
-                    fb = FrameBuffer(self.pixel_data, w, h)
-                    fb.antialias = _UI_ANTIALIAS
-                    self.width, self.height = w, h
-                    rf = self.root.frame
-                    self.root.frame = Rect(rf.x, rf.y, float(w), float(h))
-
-                if self._texture_w != w or self._texture_h != h:
-                    sdl2.SDL_DestroyTexture(self.texture)
-                    self.texture = sdl2.SDL_CreateTexture(
-                        self.renderer,
-                        sdl2.SDL_PIXELFORMAT_ABGR8888,
-                        sdl2.SDL_TEXTUREACCESS_STREAMING,
-                        w,
-                        h,
-                    )
-                    sdl2.SDL_SetTextureBlendMode(self.texture, sdl2.SDL_BLENDMODE_BLEND)
-                    self._texture_w, self._texture_h = w, h
+                if self._resized:
+                    self._resized = False
+                    damage.reset()
+                    if fb._width != w or fb._height != h:
+                        if w * h * 4 > self._pixel_cap:
+                            self._pixel_cap = w * h * 4
+                            self.pixel_data = (ctypes.c_ubyte * self._pixel_cap)()
+                            pixel_addr = ctypes.addressof(self.pixel_data)
+                        fb.resize(self.pixel_data, w, h)
+                        self.width, self.height = w, h
+                        rf = self.root.frame()
+                        self.root.setFrame_((rf.x, rf.y, float(w), float(h)))
+
+                    src_rect.w, src_rect.h = w, h
+                    # Only a window larger than the display (e.g. moved to a
+                    # bigger monitor) outgrows the texture.
+                    if w > self._texture_w or h > self._texture_h:
+                        self._create_texture(
+                            max(w, self._texture_w),
+                            max(h, self._texture_h),
+                            self._texture_access,
+                        )
 
                 needs_redraw = any_dirty(self.root)
+                redraw_rate += _REDRAW_EMA * (needs_redraw - redraw_rate)
 
                 if needs_redraw:
-                    bg = self.root._background_color
-                    if bg is None or bg[3] < 1.0:
+                    # Switch access modes only on a redraw frame, so the new
+                    # (undefined) texture gets a full upload right away.
+                    if redraw_rate < _STATIC_BELOW:
+                        access = static_access
+                    elif redraw_rate > _STREAMING_ABOVE:
+                        access = streaming_access
+                    else:
+                        access = self._texture_access
+                    if access != self._texture_access:
+                        self._create_texture(self._texture_w, self._texture_h, access)
+                        damage.reset()
+                    dirty = damage.dirty_children(self.root)
+                    # An opaque root overwrites every pixel anyway.
+                    if not self.root.isOpaque():
                         fb.draw_checkerboard(_CHECKER_SIZE)
                     self.render_fn(fb)
 
-                    src_rect = sdl2.rect.SDL_Rect(0, 0, w, h)
-                    sdl2.SDL_UpdateTexture(
-                        self.texture,
-                        ctypes.byref(src_rect),
-                        self.pixel_data,
-                        w * 4,
-                    )
-                    sdl2.SDL_RenderClear(self.renderer)
-                    sdl2.SDL_RenderCopy(
-                        self.renderer,
-                        self.texture,
-                        ctypes.byref(src_rect),
-                        None,
-                    )
-                    sdl2.SDL_RenderPresent(self.renderer)
+                    # pixel_data rows are w * 4 bytes, so a damaged band
+                    # uploads from its first pixel with the full-row pitch
+                    # into the same place in the texture's visible region.
+                    area = damage.damage(self.root, dirty, w, h)
+                    if area is not None:
+                        x, y, dw, dh = area
+                        pitch = w * 4
+                        if dw == w and dh == h:
+                            rect_ref = src_rect_ref
+                        else:
+                            upload_rect.x, upload_rect.y = x, y
+                            upload_rect.w, upload_rect.h = dw, dh
+                            rect_ref = upload_rect_ref
+                        update_texture(
+                            self.texture,
+                            rect_ref,
+                            pixel_addr + y * pitch + x * 4,
+                            pitch,
+                        )
+                    render_copy(self.renderer, self.texture, src_rect_ref, None)
+                    render_present(self.renderer)
+
+                    t = monotonic()
+                    if next_frame - t > 0.001:
+                        time.sleep(next_frame - t)
+                        t = next_frame
+                    # Never schedule in the past: a late frame resets the
+                    # deadline rather than letting later frames run back to back.
+                    next_frame = max(next_frame, t) + frame_period
 
                 else:
-                    sdl2.SDL_Delay(_UI_RT_SDL_MAX_DELAY)
+                    # Timers and animations still need a frame at least every
+                    # idle_timeout; input ends the wait early.
+                    if not (
+                        self._inline_pump
+                        and self._pump_inline(source, _UI_RT_SDL_MAX_DELAY)
+                    ):
+                        wake_wait(idle_timeout)
+                    wake_clear()
         except KeyboardInterrupt:
             pass  # safety net if signal.signal was unavailable
         finally:
             if old_sigint is not None:
                 signal.signal(signal.SIGINT, old_sigint)
-            if fb._handle > 0:
-                FrameBuffer._lib.DestroyFrameBuffer(fb._handle)
-                fb._handle = 0
+            fb.release()
 
         self._cleanup()
         self.root.close()
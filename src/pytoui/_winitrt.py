@@ -15,8 +15,15 @@ from pytoui._platform import (
     _UI_ANTIALIAS,
     _UI_DISABLE_WINIT_CSD,
     _UI_RT_FPS,
+    _UI_RT_SDL_MAX_DELAY,
+)
+from pytoui.base_runtime import (
+    _CHECKER_SIZE,
+    _SCROLL_LINE_PX,
+    BaseRuntime,
+    _DamageTracker,
+    any_dirty,
 )
-from pytoui.base_runtime import _CHECKER_SIZE, _SCROLL_LINE_PX, BaseRuntime, any_dirty
 from pytoui.hid import (
     KEY_INPUT_ESC,
     MOUSE_LEFT_ID,
@@ -47,6 +54,25 @@ def _lib_filename(name: str) -> str:
 
 _LIB_PATH = str(Path(__file__).parent / _lib_filename("winitrt"))
 
+# render_callback results understood by winit_run.
+_RENDER_DREW = 0  # new pixels: copy and present them
+_RENDER_CLOSE = 1
+_RENDER_UNCHANGED = 2  # nothing redrawn: skip the copy and present
+
+
+class _FrameState(ctypes.Structure):
+    """Window geometry shared with winit_run (Rust ``FrameState``).
+
+    Rust writes it on window creation, Resized and ScaleFactorChanged,
+    just before calling resize_callback.
+    """
+
+    _fields_ = [
+        ("width", ctypes.c_uint32),  # physical pixels
+        ("height", ctypes.c_uint32),  # physical pixels
+        ("scale_factor", ctypes.c_double),  # 1.0 on non-HiDPI, >1 on HiDPI/Wayland
+    ]
+
 
 class WinitRuntime(BaseRuntime):
     """Runtime using Rust-based winit for windowing and event handling."""
@@ -55,17 +81,14 @@ class WinitRuntime(BaseRuntime):
         super().__init__(root_view, width, height, render_fn)
 
         # Use ctypes for stable memory addresses used by the shared library
-        self._width_c = ctypes.c_uint32(width)
-        self._height_c = ctypes.c_uint32(height)
-        # Scale factor written by Rust; 1.0 on non-HiDPI, >1 on HiDPI/Wayland
-        self._scale_factor_c = ctypes.c_double(1.0)
+        self._state = _FrameState(width, height, 1.0)
         # Last logical dims — avoid redundant root.frame updates
         self._last_lw: int = width
         self._last_lh: int = height
 
         # Performance Monitoring
         self._fps_frame_count = 0
-        self._fps_last_t = time.time()
+        self._fps_last_t = time.monotonic()
 
         # Pre-allocate pixel buffer (0xAARRGGBB, 4 bytes/pixel).
         # Allocate for 4K immediately to avoid reallocation on resize.
@@ -75,6 +98,17 @@ class WinitRuntime(BaseRuntime):
         # Keep FrameBuffer alive for the duration of the runtime
         self._fb: FrameBuffer | None = None
         self._cursor_pos: tuple[float, float] = (0.0, 0.0)
+        # Only the part of the frame the root's children changed is redrawn.
+        self._damage = _DamageTracker()
+        # Indexed by the native etype; see _internal_event().
+        self._event_handlers = (
+            self._on_down,
+            self._on_up,
+            self._on_move,
+            self._on_cancel,
+            self._on_scroll,
+            self._on_key,
+        )
 
         self._lib = ctypes.CDLL(_LIB_PATH)
 
@@ -83,10 +117,8 @@ class WinitRuntime(BaseRuntime):
             ctypes.c_uint32,  # initial_width
             ctypes.c_uint32,  # initial_height
             ctypes.POINTER(ctypes.c_uint32),  # pixel_ptr
-            ctypes.POINTER(ctypes.c_uint32),  # width_ptr (physical pixels)
-            ctypes.POINTER(ctypes.c_uint32),  # height_ptr (physical pixels)
-            ctypes.POINTER(ctypes.c_double),  # scale_factor_ptr (written by Rust)
-            ctypes.CFUNCTYPE(ctypes.c_int),  # render_callback -> 0=continue, 1=close
+            ctypes.POINTER(_FrameState),  # state (written by Rust)
+            ctypes.CFUNCTYPE(ctypes.c_int),  # render_callback -> _RENDER_*
             ctypes.CFUNCTYPE(
                 None,
                 ctypes.c_int,
@@ -94,6 +126,13 @@ class WinitRuntime(BaseRuntime):
                 ctypes.c_double,
                 ctypes.c_int64,
             ),  # event_callback(etype, x, y, touch_id) — coords in logical pixels
+            ctypes.CFUNCTYPE(
+                None,
+                ctypes.c_uint32,
+                ctypes.c_uint32,
+                ctypes.c_double,
+            ),  # resize_callback(width, height, scale) — physical pixels
+            ctypes.c_uint32,  # frame_interval_ms: render_callback pacing
             ctypes.c_uint8,  # decorations: 1=CSD (winit draws), 0=SSD (compositor)
             ctypes.c_char_p,  # title
         ]
@@ -107,18 +146,25 @@ class WinitRuntime(BaseRuntime):
             ctypes.c_double,
             ctypes.c_int64,
         )(self._internal_event)
+        self._resize_cb = ctypes.CFUNCTYPE(
+            None,
+            ctypes.c_uint32,
+            ctypes.c_uint32,
+            ctypes.c_double,
+        )(self._internal_resize)
 
     @property
     def _cur_width(self):
-        return self._width_c.value
+        return self._state.width
 
     @property
     def _cur_height(self):
-        return self._height_c.value
+        return self._state.height
 
     @property
     def current_size(self) -> tuple[int, int]:
-        return (self._width_c.value, self._height_c.value)
+        state = self._state
+        return (state.width, state.height)
 
     @classmethod
     def get_screen_size(cls):
@@ -136,8 +182,19 @@ class WinitRuntime(BaseRuntime):
         return (w.value, h.value)
 
     def _internal_render(self) -> int:
-        """Internal callback executed by Rust for every frame draw."""
-        now = time.time()
+        """Internal callback executed by Rust once per paced frame.
+
+        Returns _RENDER_UNCHANGED when nothing was redrawn, so Rust can skip
+        the pixel copy and present.
+        """
+        fb = self._fb
+        if fb is None:
+            return _RENDER_UNCHANGED
+        # A closed window gets no more updates or animation ticks.
+        if not self.root.pytoui_presented:
+            return _RENDER_CLOSE
+
+        now = time.monotonic()
 
         if _UI_RT_FPS:
             self._fps_frame_count += 1
@@ -147,113 +204,149 @@ class WinitRuntime(BaseRuntime):
                 self._fps_frame_count = 0
                 self._fps_last_t = now
 
+        # Keep ticking while minimised so delays and animations still finish.
         self._update_hierarchy(self.root, now)
         _tick(now)
         _tick_delays(now)
 
-        w, h = self._cur_width, self._cur_height  # physical pixels
-        if w == 0 or h == 0:
-            return 0
+        # _internal_resize keeps the framebuffer at the window's physical size.
+        w, h, scale = fb._width, fb._height, fb.scale_factor
+
+        # update() or a delayed callback above may have closed it.
+        if not self.root.pytoui_presented:
+            return _RENDER_CLOSE
+
+        if not any_dirty(self.root):
+            return _RENDER_UNCHANGED
+
+        damage = self._damage
+        # Damage is taken before rendering, so a root layout() that may move
+        # children during the render forces a full frame.
+        if self.root._needsLayout:
+            damage.reset()
+        dirty = damage.dirty_children(self.root)
+        area = damage.damage(self.root, dirty, w, h, scale)
+        if area is None:
+            if not dirty:
+                # Only the root itself was flagged: redraw rather than drop
+                # a change the tracker cannot see.
+                area = (0, 0, w, h)
+            else:
+                # Dirty, but nothing on screen changed (e.g. a culled subtree).
+                self.root._clear_dirty_tree()
+                return _RENDER_UNCHANGED
+
+        # The buffer still holds the previous frame, so a partial change
+        # redraws the checkerboard and scene only inside the damaged rect.
+        x, y, dw, dh = area
+        partial = dw != w or dh != h
+        if partial:
+            fb.gstate_push()
+            fb.clip_to_rect(x, y, dw, dh)
+        try:
+            # An opaque root overwrites every pixel anyway.
+            if not self.root.isOpaque():
+                fb.draw_checkerboard_rect(_CHECKER_SIZE, x, y, dw, dh)
+            self.render_fn(fb)
+        finally:
+            if partial:
+                fb.gstate_pop()
+        return _RENDER_DREW
+
+    def _internal_resize(self, w: int, h: int, scale: float):
+        """Internal callback from Rust when the window's physical size or
+        scale factor changes (and once before the first frame).
 
+        Resizes the framebuffer and the root view off the per-frame path.
+        """
         fb = self._fb
         if fb is None:
-            return 0
-
-        scale = self._scale_factor_c.value
+            return
         if scale <= 0.0:
             scale = 1.0
         lw = max(1, math.ceil(w / scale))
         lh = max(1, math.ceil(h / scale))
 
         if fb._width != w or fb._height != h:
-            FrameBuffer._lib.DestroyFrameBuffer(fb._handle)
-            fb._handle = 0
-            self._fb = FrameBuffer(self.pixel_data, w, h)
-            self._fb.antialias = _UI_ANTIALIAS
-            self._fb.scale_factor = scale
-            fb = self._fb
-            self._last_lw = lw
-            self._last_lh = lh
-            rf = self.root.frame()
-            self.root.setFrame_((rf.x, rf.y, float(lw), float(lh)))
-        elif lw != self._last_lw or lh != self._last_lh or fb.scale_factor != scale:
-            fb.scale_factor = scale
-            self._last_lw = lw
-            self._last_lh = lh
-            rf = self.root.frame()
-            self.root.setFrame_((rf.x, rf.y, float(lw), float(lh)))
-
-        if not self.root.pytoui_presented:
-            return 1
-
-        if not any_dirty(self.root):
-            return 0
-
-        fb.draw_checkerboard(_CHECKER_SIZE)
-        self.render_fn(fb)
-        return 0
+            fb.resize(self.pixel_data, w, h)
+        elif lw == self._last_lw and lh == self._last_lh and fb.scale_factor == scale:
+            return
+        fb.scale_factor = scale
+        self._damage.reset()
+        self._last_lw = lw
+        self._last_lh = lh
+        rf = self.root.frame()
+        self.root.setFrame_((rf.x, rf.y, float(lw), float(lh)))
 
     def _internal_event(self, etype, x, y, touch_id: int):
         """Internal callback for mouse/touch events from the native window.
 
-        etype: 0=Down, 1=Up, 2=Move, 3=Cancel/Leave, 4=Scroll
+        etype: 0=Down, 1=Up, 2=Move, 3=Cancel/Leave, 4=Scroll, 5=Key
         touch_id: -1=left mouse, -2=right mouse, -3=middle mouse,
                   >= 0=real touch fingers
         For etype=2 (CursorMoved): touch_id is always -1 regardless of buttons.
         For etype=4: x=dx, y=dy in lines (touch_id=0) or pixels (touch_id=1).
         """
-        match etype:
-            case 0:
-                if touch_id < 0:
-                    self._mouse_down(x, y, touch_id)
-                else:
-                    self._touch_down(x, y, touch_id)
-            case 1:
-                if touch_id < 0:
-                    self._mouse_up(x, y, touch_id)
-                else:
-                    self._touch_up(x, y, touch_id)
-            case 2:
-                self._cursor_pos = (x, y)
-                if touch_id < 0:
-                    any_drag = False
-                    for bid in (MOUSE_LEFT_ID, MOUSE_RIGHT_ID, MOUSE_MIDDLE_ID):
-                        if bid in self._held_mouse_buttons:
-                            self._mouse_dragged(x, y, bid)
-                            any_drag = True
-                    if not any_drag:
-                        self._mouse_moved(x, y)
-                else:
-                    self._touch_move(x, y, touch_id)
-            case 3:
-                if touch_id < 0:
-                    self._mouse_cancel(touch_id)
-                else:
-                    self._touch_cancel(touch_id)
-            case 4:
-                cx, cy = self._cursor_pos
-                # touch_id doubles as is_pixel:
-                # 0=LineDelta (lines), 1=PixelDelta (logical px)
-                if touch_id:
-                    self._scroll_event(cx, cy, x, y)
-                else:
-                    self._scroll_event(cx, cy, x * _SCROLL_LINE_PX, y * _SCROLL_LINE_PX)
-            case 5:
-                code, flags = int(x), int(y)
-                key_str = _winit_key_to_str(code)
-                mods = _winit_mods_to_set(flags)
-                handled = False
-                if key_str:
-                    handled = self._key_down(key_str, mods)
-                if not handled and key_str == KEY_INPUT_ESC:
-                    self.root.close()
+        handlers = self._event_handlers
+        if 0 <= etype < len(handlers):
+            handlers[etype](x, y, touch_id)
+
+    def _on_down(self, x, y, touch_id: int):
+        if touch_id < 0:
+            self._mouse_down(x, y, touch_id)
+        else:
+            self._touch_down(x, y, touch_id)
+
+    def _on_up(self, x, y, touch_id: int):
+        if touch_id < 0:
+            self._mouse_up(x, y, touch_id)
+        else:
+            self._touch_up(x, y, touch_id)
+
+    def _on_move(self, x, y, touch_id: int):
+        self._cursor_pos = (x, y)
+        if touch_id < 0:
+            any_drag = False
+            for bid in (MOUSE_LEFT_ID, MOUSE_RIGHT_ID, MOUSE_MIDDLE_ID):
+                if bid in self._held_mouse_buttons:
+                    self._mouse_dragged(x, y, bid)
+                    any_drag = True
+            if not any_drag:
+                self._mouse_moved(x, y)
+        else:
+            self._touch_move(x, y, touch_id)
+
+    def _on_cancel(self, x, y, touch_id: int):
+        if touch_id < 0:
+            self._mouse_cancel(touch_id)
+        else:
+            self._touch_cancel(touch_id)
+
+    def _on_scroll(self, x, y, touch_id: int):
+        cx, cy = self._cursor_pos
+        # touch_id doubles as is_pixel:
+        # 0=LineDelta (lines), 1=PixelDelta (logical px)
+        if touch_id:
+            self._scroll_event(cx, cy, x, y)
+        else:
+            self._scroll_event(cx, cy, x * _SCROLL_LINE_PX, y * _SCROLL_LINE_PX)
+
+    def _on_key(self, x, y, touch_id: int):
+        code, flags = int(x), int(y)
+        key_str = _winit_key_to_str(code)
+        mods = _winit_mods_to_set(flags)
+        handled = False
+        if key_str:
+            handled = self._key_down(key_str, mods)
+        if not handled and key_str == KEY_INPUT_ESC:
+            self.root.close()
 
     def run(self):
         """Start the runtime loop and initialize the native window."""
         self._fb = FrameBuffer(
             self.pixel_data,
-            self._width_c.value,
-            self._height_c.value,
+            self._state.width,
+            self._state.height,
         )
         self._fb.antialias = _UI_ANTIALIAS
 
@@ -267,23 +360,22 @@ class WinitRuntime(BaseRuntime):
             pass
         try:
             self._lib.winit_run(
-                self._width_c.value,
-                self._height_c.value,
+                self._state.width,
+                self._state.height,
                 self.pixel_data,
-                ctypes.byref(self._width_c),
-                ctypes.byref(self._height_c),
-                ctypes.byref(self._scale_factor_c),
+                ctypes.byref(self._state),
                 self._render_cb,
                 self._event_cb,
+                self._resize_cb,
+                _UI_RT_SDL_MAX_DELAY,
                 ctypes.c_uint8(0 if _UI_DISABLE_WINIT_CSD else 1),
                 self.root._name.encode("utf-8"),
             )
         finally:
             if old_sigint is not None:
                 signal.signal(signal.SIGINT, old_sigint)
-            if self._fb is not None and self._fb._handle > 0:
-                self._fb._lib.DestroyFrameBuffer(self._fb._handle)
-                self._fb._handle = 0
+            if self._fb is not None:
+                self._fb.release()
             self._fb = None
             self._unregister()
             self.root.close()
@@ -18,14 +18,15 @@ import time
 from typing import TYPE_CHECKING, Callable
 
 from pytoui.hid import MOUSE_LEFT_ID
-from pytoui.ui._draw import convert_point
-from pytoui.ui._types import Touch
+from pytoui.ui._draw import _internals_origin
+from pytoui.ui._types import Touch, _TouchPhase
 
 if TYPE_CHECKING:
-    from pytoui.ui._view import _View, _ViewInternals
+    from pytoui.ui._view import _ViewInternals
 
 __all__ = (
     "_CHECKER_SIZE",
+    "_DamageTracker",
     "BaseRuntime",
     "any_dirty",
     "get_runtime_for_view",
@@ -37,6 +38,13 @@ _AXIS_THRESHOLD: float = 4.0  # pixels of total movement before drag axis is res
 
 _CHECKER_SIZE = 8
 
+# Touch phases, shared by every touch/mouse event built below.
+_BEGAN: _TouchPhase = "began"
+_MOVED: _TouchPhase = "moved"
+_STATIONARY: _TouchPhase = "stationary"
+_ENDED: _TouchPhase = "ended"
+_CANCELLED: _TouchPhase = "cancelled"
+
 # id(root_view) → runtime  (used by View.become_first_responder)
 _root_to_runtime: dict[int, BaseRuntime] = {}
 
@@ -73,6 +81,19 @@ class BaseRuntime:
         # Per-window first responder
         self._first_responder: _ViewInternals | None = None
 
+        # Wall-clock ms of the frame being processed; loops that dispatch
+        # events once per frame set it so every event in the frame shares one
+        # timestamp. 0 means "not in a frame" and falls back to the clock.
+        self._frame_time_ms: int = 0
+
+        # id(view) -> (view, screen origin), valid while the view geometry
+        # generation equals _origin_gen; see _view_origin().
+        self._origin_cache: dict[int, tuple[_ViewInternals, tuple[float, float]]] = {}
+        self._origin_gen: int = -1
+        # Last hover hit: (view, x0, y0, x1, y1, geometry generation); see
+        # _hover_hit_test().
+        self._hit_cache: tuple | None = None
+
         _root_to_runtime[id(root_view)] = self
 
     @property
@@ -105,11 +126,11 @@ class BaseRuntime:
     def _find_scroll_interceptor(self, view: _ViewInternals) -> _ViewInternals | None:
         """Walk up from view and return the nearest ancestor with
         mouse_wheel_enabled=True (i.e. a ScrollView with scroll_enabled)."""
-        sv = view.superview()
+        sv = view._superview
         while sv is not None:
             if sv._pytoui_mouse_wheel_enabled:
                 return sv
-            sv = sv.superview()
+            sv = sv._superview
         return None
 
     @staticmethod
@@ -134,23 +155,110 @@ class BaseRuntime:
     # Touch handling
     # ------------------------------------------------------------------
 
+    def _view_origin(self, view: _ViewInternals) -> tuple[float, float]:
+        """Screen origin of *view*, cached until any view's geometry changes.
+
+        A drag delivers many events to the same tracked view; while nothing
+        moves, each one reuses the origin instead of walking the superview
+        chain again.
+        """
+        cache = self._origin_cache
+        gen = view._pytoui_geometry_gen
+        if gen != self._origin_gen:
+            cache.clear()
+            self._origin_gen = gen
+        else:
+            hit = cache.get(id(view))
+            if hit is not None and hit[0] is view:
+                return hit[1]
+        origin = _internals_origin(view)
+        cache[id(view)] = (view, origin)
+        return origin
+
+    def _hover_hit_test(self, x: float, y: float) -> _ViewInternals | None:
+        """pytoui_hit_test() for hover, reusing the previous result while the
+        pointer stays inside a region only that view can claim.
+
+        The region is cached only for a leaf target: its screen rect clipped
+        to every ancestor's rect, and only if no sibling hit-tested before it
+        at any level overlaps that rect.  Any geometry, stacking or hidden
+        change invalidates it.
+        """
+        gen = self.root._pytoui_geometry_gen
+        cached = self._hit_cache
+        if cached is not None:
+            view, x0, y0, x1, y1, cgen = cached
+            if cgen == gen and x0 <= x < x1 and y0 <= y < y1 and view._touch_enabled:
+                return view
+        target = self.root.pytoui_hit_test(x, y)
+        self._hit_cache = None
+        if (
+            target is not None
+            and not target._subviews
+            and not target._pytoui_internal_subviews
+        ):
+            region = self._exclusive_hit_rect(target)
+            if region is not None:
+                self._hit_cache = (target, *region, gen)
+        return target
+
+    def _exclusive_hit_rect(
+        self, view: _ViewInternals
+    ) -> tuple[float, float, float, float] | None:
+        """Screen (x0, y0, x1, y1) of *view* clipped to its ancestors, or None
+        if a sibling that hit-tests first overlaps it."""
+        ox, oy = self._view_origin(view)
+        f = view._frame
+        x0, y0, x1, y1 = ox, oy, ox + f.w, oy + f.h
+        node = view
+        parent = view._superview
+        while parent is not None:
+            # Siblings hit-tested before node: later public subviews, and for
+            # an internal subview all public ones plus later internal ones.
+            subs = parent._subviews
+            internal = parent._pytoui_internal_subviews
+            if node in subs:
+                above = subs[subs.index(node) + 1 :]
+            else:
+                above = [*subs, *internal[internal.index(node) + 1 :]]
+            px, py = self._view_origin(parent)
+            b = parent._bounds
+            ix, iy = px - b.x, py - b.y
+            for sib in above:
+                if sib._isHidden:
+                    continue
+                sf = sib._frame
+                sx, sy = ix + sf.x, iy + sf.y
+                if sx < x1 and x0 < sx + sf.w and sy < y1 and y0 < sy + sf.h:
+                    return None
+            pf = parent._frame
+            x0, y0 = max(x0, px), max(y0, py)
+            x1, y1 = min(x1, px + pf.w), min(y1, py + pf.h)
+            if x0 >= x1 or y0 >= y1:
+                return None
+            node = parent
+            parent = parent._superview
+        return x0, y0, x1, y1
+
     def _create_touch(
         self,
-        view: _View,
+        view: _ViewInternals,
         screen_x,
         screen_y,
         phase,
         touch_id,
         prev_pos,
     ) -> Touch:
-        local = convert_point((screen_x, screen_y), to_view=view)
-        prev_local = convert_point(prev_pos, to_view=view)
-        return Touch(
-            location=(local.x, local.y),
-            phase=phase,
-            prev_location=(prev_local.x, prev_local.y),
-            timestamp=int(time.time() * 1000),
-            touch_id=touch_id,
+        # Screen -> local is a pure translation; one origin serves both points.
+        ox, oy = self._view_origin(view)
+        return Touch._at(
+            screen_x - ox,
+            screen_y - oy,
+            prev_pos[0] - ox,
+            prev_pos[1] - oy,
+            phase,
+            self._frame_time_ms or time.time_ns() // 1_000_000,
+            touch_id,
         )
 
     def _touch_down(self, x, y, touch_id):
@@ -167,7 +275,7 @@ class BaseRuntime:
             scroll_began = interceptor.pytoui_touch_began
             if scroll_began:
                 scroll_began(
-                    self._create_touch(interceptor, x, y, "began", touch_id, (x, y))
+                    self._create_touch(interceptor, x, y, _BEGAN, touch_id, (x, y))
                 )
 
         target, touch_began = self._find_touch_responder(target, "pytoui_touch_began")
@@ -180,12 +288,12 @@ class BaseRuntime:
         self._tracked[touch_id] = target
         # Primary subview always gets touch_began immediately.
         # If it calls scroll_enabled=False, the interceptor is released in _touch_move.
-        touch_began(self._create_touch(target, x, y, "began", touch_id, (x, y)))
+        touch_began(self._create_touch(target, x, y, _BEGAN, touch_id, (x, y)))
 
     def _touch_move(self, x, y, touch_id):
         prev = self._last_pos.get(touch_id, (x, y))
         self._last_pos[touch_id] = (x, y)
-        phase = "moved" if (x, y) != prev else "stationary"
+        phase = _MOVED if x != prev[0] or y != prev[1] else _STATIONARY
 
         interceptor = self._scroll_tracked.get(touch_id)
         if interceptor:
@@ -222,7 +330,7 @@ class BaseRuntime:
                         if scroll_ended:
                             scroll_ended(
                                 self._create_touch(
-                                    interceptor, x, y, "cancelled", touch_id, prev
+                                    interceptor, x, y, _CANCELLED, touch_id, prev
                                 )
                             )
                         # Fall through to primary handling below.
@@ -269,7 +377,7 @@ class BaseRuntime:
             scroll_ended = interceptor.pytoui_touch_ended
             if scroll_ended:
                 current = self.root.pytoui_hit_test(x, y)
-                phase = "ended" if current is interceptor else "cancelled"
+                phase = _ENDED if current is interceptor else _CANCELLED
                 scroll_ended(
                     self._create_touch(interceptor, x, y, phase, touch_id, prev)
                 )
@@ -283,10 +391,10 @@ class BaseRuntime:
         # If the scroll view dragged, cancel the primary subview's touch.
         # Otherwise it was a tap — let it complete normally.
         if scroll_did_drag:
-            phase = "cancelled"
+            phase = _CANCELLED
         else:
             current = self.root.pytoui_hit_test(x, y)
-            phase = "ended" if current is target else "cancelled"
+            phase = _ENDED if current is target else _CANCELLED
         touch_ended(self._create_touch(target, x, y, phase, touch_id, prev))
 
     def _touch_cancel(self, touch_id):
@@ -299,7 +407,7 @@ class BaseRuntime:
             scroll_ended = interceptor.pytoui_touch_ended
             if scroll_ended:
                 scroll_ended(
-                    self._create_touch(interceptor, x, y, "cancelled", touch_id, (x, y))
+                    self._create_touch(interceptor, x, y, _CANCELLED, touch_id, (x, y))
                 )
 
         target = self._tracked.pop(touch_id, None)
@@ -309,7 +417,7 @@ class BaseRuntime:
         if not touch_ended:
             return
         touch_ended(
-            self._create_touch(target, x, y, "cancelled", touch_id, (x, y)),
+            self._create_touch(target, x, y, _CANCELLED, touch_id, (x, y)),
         )
 
     # ------------------------------------------------------------------
@@ -321,13 +429,12 @@ class BaseRuntime:
     ):
         from pytoui.ui._types import MouseEvent
 
-        local = convert_point((x, y), to_view=view.ref)
-        prev_local = convert_point(prev, to_view=view.ref)
+        ox, oy = self._view_origin(view)
         return MouseEvent(
-            location=(local.x, local.y),
+            location=(x - ox, y - oy),
             phase=phase,
-            prev_location=(prev_local.x, prev_local.y),
-            timestamp=int(time.time() * 1000),
+            prev_location=(prev[0] - ox, prev[1] - oy),
+            timestamp=self._frame_time_ms or time.time_ns() // 1_000_000,
             touch_id=button_id,
             buttons=buttons,
         )
@@ -356,7 +463,7 @@ class BaseRuntime:
                         interceptor,
                         x,
                         y,
-                        "began",
+                        _BEGAN,
                         button_id,
                         (x, y),
                         frozenset(self._held_mouse_buttons),
@@ -375,7 +482,7 @@ class BaseRuntime:
                     target,
                     x,
                     y,
-                    "began",
+                    _BEGAN,
                     button_id,
                     (x, y),
                     frozenset(self._held_mouse_buttons),
@@ -394,7 +501,7 @@ class BaseRuntime:
             scroll_cb = interceptor.pytoui_mouse_up
             if scroll_cb:
                 current = self.root.pytoui_hit_test(x, y)
-                phase = "ended" if current is interceptor else "cancelled"
+                phase = _ENDED if current is interceptor else _CANCELLED
                 scroll_cb(
                     self._create_mouse_event(
                         interceptor,
@@ -414,10 +521,10 @@ class BaseRuntime:
         if not cb:
             return
         if scroll_did_drag:
-            phase = "cancelled"
+            phase = _CANCELLED
         else:
             current = self.root.pytoui_hit_test(x, y)
-            phase = "ended" if current is target else "cancelled"
+            phase = _ENDED if current is target else _CANCELLED
         cb(
             self._create_mouse_event(
                 target,
@@ -433,7 +540,7 @@ class BaseRuntime:
     def _mouse_dragged(self, x, y, button_id: int):
         prev = self._last_pos.get(button_id, (x, y))
         self._last_pos[button_id] = (x, y)
-        phase = "moved" if (x, y) != prev else "stationary"
+        phase = _MOVED if x != prev[0] or y != prev[1] else _STATIONARY
 
         interceptor = self._scroll_tracked.get(button_id)
         if interceptor:
@@ -464,7 +571,7 @@ class BaseRuntime:
                                     interceptor,
                                     x,
                                     y,
-                                    "cancelled",
+                                    _CANCELLED,
                                     button_id,
                                     prev,
                                     frozenset(self._held_mouse_buttons),
@@ -529,7 +636,7 @@ class BaseRuntime:
         since_scroll = time.monotonic() - getattr(self, "_last_scroll_time", 0.0)
         if since_scroll < self._SCROLL_HOVER_COOLDOWN:
             return
-        target = self.root.pytoui_hit_test(x, y)
+        target = self._hover_hit_test(x, y)
         if not target:
             return
         cb = target.pytoui_mouse_moved
@@ -540,7 +647,7 @@ class BaseRuntime:
                 target,
                 x,
                 y,
-                "moved",
+                _MOVED,
                 MOUSE_LEFT_ID,
                 (x, y),
                 frozenset(),
@@ -562,7 +669,7 @@ class BaseRuntime:
                         interceptor,
                         x,
                         y,
-                        "cancelled",
+                        _CANCELLED,
                         button_id,
                         (x, y),
                         frozenset(self._held_mouse_buttons),
@@ -580,7 +687,7 @@ class BaseRuntime:
                 target,
                 x,
                 y,
-                "cancelled",
+                _CANCELLED,
                 button_id,
                 (x, y),
                 frozenset(self._held_mouse_buttons),
@@ -607,13 +714,14 @@ class BaseRuntime:
         cb = target.pytoui_mouse_wheel
         if not cb:
             return
-        local = convert_point((cursor_x, cursor_y), to_view=target)
+        ox, oy = self._view_origin(target)
+        local = (cursor_x - ox, cursor_y - oy)
         cb(
             MouseWheel(
-                location=(local.x, local.y),
-                phase="moved",
-                prev_location=(local.x, local.y),
-                timestamp=int(time.time() * 1000),
+                location=local,
+                phase=_MOVED,
+                prev_location=local,
+                timestamp=self._frame_time_ms or time.time_ns() // 1_000_000,
                 buttons=frozenset(self._held_mouse_buttons),
                 scroll_dx=dx,
                 scroll_dy=dy,
@@ -633,6 +741,7 @@ class BaseRuntime:
 
         Returns True if a command was matched and dispatched, False otherwise.
         """
+        key = key_input.lower()
         target = self._first_responder
         while target is not None:
             for cmd in target.pytoui_get_key_commands():
@@ -641,12 +750,12 @@ class BaseRuntime:
                 cmd_mods = frozenset(
                     m.strip() for m in raw_mods.split(",") if m.strip()
                 )
-                if cmd_input.lower() == key_input.lower() and cmd_mods == modifiers:
+                if cmd_input.lower() == key and cmd_mods == modifiers:
                     cb = target.pytoui_key_command
                     if cb is not None:
                         cb(cmd)
                     return True
-            target = target.superview()
+            target = target._superview
         return False
 
     # ------------------------------------------------------------------
@@ -660,19 +769,131 @@ class BaseRuntime:
 
 def get_runtime_for_view(view: _ViewInternals) -> BaseRuntime | None:
     root = view
-    while root.superview() is not None:
-        root = root.superview()  # type: ignore[assignment]
+    sv = root._superview
+    while sv is not None:
+        root = sv
+        sv = root._superview
     return _root_to_runtime.get(id(root))
 
 
 def any_dirty(view: _ViewInternals) -> bool:
-    """Return True if view or any descendant needs redrawing."""
-    if view.needsDisplay():
-        return True
-    for sv in view.subviews():
-        if any_dirty(sv):
-            return True
-    for sv in view._pytoui_internal_subviews:
-        if any_dirty(sv):
-            return True
-    return False
+    """Return True if view or any visible descendant needs redrawing.
+
+    setNeedsDisplay() bubbles the flag up through every superview, so the
+    root's own flag already answers this without walking the tree. Dirty
+    views under a hidden ancestor are not reported; unhiding marks it dirty.
+    """
+    return view._needsDisplay
+
+
+class _DamageTracker:
+    """Tracks which part of the screen a root redraw actually changed.
+
+    Damage is tracked per direct child of the root: a child that was dirty,
+    moved, resized, hid/unhid, changed alpha, appeared or disappeared since
+    the previous frame damages its old and new pixel rects.  Anything that
+    changes the root's own drawing (background, border, bounds, child
+    stacking order, a custom draw() or overlay) damages the whole frame, as
+    does the first frame after reset().
+    """
+
+    __slots__ = ("_children", "_root_state")
+
+    def __init__(self):
+        # id(child) -> (child, frame, hidden, alpha, pixel rect); None = full
+        self._children: dict[int, tuple] | None = None
+        self._root_state: tuple | None = None
+
+    def reset(self) -> None:
+        """Force the next damage() call to report the whole frame."""
+        self._children = None
+
+    @staticmethod
+    def dirty_children(root: _ViewInternals) -> list[_ViewInternals]:
+        """Root children flagged for redraw; call before rendering, which
+        clears the flags."""
+        return [
+            sv
+            for sv in (*root._pytoui_internal_subviews, *root._subviews)
+            if sv._needsDisplay
+        ]
+
+    def damage(
+        self,
+        root: _ViewInternals,
+        dirty: list[_ViewInternals],
+        width: int,
+        height: int,
+        scale: float = 1.0,
+    ) -> tuple[int, int, int, int] | None:
+        """Return the (x, y, w, h) pixel rect changed by the frame just
+        rendered, clamped to width x height, or None if nothing changed."""
+        root_state = (
+            root._frame,
+            root._bounds,
+            root._backgroundColor,
+            root._alpha,
+            root._border_width,
+            root._border_color,
+            root._corner_radius,
+            root._isHidden,
+        )
+        prev = self._children
+        full = (
+            prev is None
+            or root_state != self._root_state
+            or root._pytoui_draw_overlay is not None
+            or callable(getattr(root._ref, "draw", None))
+        )
+        self._root_state = root_state
+
+        bx, by = root._bounds.x, root._bounds.y
+        children: dict[int, tuple] = {}
+        rects: list[tuple[int, int, int, int]] = []
+        dirty_ids = {id(sv) for sv in dirty}
+        for sv in (*root._pytoui_internal_subviews, *root._subviews):
+            sf = sv._frame
+            key = id(sv)
+            old = prev.get(key) if prev is not None else None
+            if (
+                old is not None
+                and old[1] is sf
+                and old[2] == sv._isHidden
+                and old[3] == sv._alpha
+            ):
+                children[key] = old
+                if key in dirty_ids:
+                    rects.append(old[4])
+                continue
+            rect = (
+                int((sf.x - bx) * scale),
+                int((sf.y - by) * scale),
+                max(1, int(sf.w * scale)),
+                max(1, int(sf.h * scale)),
+            )
+            children[key] = (sv, sf, sv._isHidden, sv._alpha, rect)
+            rects.append(rect)
+            if old is not None:
+                rects.append(old[4])
+        if prev is not None:
+            rects.extend(old[4] for key, old in prev.items() if key not in children)
+            # bring_to_front()/send_to_back() only dirty the root, so a
+            # restack shows up as the surviving children changing order
+            # (both dicts are built in stacking order).
+            if not full and [k for k in children if k in prev] != [
+                k for k in prev if k in children
+            ]:
+                full = True
+        self._children = children
+
+        if full:
+            return (0, 0, width, height)
+        if not rects:
+            return None
+        x0 = max(0, min(r[0] for r in rects))
+        y0 = max(0, min(r[1] for r in rects))
+        x1 = min(width, max(r[0] + r[2] for r in rects))
+        y1 = min(height, max(r[1] + r[3] for r in rects))
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
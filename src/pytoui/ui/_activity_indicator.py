@@ -22,6 +22,52 @@ if TYPE_CHECKING:
 
 __all__ = ("ActivityIndicator",)
 
+_NUM_LINES = 12
+# (cos, sin) of each petal's angle; petal i points at i * 30 degrees.
+_PETAL_ROTATIONS = tuple(
+    (math.cos(a), math.sin(a))
+    for a in (i * (2.0 * math.pi / _NUM_LINES) for i in range(_NUM_LINES))
+)
+
+
+def _petal_alpha(dist: int, stepped: bool) -> float:
+    if stepped:
+        return (1.0, 0.7, 0.4)[dist] if dist < 3 else 0.2
+    return max(0.15, 1.0 - (dist * 0.7 / _NUM_LINES))
+
+
+# _PETAL_ALPHAS[stepped][anim_step][i]: alpha of petal i at anim_step, where
+# stepped is the coarse ramp used while animations are disabled.
+_PETAL_ALPHAS = tuple(
+    tuple(
+        tuple(_petal_alpha((i - step) % _NUM_LINES, stepped) for i in range(_NUM_LINES))
+        for step in range(_NUM_LINES)
+    )
+    for stepped in (False, True)
+)
+
+# One petal Path per geometry (large or not), in petal-local coordinates;
+# the per-petal CTM supplies position and angle, so the path is reused.
+_PETAL_PATHS: dict[bool, Path] = {}
+
+
+def _petal_path(large: bool) -> Path:
+    p = _PETAL_PATHS.get(large)
+    if p is None:
+        # fixed pixel geometry per style — frame size does NOT affect petal size
+        if large:
+            radius, line_len, line_width = 9.25, 9.25, 4.5
+        else:
+            radius, line_len, line_width = 4.4, 5.6, 2.0
+        p = _PETAL_PATHS[large] = Path.rounded_rect(
+            -line_width / 2,
+            -(radius + line_len),
+            line_width,
+            line_len,
+            line_width / 2,
+        )
+    return p
+
 
 @_final_
 class _ActivityIndicator(View):
@@ -93,59 +139,29 @@ class _ActivityIndicator(View):
 
     def update(self):
         if self._is_animating:
-            self._anim_step = (self._anim_step + 1) % 12
+            self._anim_step = (self._anim_step + 1) % _NUM_LINES
             self.set_needs_display()
 
     def draw(self):
         if self._hides_when_stopped and not self._is_animating:
             return
 
-        num_lines = 12
         # center within the (possibly user-resized) frame
         cx, cy = self.bounds.center()
 
-        # fixed pixel geometry per style — frame size does NOT affect petal size
-        if self._style == ACTIVITY_INDICATOR_STYLE_WHITE_LARGE:
-            radius = 9.25
-            line_len = 9.25
-            line_width = 4.5
-        else:
-            radius = 4.4
-            line_len = 5.6
-            line_width = 2.0
+        p = _petal_path(self._style == ACTIVITY_INDICATOR_STYLE_WHITE_LARGE)
 
         if self._style == ACTIVITY_INDICATOR_STYLE_GRAY:
             base_color = (0.6, 0.6, 0.6)
         else:
             base_color = (1.0, 1.0, 1.0)
 
-        for i in range(num_lines):
-            angle = i * (2.0 * math.pi / num_lines)
-            dist = (i - self._anim_step) % num_lines
-
-            if self._anim_disabled:
-                if dist == 0:
-                    alpha = 1.0
-                elif dist == 1:
-                    alpha = 0.7
-                elif dist == 2:
-                    alpha = 0.4
-                else:
-                    alpha = 0.2
-            else:
-                alpha = max(0.15, 1.0 - (dist * 0.7 / num_lines))
-
+        alphas = _PETAL_ALPHAS[bool(self._anim_disabled)][self._anim_step]
+        for (cos_a, sin_a), alpha in zip(_PETAL_ROTATIONS, alphas):
             with GState():
-                concat_ctm(Transform.translation(cx, cy))
-                concat_ctm(Transform.rotation(angle))
+                # translation(cx, cy) then rotation(angle), as one matrix
+                concat_ctm(Transform(cos_a, sin_a, -sin_a, cos_a, cx, cy))
                 set_color((*base_color, alpha))
-                p = Path.rounded_rect(
-                    -line_width / 2,
-                    -(radius + line_len),
-                    line_width,
-                    line_len,
-                    line_width / 2,
-                )
                 p.fill()
 
 
@@ -8,7 +8,7 @@ from pytoui._platform import (
 )
 from pytoui.ui._constants import ALIGN_CENTER, LB_TRUNCATE_MIDDLE
 from pytoui.ui._draw import draw_string, measure_string
-from pytoui.ui._internals import _final_
+from pytoui.ui._internals import _call_action, _final_
 from pytoui.ui._types import (
     Rect,
     Size,
@@ -23,6 +23,14 @@ if TYPE_CHECKING:
 
 __all__ = ("Button",)
 
+# Opacity lerp: each update moves 1 - 0.00005**dt of the remaining distance,
+# with dt capped at 50 ms.  Tabulated per millisecond of dt.
+_LERP_MAX_MS = 50
+_LERP_SPEED = tuple(1.0 - 0.00005 ** (ms / 1000) for ms in range(_LERP_MAX_MS + 1))
+# Below one 8-bit alpha step the remaining change is invisible, so the
+# animation snaps to its target and stops scheduling redraws.
+_ALPHA_EPSILON = 1.0 / 256
+
 
 @_final_
 class Button(View):
@@ -58,7 +66,7 @@ class Button(View):
         self._anim_alpha = 1.0
         self._target_alpha = 1.0
         self._tracked = False
-        self._last_time = time.time()
+        self._last_time = time.monotonic()
         # overridable
         self._anim_disabled = _UI_DISABLE_ANIMATIONS
 
@@ -96,7 +104,7 @@ class Button(View):
         if self._anim_disabled:
             self._anim_alpha = self._target_alpha
         else:
-            self._last_time = time.time()
+            self._last_time = time.monotonic()
             self.update_interval = 1.0 / 60.0
         self.set_needs_display()
 
@@ -110,8 +118,8 @@ class Button(View):
         self.set_needs_display()
 
     def update(self):
-        now = time.time()
-        dt = min(now - self._last_time, 0.05)
+        now = time.monotonic()
+        dt_ms = min(int((now - self._last_time) * 1000), _LERP_MAX_MS)
         self._last_time = now
 
         # --- ANIMATION ---
@@ -121,18 +129,18 @@ class Button(View):
             self.set_needs_display()
             return
 
-        lerp_speed = 1.0 - (0.00005**dt)
         diff = self._target_alpha - self._anim_alpha
 
-        if abs(diff) > 0.001:
-            self._anim_alpha += diff * lerp_speed
+        if abs(diff) > _ALPHA_EPSILON:
+            self._anim_alpha += diff * _LERP_SPEED[dt_ms]
             self.set_needs_display()
         else:
-            self._anim_alpha = self._target_alpha
-
-            if not self._tracked:
-                self.update_interval = 0
-            self.set_needs_display()
+            # Converged: stop ticking even while tracked; touch_moved()
+            # restarts the interval when the target changes.
+            self.update_interval = 0
+            if diff:
+                self._anim_alpha = self._target_alpha
+                self.set_needs_display()
 
     def draw(self):
         if not self._title:
@@ -182,7 +190,7 @@ class Button(View):
         if not self.enabled:
             return
         self._tracked = True
-        self._last_time = time.time()
+        self._last_time = time.monotonic()
         # In iOS, the button becomes semi-transparent immediately upon touch
         self._target_alpha = 0.25
         if self._anim_disabled:
@@ -204,7 +212,7 @@ class Button(View):
             if new_target != self._target_alpha:
                 self._target_alpha = new_target
                 if self.update_interval == 0 and not self._anim_disabled:
-                    self._last_time = time.time()
+                    self._last_time = time.monotonic()
                     self.update_interval = 1.0 / 60.0
                 self.set_needs_display()
 
@@ -222,18 +230,12 @@ class Button(View):
                 self._ensure_action_and_call(self)  # type: ignore[attr-defined]
 
             if not self._anim_disabled:
-                self._last_time = time.time()
+                self._last_time = time.monotonic()
                 self.update_interval = 1.0 / 60.0
             self.set_needs_display()
         self._tracked = False
 
     def _ensure_action_and_call(self, sender=None):
-        action = getattr(self, "action", None)
-        if action is None:
-            return
-        import inspect
-
-        if len(inspect.signature(action).parameters) > 0:
-            action(sender if sender is not None else self)
-        else:
-            action()
+        _call_action(
+            getattr(self, "action", None), sender if sender is not None else self
+        )
@@ -26,7 +26,7 @@ from pytoui.ui._draw import (
     measure_string,
     set_color,
 )
-from pytoui.ui._internals import _final_, get_ui_style
+from pytoui.ui._internals import _call_action, _final_, get_ui_style
 from pytoui.ui._types import Touch
 from pytoui.ui._view import View
 
@@ -1343,15 +1343,9 @@ class _DatePicker(View):
         self._ensure_action_and_call(self)
 
     def _ensure_action_and_call(self, sender=None):
-        action = getattr(self, "action", None)
-        if action is None:
-            return
-        import inspect
-
-        if len(inspect.signature(action).parameters) > 0:
-            action(sender if sender is not None else self)
-        else:
-            action()
+        _call_action(
+            getattr(self, "action", None), sender if sender is not None else self
+        )
 
     # ── popup helpers ─────────────────────────────────────────────────────────
 
@@ -275,8 +275,6 @@ class Image:
         if self._data is None:
             return
 
-        import ctypes
-
         from pytoui.ui._draw import _get_draw_ctx
 
         ctx = _get_draw_ctx()
@@ -315,11 +313,10 @@ class Image:
         dst_w = int(dw * scale)
         dst_h = int(dh * scale)
 
-        buf = (ctypes.c_ubyte * len(self._data)).from_buffer_copy(self._data)
         if dst_w == pw and dst_h == ph:
-            fb.blit(buf, pw, ph, dst_x, dst_y, blend=True)
+            fb.blit(self._data, pw, ph, dst_x, dst_y, blend=True)
         else:
-            fb.blit_scaled(buf, pw, ph, dst_x, dst_y, dst_w, dst_h, blend=True)
+            fb.blit_scaled(self._data, pw, ph, dst_x, dst_y, dst_w, dst_h, blend=True)
 
     def clip_to_mask(self, x: float, y: float, width: float, height: float) -> None:
         """Use the image as a mask for following drawing operations.
@@ -1509,14 +1506,24 @@ def _screen_origin(view) -> tuple[float, float]:
     """Compute view's content origin in screen coordinates.
 
     Walks the superview chain: each ancestor contributes frame.xy - bounds.xy.
+    The walk reads the internals' slots directly so no public ``superview``
+    wrappers or property round-trips are created per ancestor.
     """
-    x = view.frame.x
-    y = view.frame.y
-    sv = view.superview
+    return _internals_origin(view._internals_)
+
+
+def _internals_origin(iv) -> tuple[float, float]:
+    """_screen_origin() for a _ViewInternals, for callers that already hold one."""
+    frame = iv._frame
+    x = frame.x
+    y = frame.y
+    sv = iv._superview
     while sv is not None:
-        x += sv.frame.x - sv.bounds.x
-        y += sv.frame.y - sv.bounds.y
-        sv = sv.superview
+        frame = sv._frame
+        bounds = sv._bounds
+        x += frame.x - bounds.x
+        y += frame.y - bounds.y
+        sv = sv._superview
     return x, y
 
 
@@ -1565,7 +1572,9 @@ def convert_rect(
 class Path:
     """Pythonista-compatible Path backed by a Rust handle (osdbuf PathXxx FFI).
 
-    Segments are stored in Rust; fill/stroke delegate directly to PathFill/PathStroke.
+    Segments are staged in a packed PathBuilder buffer and pushed into the Rust
+    path with one PathAppendCommands call before the path is used (fill, stroke,
+    clip, bounds, hit-test, append). fill/stroke delegate to PathFill/PathStroke.
     """
 
     def __init__(self):
@@ -1573,7 +1582,10 @@ class Path:
         if not backend:
             raise RuntimeError("Invalid backend")
 
+        from pytoui._osdbuf import PathBuilder
+
         self._handle = type(backend).create_path()
+        self._pending = PathBuilder()
         self._line_width: float = 1.0
         self._line_join_style: _LineJoinMode = LINE_JOIN_MITER
         self._line_cap_style: _LineCapStyle = LINE_CAP_BUTT
@@ -1654,10 +1666,22 @@ class Path:
         if not backend:
             raise RuntimeError("Invalid backend")
 
+        self._flush()
         return Rect(*type(backend).path_get_bounds(self._handle))
 
     # -- Class method constructors --------------------------------------------
 
+    def _adopt_handle(self, backend, make, *args) -> None:
+        """Replace the empty native path from __init__ with a prebuilt shape,
+        freeing the empty one instead of leaking it."""
+        empty = self._handle
+        try:
+            self._handle = make(*args)
+        except RuntimeError:
+            self._handle = 0
+        type(backend).destroy_path(empty)
+        self._has_segments = True
+
     @classmethod
     def rect(cls, x: float, y: float, w: float, h: float) -> Path:
         backend = _get_draw_ctx().backend
@@ -1665,11 +1689,7 @@ class Path:
             raise RuntimeError("Invalid backend")
 
         p = cls()
-        try:
-            p._handle = type(backend).path_rect(x, y, w, h)
-        except RuntimeError:
-            p._handle = 0
-        p._has_segments = True
+        p._adopt_handle(backend, type(backend).path_rect, x, y, w, h)
         return p
 
     @classmethod
@@ -1679,11 +1699,7 @@ class Path:
             raise RuntimeError("Invalid backend")
 
         p = cls()
-        try:
-            p._handle = type(backend).path_oval(x, y, w, h)
-        except RuntimeError:
-            p._handle = 0
-        p._has_segments = True
+        p._adopt_handle(backend, type(backend).path_oval, x, y, w, h)
         return p
 
     @classmethod
@@ -1693,29 +1709,17 @@ class Path:
             raise RuntimeError("Invalid backend")
 
         p = cls()
-        try:
-            p._handle = type(backend).path_rounded_rect(x, y, w, h, r)
-        except RuntimeError:
-            p._handle = 0
-        p._has_segments = True
+        p._adopt_handle(backend, type(backend).path_rounded_rect, x, y, w, h, r)
         return p
 
     # -- Instance path construction -------------------------------------------
 
     def move_to(self, x: float, y: float) -> None:
-        backend = _get_draw_ctx().backend
-        if not backend:
-            raise RuntimeError("Invalid backend")
-
-        type(backend).path_move_to(self._handle, x, y)
+        self._pending.move_to(x, y)
         self._has_segments = True
 
     def line_to(self, x: float, y: float) -> None:
-        backend = _get_draw_ctx().backend
-        if not backend:
-            raise RuntimeError("Invalid backend")
-
-        type(backend).path_line_to(self._handle, x, y)
+        self._pending.line_to(x, y)
         self._has_segments = True
 
     def add_arc(
@@ -1727,11 +1731,7 @@ class Path:
         end: float,
         clockwise: bool = True,
     ) -> None:
-        backend = _get_draw_ctx().backend
-        if not backend:
-            raise RuntimeError("Invalid backend")
-
-        type(backend).path_add_arc(self._handle, cx, cy, r, start, end, clockwise)
+        self._pending.add_arc(cx, cy, r, start, end, clockwise)
         self._has_segments = True
 
     def add_curve(
@@ -1746,19 +1746,7 @@ class Path:
         """Append a cubic Bézier curve.  Argument order matches Pythonista:
         end point first, then the two control points.
         """
-        backend = _get_draw_ctx().backend
-        if not backend:
-            raise RuntimeError("Invalid backend")
-
-        type(backend).path_add_curve(
-            self._handle,
-            end_x,
-            end_y,
-            cp1_x,
-            cp1_y,
-            cp2_x,
-            cp2_y,
-        )
+        self._pending.add_curve(end_x, end_y, cp1_x, cp1_y, cp2_x, cp2_y)
         self._has_segments = True
 
     def add_quad_curve(
@@ -1767,19 +1755,11 @@ class Path:
         """Append a quadratic Bézier curve.  Argument order matches Pythonista:
         end point first, then the control point.
         """
-        backend = _get_draw_ctx().backend
-        if not backend:
-            raise RuntimeError("Invalid backend")
-
-        type(backend).path_add_quad_curve(self._handle, end_x, end_y, cp_x, cp_y)
+        self._pending.add_quad_curve(end_x, end_y, cp_x, cp_y)
         self._has_segments = True
 
     def close(self) -> None:
-        backend = _get_draw_ctx().backend
-        if not backend:
-            raise RuntimeError("Invalid backend")
-
-        type(backend).path_close(self._handle)
+        self._pending.close()
 
     def append_path(self, other: Path) -> None:
         """Append all segments of other into this path."""
@@ -1787,6 +1767,8 @@ class Path:
         if not backend:
             raise RuntimeError("Invalid backend")
 
+        self._flush()
+        other._flush()
         type(backend).path_append_path(self._handle, other._handle)
         self._has_segments = True
 
@@ -1804,8 +1786,17 @@ class Path:
         if not backend:
             raise RuntimeError("Invalid backend")
 
+        self._flush()
         return type(backend).path_hit_test(self._handle, x, y)
 
+    def _flush(self) -> None:
+        """Push staged segments into the Rust path in one native call."""
+        pending = self._pending
+        if pending:
+            if self._handle > 0:
+                pending.build(self._handle)
+            pending.clear()
+
     # -- Drawing --------------------------------------------------------------
 
     def fill(self) -> None:
@@ -1818,6 +1809,7 @@ class Path:
         if ctx.alpha != 1.0:
             color = (color[0], color[1], color[2], color[3] * ctx.alpha)
         c = _rgba_to_uint32(color)
+        self._flush()
         fb.path_fill(self._handle, c, ctx.blend_mode)  # type: ignore[arg-type]
 
     def stroke(self) -> None:
@@ -1830,6 +1822,7 @@ class Path:
         if ctx.alpha != 1.0:
             color = (color[0], color[1], color[2], color[3] * ctx.alpha)
         c = _rgba_to_uint32(color)
+        self._flush()
         fb.path_stroke(self._handle, c, ctx.blend_mode)  # type: ignore[arg-type]
 
     def add_clip(self) -> None:
@@ -1839,6 +1832,7 @@ class Path:
         fb = ctx.backend
         if fb is None or self._handle <= 0:
             return
+        self._flush()
         fb.path_add_clip(self._handle)
 
     # -- Utility --------------------------------------------------------------
@@ -1895,7 +1889,7 @@ def _get_anim_ctx() -> _AnimatingContext:
 
 def delay(func: Callable, seconds: float) -> None:
     """Call func after the given number of seconds."""
-    _get_anim_ctx().pending_delays.append((time.time() + seconds, func))
+    _get_anim_ctx().pending_delays.append((time.monotonic() + seconds, func))
 
 
 def cancel_delays() -> None:
@@ -2054,7 +2048,7 @@ def _tick(now: float | None = None) -> None:
     if not ctx.active:
         return
     if now is None:
-        now = time.time()
+        now = time.monotonic()
     snapshot = ctx.active
     ctx.active = []  # completions can append safely
     remaining = [a for a in snapshot if not a.tick(now)]
@@ -2103,7 +2097,7 @@ def animate(
             completion()
         return
 
-    start_t = time.time() + delay
+    start_t = time.monotonic() + delay
     n = len(records)
     remaining = [n]
 
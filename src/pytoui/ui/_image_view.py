@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import ctypes
 from typing import TYPE_CHECKING
 from urllib.request import urlopen
 
@@ -178,11 +177,10 @@ class _ImageView(View):
                 raw[i + 3] = int(img_a * ta * 255)
             pixel_data = bytes(raw)
 
-        buf = (ctypes.c_ubyte * len(pixel_data)).from_buffer_copy(pixel_data)
         if dst_w == iw and dst_h == ih:
-            fb.blit(buf, iw, ih, dst_x, dst_y, blend=True)
+            fb.blit(pixel_data, iw, ih, dst_x, dst_y, blend=True)
         else:
-            fb.blit_scaled(buf, iw, ih, dst_x, dst_y, dst_w, dst_h, blend=True)
+            fb.blit_scaled(pixel_data, iw, ih, dst_x, dst_y, dst_w, dst_h, blend=True)
 
 
 if not IS_PYTHONISTA:
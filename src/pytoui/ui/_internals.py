@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import inspect
 import os
+from types import CodeType
 from typing import (
     Any,
     Callable,
@@ -14,6 +16,7 @@ from typing import (
 from pytoui._platform import IS_PYTHONISTA
 
 __all__ = (
+    "_call_action",
     "_final_",
     "_getset_descriptor",
     "_get_system_tint",
@@ -86,6 +89,47 @@ class _getset_descriptor(Generic[__ClassT, __PropT]):
         raise AttributeError(f"Can't delete {self._public_name} attribute")
 
 
+# (code object, is bound method) -> whether the action takes a sender.  Keyed
+# by code rather than function so closures and lambdas are not kept alive.
+_ACTION_TAKES_SENDER: dict[tuple[CodeType, bool], bool] = {}
+
+
+def _action_takes_sender(action: Callable) -> bool:
+    """True if *action* declares any parameter (the sender), as in
+    ``len(inspect.signature(action).parameters) > 0``.
+
+    Plain functions and bound methods are answered from their code object,
+    once per code object; other or decorated callables fall back to
+    inspect.signature().
+    """
+    func = getattr(action, "__func__", action)
+    code = getattr(func, "__code__", None)
+    # inspect.signature() follows __wrapped__ (functools.wraps decorators),
+    # which the wrapper's own code object does not describe.
+    if not isinstance(code, CodeType) or hasattr(func, "__wrapped__"):
+        return len(inspect.signature(action).parameters) > 0
+    key = (code, func is not action)
+    takes = _ACTION_TAKES_SENDER.get(key)
+    if takes is None:
+        n = code.co_argcount + code.co_kwonlyargcount
+        n += bool(code.co_flags & inspect.CO_VARARGS)
+        n += bool(code.co_flags & inspect.CO_VARKEYWORDS)
+        if func is not action:
+            n -= 1  # bound self
+        takes = _ACTION_TAKES_SENDER[key] = n > 0
+    return takes
+
+
+def _call_action(action: Callable | None, sender: Any) -> None:
+    """Invoke a control's action, passing *sender* only if it takes one."""
+    if action is None:
+        return
+    if _action_takes_sender(action):
+        action(sender)
+    else:
+        action()
+
+
 def settrace(func: Callable | None) -> None:
     # FIXME: implement
     if __debug__:
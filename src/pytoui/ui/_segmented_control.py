@@ -10,7 +10,7 @@ from pytoui._platform import (
 )
 from pytoui.ui._constants import ALIGN_CENTER, LB_TRUNCATE_TAIL
 from pytoui.ui._draw import Path, draw_string, measure_string, set_color
-from pytoui.ui._internals import _final_
+from pytoui.ui._internals import _call_action, _final_
 from pytoui.ui._types import Rect
 from pytoui.ui._view import View
 
@@ -335,12 +335,6 @@ class SegmentedControl(View):
         self.set_needs_display()
 
     def _ensure_action_and_call(self, sender=None):
-        action = getattr(self, "action", None)
-        if action is None:
-            return
-        import inspect
-
-        if len(inspect.signature(action).parameters) > 0:
-            action(sender if sender is not None else self)
-        else:
-            action()
+        _call_action(
+            getattr(self, "action", None), sender if sender is not None else self
+        )
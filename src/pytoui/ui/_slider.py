@@ -8,7 +8,7 @@ from pytoui._platform import (
     IS_PYTHONISTA,
 )
 from pytoui.ui._draw import Path, set_color
-from pytoui.ui._internals import _final_
+from pytoui.ui._internals import _call_action, _final_
 from pytoui.ui._types import Rect
 from pytoui.ui._view import View
 
@@ -275,12 +275,6 @@ class Slider(View):
         return oy <= y <= oy + h
 
     def _ensure_action_and_call(self, sender=None):
-        action = getattr(self, "action", None)
-        if action is None:
-            return
-        import inspect
-
-        if len(inspect.signature(action).parameters) > 0:
-            action(sender if sender is not None else self)
-        else:
-            action()
+        _call_action(
+            getattr(self, "action", None), sender if sender is not None else self
+        )
@@ -7,7 +7,7 @@ from pytoui._platform import (
     _UI_DISABLE_ANIMATIONS,
 )
 from pytoui.ui._draw import Path, parse_color, set_color
-from pytoui.ui._internals import _final_
+from pytoui.ui._internals import _call_action, _final_
 from pytoui.ui._types import Rect, Touch
 from pytoui.ui._view import View
 
@@ -63,7 +63,7 @@ class Switch(View):
 
         self._press_start_time = 0.0
         self._current_stretch = 0.0
-        self._last_time = time.time()
+        self._last_time = time.monotonic()
         self._tracked_value: bool = False
 
         self.tint_color = (
@@ -105,13 +105,13 @@ class Switch(View):
             if self._anim_disabled:
                 self._anim_progress = self._target_progress
             else:
-                self._last_time = time.time()
+                self._last_time = time.monotonic()
                 self.update_interval = 1.0 / 60.0
             self.set_needs_display()
 
     def update(self):
         """Animation tick — driven by update_interval."""
-        now = time.time()
+        now = time.monotonic()
         dt = min(now - self._last_time, 0.05)
         self._last_time = now
 
@@ -227,8 +227,8 @@ class Switch(View):
         self._tracked = True
         self._tracked_value = self._value
         self._did_change_during_move = False
-        self._press_start_time = time.time()
-        self._last_time = time.time()
+        self._press_start_time = time.monotonic()
+        self._last_time = time.monotonic()
 
         if not self._anim_disabled:
             self.update_interval = 1.0 / 60.0
@@ -267,7 +267,7 @@ class Switch(View):
 
         # Continue animating stretch retraction if needed
         if self._current_stretch > 0.01 and not self._anim_disabled:
-            self._last_time = time.time()
+            self._last_time = time.monotonic()
             self.update_interval = 1.0 / 60.0
         self.set_needs_display()
 
@@ -279,12 +279,6 @@ class Switch(View):
         return ox <= x <= ox + w and oy <= y <= oy + h
 
     def _ensure_action_and_call(self, sender=None):
-        action = getattr(self, "action", None)
-        if action is None:
-            return
-        import inspect
-
-        if len(inspect.signature(action).parameters) > 0:
-            action(sender if sender is not None else self)
-        else:
-            action()
+        _call_action(
+            getattr(self, "action", None), sender if sender is not None else self
+        )
@@ -640,6 +640,31 @@ class Touch:
         self._timestamp = timestamp
         self._touch_id = touch_id
 
+    @classmethod
+    def _at(
+        cls,
+        x: float,
+        y: float,
+        prev_x: float,
+        prev_y: float,
+        phase: _TouchPhase,
+        timestamp: int,
+        touch_id: int,
+    ) -> Touch:
+        """Runtime fast path: build from plain floats, skipping __init__ and
+        the Point constructor's immutability guard.
+
+        Touches stay immutable and distinct per event (handlers may keep them),
+        so they are not pooled; this only trims the per-event construction.
+        """
+        t = _new(cls)
+        _set_location(t, _point(x, y))
+        _set_phase(t, phase)
+        _set_prev_location(t, _point(prev_x, prev_y))
+        _set_timestamp(t, timestamp)
+        _set_touch_id(t, touch_id)
+        return t
+
     @property
     def location(self) -> Point:
         return self._location
@@ -673,6 +698,24 @@ class Touch:
         return self.__repr__()
 
 
+_new = object.__new__
+_set_vx = Vector2._x.__set__  # type: ignore[attr-defined]
+_set_vy = Vector2._y.__set__  # type: ignore[attr-defined]
+_set_location = Touch._location.__set__  # type: ignore[attr-defined]
+_set_phase = Touch._phase.__set__  # type: ignore[attr-defined]
+_set_prev_location = Touch._prev_location.__set__  # type: ignore[attr-defined]
+_set_timestamp = Touch._timestamp.__set__  # type: ignore[attr-defined]
+_set_touch_id = Touch._touch_id.__set__  # type: ignore[attr-defined]
+
+
+def _point(x: float, y: float) -> Point:
+    """Point(x, y) through the slot descriptors, bypassing __setattr__."""
+    p = _new(Point)
+    _set_vx(p, float(x))
+    _set_vy(p, float(y))
+    return p
+
+
 from pytoui.hid import MOUSE_SCROLL_ID
 
 
@@ -688,7 +731,7 @@ class MouseEvent(Touch):
                  (any of MOUSE_LEFT_ID, MOUSE_RIGHT_ID, MOUSE_MIDDLE_ID)
     """
 
-    __slots__ = (*Touch.__slots__, "buttons")
+    __slots__ = ("buttons",)
 
     def __init__(
         self,
@@ -714,7 +757,7 @@ class MouseWheel(MouseEvent):
         buttons:   frozenset of currently held mouse button IDs
     """
 
-    __slots__ = (*MouseEvent.__slots__, "scroll_dx", "scroll_dy")
+    __slots__ = ("scroll_dx", "scroll_dy")
 
     def __init__(
         self,
@@ -6,6 +6,7 @@ from threading import Event
 from typing import (
     TYPE_CHECKING,
     Callable,
+    ClassVar,
     cast,
 )
 from uuid import uuid4
@@ -22,8 +23,8 @@ from pytoui.ui._draw import (
     Transform,
     _content_mode_transform,
     _get_draw_ctx,
+    _internals_origin,
     _record,
-    _screen_origin,
     _set_origin,
     _sync_ctm_to_rust,
     fill_rect,
@@ -178,8 +179,18 @@ class _ViewInternals:
         "_pytoui_internal_subviews",
         "_pytoui_draw_overlay",
         "_pytoui_layer",  # per-view owned FrameBuffer (None = not yet created)
+        "_pytoui_timed_views",  # (tree gen, pre-order timed descendants)
     )
 
+    # Bumped (on _ViewInternals itself) whenever any view's frame, bounds,
+    # superview, stacking order or hidden flag changes, so cached screen
+    # origins and hit results can be checked with one integer compare
+    # instead of re-walking the tree.
+    _pytoui_geometry_gen: ClassVar[int] = 0
+    # Bumped whenever any view is added, removed or restacked, or its
+    # update_interval turns on or off; see _pytoui_timed_subtree().
+    _pytoui_tree_gen: ClassVar[int] = 0
+
     def __init__(self, view: _View):
         self._ref: _View = view
         self._alpha: float = 1.0
@@ -223,6 +234,7 @@ class _ViewInternals:
         self._pytoui_internal_subviews: list[_ViewInternals] = []
         self._pytoui_draw_overlay: Callable[[], None] | None = None
         self._pytoui_layer: _FrameBuffer | None = None
+        self._pytoui_timed_views: tuple[int, list[_ViewInternals]] | None = None
 
     @property
     def ref(self) -> _View:
@@ -338,8 +350,24 @@ class _ViewInternals:
         """Determines if the view is hidden."""
         return self._isHidden
 
+    def isOpaque(self) -> bool:
+        """Whether drawing the view covers every pixel of its frame.
+
+        True for a visible, fully opaque view with a fully opaque
+        background and square corners.
+        """
+        return (
+            not self._isHidden
+            and self._alpha >= 1.0
+            and self._backgroundColor[3] >= 1.0
+            and self._corner_radius <= 0.0
+        )
+
     def setHidden_(self, value: bool):
-        self._isHidden = bool(value)
+        value = bool(value)
+        if value != self._isHidden:
+            _ViewInternals._pytoui_geometry_gen += 1
+        self._isHidden = value
         self.setNeedsDisplay()
 
     def name(self) -> str:
@@ -437,6 +465,7 @@ class _ViewInternals:
             return
         old_w, old_h = old_frame.size
         self._frame = new_frame
+        _ViewInternals._pytoui_geometry_gen += 1
         new_w, new_h = new_frame.size
         if new_w != old_w or new_h != old_h:
             self._bounds = Rect(self._bounds.x, self._bounds.y, new_w, new_h)
@@ -453,6 +482,7 @@ class _ViewInternals:
         new_bounds = Rect(*value)
         old_w, old_h = self._bounds.size
         self._bounds = new_bounds
+        _ViewInternals._pytoui_geometry_gen += 1
         new_w, new_h = new_bounds.size
         if new_w != old_w or new_h != old_h:
             self._frame = Rect(self._frame.x, self._frame.y, new_w, new_h)
@@ -493,9 +523,11 @@ class _ViewInternals:
 
     @update_interval.setter
     def update_interval(self, value: float):
+        if (value > 0.0) != (self._update_interval > 0.0):
+            _ViewInternals._pytoui_tree_gen += 1
         self._update_interval = float(value)
         if value > 0.0:
-            self.pytoui_last_update_time = time.time()
+            self.pytoui_last_update_time = time.monotonic()
 
     @property
     def pytoui_touch_began(self) -> Callable[[Touch], None] | None:
@@ -591,34 +623,65 @@ class _ViewInternals:
         for sv in self._pytoui_internal_subviews:
             self._apply_autoresizing_to_view(sv, dw, dh)
 
-    def pytoui_hit_test(self, x: float, y: float) -> _ViewInternals | None:
+    def _pytoui_hit_origin(
+        self, origin: tuple[float, float] | None
+    ) -> tuple[float, float]:
+        """Screen origin of this view for hit-testing.
+
+        *origin* is the screen position of the superview's content origin
+        (its screen origin minus its bounds offset), passed down by the
+        parent so a hit-test never re-walks the superview chain per node.
+        """
+        if origin is None:
+            return _internals_origin(self)
+        f = self._frame
+        return origin[0] + f.x, origin[1] + f.y
+
+    def pytoui_hit_test(
+        self, x: float, y: float, origin: tuple[float, float] | None = None
+    ) -> _ViewInternals | None:
         """Recursively searches for the highest Z-index View
         that supports touch at the specified coordinates.
         """
         if self._isHidden:
             return None
-        ox, oy = _screen_origin(self._ref)
-        fw, fh = self._frame.size
-        if not (ox <= x < ox + fw and oy <= y < oy + fh):
+        ox, oy = self._pytoui_hit_origin(origin)
+        f = self._frame
+        if not (ox <= x < ox + f.w and oy <= y < oy + f.h):
             return None
+        b = self._bounds
+        ix, iy = ox - b.x, oy - b.y
+        inner = (ix, iy)
+        # Children are rejected on their frame here (same arithmetic as the
+        # check above), before paying for a recursive call that returns None.
 
         # 1. Overlay has not hit-test
 
         # 2. Public subviews
         for child in reversed(self._subviews):
-            target = child.pytoui_hit_test(x, y)
+            cf = child._frame
+            cx, cy = ix + cf.x, iy + cf.y
+            if not (cx <= x < cx + cf.w and cy <= y < cy + cf.h):
+                continue
+            target = child.pytoui_hit_test(x, y, inner)
             if target is not None and target._touch_enabled:
                 return target
 
         # 3. Internal subviews
         for child in reversed(self._pytoui_internal_subviews):
-            target = child.pytoui_hit_test(x, y)
+            cf = child._frame
+            cx, cy = ix + cf.x, iy + cf.y
+            if not (cx <= x < cx + cf.w and cy <= y < cy + cf.h):
+                continue
+            target = child.pytoui_hit_test(x, y, inner)
             if target and target._touch_enabled:
                 return target
 
         return self if self._touch_enabled else None
 
-    def pytoui_scroll_hit_test(self, x: float, y: float) -> _ViewInternals | None:
+    def pytoui_scroll_hit_test(
+        self, x: float, y: float, origin: tuple[float, float] | None = None
+    ) -> _ViewInternals | None:
         """Like pytoui_hit_test but filters by mouse_wheel_enabled.
 
         A view with scroll_enabled=False is transparent to scroll events
@@ -626,16 +689,18 @@ class _ViewInternals:
         """
         if self._isHidden:
             return None
-        ox, oy = _screen_origin(self._ref)
+        ox, oy = self._pytoui_hit_origin(origin)
         fw, fh = self._frame.size
         if not (ox <= x < ox + fw and oy <= y < oy + fh):
             return None
+        b = self._bounds
+        inner = (ox - b.x, oy - b.y)
 
         # 1. Overlay has not hit-test
 
         # 2. Public subviews
         for child in reversed(self._subviews):
-            target = child.pytoui_scroll_hit_test(x, y)
+            target = child.pytoui_scroll_hit_test(x, y, inner)
             if target is not None and getattr(
                 target, "_pytoui_mouse_wheel_enabled", False
             ):
@@ -651,7 +716,7 @@ class _ViewInternals:
 
         # 3. Internal subviews
         for child in reversed(self._pytoui_internal_subviews):
-            target = child.pytoui_scroll_hit_test(x, y)
+            target = child.pytoui_scroll_hit_test(x, y, inner)
             if target is not None and getattr(
                 target, "_pytoui_mouse_wheel_enabled", False
             ):
@@ -670,12 +735,15 @@ class _ViewInternals:
     # ── rendering ─────────────────────────────────────────────────────────────
 
     def _clear_dirty_tree(self) -> None:
-        """Recursively clear needs_display without rendering (used for culled views)."""
-        self._needsDisplay = False
-        for sv in self._subviews:
-            sv._clear_dirty_tree()
-        for sv in self._pytoui_internal_subviews:
-            sv._clear_dirty_tree()
+        """Clear needs_display on the subtree without rendering (culled views)."""
+        stack: list[_ViewInternals] = [self]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            view = pop()
+            view._needsDisplay = False
+            push(view._subviews)
+            push(view._pytoui_internal_subviews)
 
     def _pytoui_render_self(self, fw: float, fh: float):
         cm = self._contentMode
@@ -725,27 +793,46 @@ class _ViewInternals:
             if hasattr(self._ref, "layout"):
                 self._ref.layout()
 
-    def pytoui_update_tree(self, now: float):
-        """Update this view and propagate to all subviews (public and internal)."""
-        # Update self if needed
-        if self._update_interval > 0:
-            if now - self._pytoui_last_update_time >= self._update_interval:
-                self.pytoui_update()
-                self._pytoui_last_update_time = now
+    def _pytoui_timed_subtree(self) -> list[_ViewInternals]:
+        """Views in this subtree with an update_interval, in update order.
 
-        # Update public subviews
-        for sv in self._subviews:
-            sv.pytoui_update_tree(now)
+        The pre-order is self, public subtrees, then internal subtrees.  The
+        list is rebuilt only after the tree or an interval on/off changes,
+        so frames without such changes skip the walk entirely.
+        """
+        gen = _ViewInternals._pytoui_tree_gen
+        cached = self._pytoui_timed_views
+        if cached is not None and cached[0] == gen:
+            return cached[1]
+        timed: list[_ViewInternals] = []
+        stack: list[_ViewInternals] = [self]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            view = pop()
+            if view._update_interval > 0:
+                timed.append(view)
+            if view._pytoui_internal_subviews:
+                push(reversed(view._pytoui_internal_subviews))
+            if view._subviews:
+                push(reversed(view._subviews))
+        self._pytoui_timed_views = (gen, timed)
+        return timed
 
-        # Update internal subviews
-        for sv in self._pytoui_internal_subviews:
-            sv.pytoui_update_tree(now)
+    def pytoui_update_tree(self, now: float):
+        """Update this view and propagate to all subviews (public and internal)."""
+        for view in self._pytoui_timed_subtree():
+            # Re-read: an earlier update() this frame may have changed it.
+            interval = view._update_interval
+            if interval > 0 and now - view._pytoui_last_update_time >= interval:
+                view.pytoui_update()
+                view._pytoui_last_update_time = now
 
     def pytoui_draw_snapshot(self):
         self.pytoui_layout()
         if self._isHidden:
             return
-        ox, oy = _screen_origin(self._ref)
+        ox, oy = _internals_origin(self)
         fw, fh = self._frame.size
         if fw <= 0 or fh <= 0:
             return
@@ -908,6 +995,8 @@ class _ViewInternals:
             view._superview.remove_subview(view)
         self._subviews.append(view)
         view._superview = self
+        _ViewInternals._pytoui_geometry_gen += 1
+        _ViewInternals._pytoui_tree_gen += 1
         view.setNeedsDisplay()
 
     def remove_subview(self, view: _ViewInternals):
@@ -915,6 +1004,8 @@ class _ViewInternals:
         if view in self._subviews:
             self._subviews.remove(view)
             view._superview = None
+            _ViewInternals._pytoui_geometry_gen += 1
+            _ViewInternals._pytoui_tree_gen += 1
             view.setNeedsDisplay()
 
     def pytoui_add_internal_subview(self, view: _ViewInternals):
@@ -925,6 +1016,8 @@ class _ViewInternals:
             view._superview.pytoui_remove_internal_subview(view)
         self._pytoui_internal_subviews.append(view)
         view._superview = self
+        _ViewInternals._pytoui_geometry_gen += 1
+        _ViewInternals._pytoui_tree_gen += 1
         view.setNeedsDisplay()
 
     def pytoui_remove_internal_subview(self, view: _ViewInternals):
@@ -932,6 +1025,8 @@ class _ViewInternals:
         if view in self._pytoui_internal_subviews:
             self._pytoui_internal_subviews.remove(view)
             view._superview = None
+            _ViewInternals._pytoui_geometry_gen += 1
+            _ViewInternals._pytoui_tree_gen += 1
             view.setNeedsDisplay()
 
     def bring_to_front(self):
@@ -952,6 +1047,8 @@ class _ViewInternals:
             changed = True
 
         if changed:
+            _ViewInternals._pytoui_geometry_gen += 1
+            _ViewInternals._pytoui_tree_gen += 1
             sv.setNeedsDisplay()
 
     def send_to_back(self):
@@ -972,6 +1069,8 @@ class _ViewInternals:
             changed = True
 
         if changed:
+            _ViewInternals._pytoui_geometry_gen += 1
+            _ViewInternals._pytoui_tree_gen += 1
             sv.setNeedsDisplay()
 
     def size_to_fit(self):
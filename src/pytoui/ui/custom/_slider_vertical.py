@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from pytoui._platform import _UI_DISABLE_ANIMATIONS
 from pytoui.ui._draw import Path, set_color
-from pytoui.ui._internals import _final_
+from pytoui.ui._internals import _call_action, _final_
 from pytoui.ui._types import Rect, Touch
 from pytoui.ui._view import View
 
@@ -267,12 +267,6 @@ class VerticalSlider(View):
         return ox <= x <= ox + w
 
     def _ensure_action_and_call(self, sender=None):
-        action = getattr(self, "action", None)
-        if action is None:
-            return
-        import inspect
-
-        if len(inspect.signature(action).parameters) > 0:
-            action(sender if sender is not None else self)
-        else:
-            action()
+        _call_action(
+            getattr(self, "action", None), sender if sender is not None else self
+        )
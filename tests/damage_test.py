@@ -0,0 +1,133 @@
+"""Unit tests for _DamageTracker on plain _ViewInternals trees.
+
+No runtime or native library is involved: each test builds a 200x200 root,
+primes the tracker with one frame, mutates the tree the way the public View
+API would, and checks the pixel rect damage() reports for the next frame.
+"""
+
+# pytoui.ui first: base_runtime is imported through it, as in applications.
+from pytoui.ui._view import _ViewInternals
+from pytoui.base_runtime import _DamageTracker
+
+W = H = 200
+
+
+def _view(frame=(0, 0, 100, 100)) -> _ViewInternals:
+    v = _ViewInternals(None)
+    v.setFrame_(frame)
+    return v
+
+
+def _scene():
+    root = _view((0, 0, W, H))
+    a = _view((10, 10, 50, 50))
+    b = _view((40, 40, 50, 50))
+    root.add_subview(a)
+    root.add_subview(b)
+    tracker = _DamageTracker()
+    _frame(tracker, root)
+    return tracker, root, a, b
+
+
+def _frame(tracker, root):
+    """Take damage for one frame, then clear the flags as a render would."""
+    area = tracker.damage(root, tracker.dirty_children(root), W, H)
+    root._clear_dirty_tree()
+    return area
+
+
+# ---------------------------------------------------------------------------
+# Full-frame damage
+# ---------------------------------------------------------------------------
+
+
+def test_first_frame_is_full():
+    root = _view((0, 0, W, H))
+    assert _frame(_DamageTracker(), root) == (0, 0, W, H)
+
+
+def test_reset_forces_full():
+    tracker, root, _, _ = _scene()
+    tracker.reset()
+    assert _frame(tracker, root) == (0, 0, W, H)
+
+
+def test_root_background_change_is_full():
+    tracker, root, _, _ = _scene()
+    root.setBackgroundColor_("red")
+    assert _frame(tracker, root) == (0, 0, W, H)
+
+
+def test_unchanged_is_none():
+    tracker, root, _, _ = _scene()
+    assert _frame(tracker, root) is None
+
+
+# ---------------------------------------------------------------------------
+# Per-child damage
+# ---------------------------------------------------------------------------
+
+
+def test_dirty_child_damages_its_rect():
+    tracker, root, a, _ = _scene()
+    a.setNeedsDisplay()
+    assert _frame(tracker, root) == (10, 10, 50, 50)
+
+
+def test_child_move_damages_old_and_new():
+    tracker, root, a, _ = _scene()
+    a.setFrame_((100, 120, 50, 50))
+    assert _frame(tracker, root) == (10, 10, 140, 160)
+
+
+def test_child_resize_damages_old_and_new():
+    tracker, root, a, _ = _scene()
+    a.setFrame_((10, 10, 20, 80))
+    assert _frame(tracker, root) == (10, 10, 50, 80)
+
+
+def test_child_hide_damages_its_rect():
+    tracker, root, a, _ = _scene()
+    a.setHidden_(True)
+    assert _frame(tracker, root) == (10, 10, 50, 50)
+
+
+def test_child_alpha_damages_its_rect():
+    tracker, root, _, b = _scene()
+    b.setAlpha_(0.5)
+    assert _frame(tracker, root) == (40, 40, 50, 50)
+
+
+def test_child_add_damages_its_rect():
+    tracker, root, _, _ = _scene()
+    root.add_subview(_view((150, 150, 20, 20)))
+    assert _frame(tracker, root) == (150, 150, 20, 20)
+
+
+def test_child_remove_damages_old_rect():
+    tracker, root, a, _ = _scene()
+    root.remove_subview(a)
+    assert _frame(tracker, root) == (10, 10, 50, 50)
+
+
+def test_damage_is_clamped():
+    tracker, root, a, _ = _scene()
+    a.setFrame_((180, 180, 50, 50))
+    assert _frame(tracker, root) == (10, 10, W - 10, H - 10)
+
+
+# ---------------------------------------------------------------------------
+# Stacking order
+# ---------------------------------------------------------------------------
+
+
+def test_bring_to_front_is_damage():
+    tracker, root, a, _ = _scene()
+    a.bring_to_front()
+    assert _frame(tracker, root) is not None
+
+
+def test_send_to_back_is_damage():
+    tracker, root, _, b = _scene()
+    b.send_to_back()
+    assert _frame(tracker, root) is not None